@@ -154,12 +154,16 @@ class AfterGraceContainer(Container):
             raise TypeError(f"must attach to leaf (not {leaf!r}).")
         leaf._after_grace_container = self
         self._main_leaf = leaf
+        self._clear_cached_parentage()
+        self._update_later(offsets=True)
 
     def _detach(self):
         if self._main_leaf is not None:
             main_leaf = self._main_leaf
             main_leaf._after_grace_container = None
             self._main_leaf = None
+            self._clear_cached_parentage()
+            main_leaf._clear_cached_format()
         return self
 
     def _format_open_brackets_slot(self, bundle):
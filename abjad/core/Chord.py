@@ -6,7 +6,7 @@ from abjad import pitch as abjad_pitch
 from abjad import typings
 from abjad.system.LilyPondFormatManager import LilyPondFormatManager
 from abjad.top.inspect import inspect
-from abjad.top.parse import parse
+from abjad.top.parse import _parse_leaf_string
 from abjad.utilities.Duration import Duration
 from .DrumNoteHead import DrumNoteHead
 from .Leaf import Leaf
@@ -70,10 +70,7 @@ class Chord(Leaf):
         assert len(arguments) in (0, 1, 2)
         self._note_heads = NoteHeadList(client=self)
         if len(arguments) == 1 and isinstance(arguments[0], str):
-            string = f"{{ {arguments[0]} }}"
-            parsed = parse(string)
-            assert len(parsed) == 1 and isinstance(parsed[0], Leaf)
-            arguments = tuple([parsed[0]])
+            arguments = tuple([_parse_leaf_string(arguments[0])])
         are_cautionary: typing.List[typing.Optional[bool]] = []
         are_forced: typing.List[typing.Optional[bool]] = []
         are_parenthesized: typing.List[typing.Optional[bool]] = []
@@ -126,7 +123,9 @@ class Chord(Leaf):
                 is_forced = None
             if not is_parenthesized:
                 is_parenthesized = None
-            if written_pitch not in drums:
+            if not isinstance(written_pitch, str) or (
+                written_pitch not in drums
+            ):
                 note_head = NoteHead(
                     written_pitch=written_pitch,
                     is_cautionary=is_cautionary,
@@ -9,6 +9,7 @@ from abjad import mathtools
 from abjad.indicators.StaffChange import StaffChange
 from abjad.indicators.TimeSignature import TimeSignature
 from abjad.markups import Markup
+from abjad.system.FormatCache import FormatCache
 from abjad.system.FormatSpecification import FormatSpecification
 from abjad.system.LilyPondFormatManager import LilyPondFormatManager
 from abjad.system.StorageFormatManager import StorageFormatManager
@@ -36,19 +37,25 @@ class Component(object):
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        "_format_cache",
+        "_index_in_parent",
         "_indicators_are_current",
         "_is_forbidden_to_update",
+        "_leaf_table",
         "_overrides",
         "_lilypond_setting_name_manager",
-        "_measure_number",
+        "_measure_map",
+        "_offset_prolation",
         "_offsets_are_current",
         "_offsets_in_seconds_are_current",
         "_parent",
+        "_parentage",
         "_start_offset",
         "_start_offset_in_seconds",
         "_stop_offset",
         "_stop_offset_in_seconds",
         "_tag",
+        "_tempo_map",
         "_timespan",
         "_wrappers",
     )
@@ -59,13 +66,18 @@ class Component(object):
 
     @abc.abstractmethod
     def __init__(self, name: str = None, tag: str = None) -> None:
+        self._format_cache = None
+        self._index_in_parent = None
         self._indicators_are_current = False
         self._is_forbidden_to_update = False
-        self._measure_number = None
+        self._leaf_table = None
+        self._measure_map = None
+        self._offset_prolation = None
         self._offsets_are_current = False
         self._offsets_in_seconds_are_current = False
         self._overrides = None
         self._parent = None
+        self._parentage = None
         self._lilypond_setting_name_manager = None
         self._start_offset = None
         self._start_offset_in_seconds = None
@@ -74,6 +86,7 @@ class Component(object):
         if tag is not None:
             assert isinstance(tag, str), repr(tag)
         self._tag = tag
+        self._tempo_map = None
         self._timespan = Timespan()
         self._wrappers: typing.List[Wrapper] = []
 
@@ -111,8 +124,13 @@ class Component(object):
         Formats component.
         """
         if format_specification in ("", "lilypond"):
+            cache = FormatCache._current
+            if cache is not None and self._format_cache is not None:
+                cache._hits += 1
+                return self._format_cache
             string = self._get_lilypond_format()
         else:
+            cache = None
             assert format_specification == "storage"
             string = StorageFormatManager(self).get_storage_format()
         lines = []
@@ -121,6 +139,10 @@ class Component(object):
                 line = ""
             lines.append(line)
         string = "\n".join(lines)
+        if cache is not None:
+            cache._misses += 1
+            cache._components.append(self)
+            self._format_cache = string
         return string
 
     def __getnewargs__(self):
@@ -205,6 +227,73 @@ class Component(object):
                 return True
         return False
 
+    def _clear_cached_format(self, descendants=False):
+        """
+        Clears format cached by component and by components that contain
+        component.
+
+        Components that contain cached components are never cached without
+        their contents; so skips parentage when component is not cached (and
+        when ``descendants`` is false).
+
+        Also clears format cached by components below component, including
+        grace music, when ``descendants`` is true.
+        """
+        if FormatCache._current is None:
+            return
+        # subclass initializers set properties before component initializer
+        if not hasattr(self, "_format_cache"):
+            return
+        if descendants is True or self._format_cache is not None:
+            components = list(inspect(self).parentage())
+            while components:
+                component = components.pop()
+                component._format_cache = None
+                main_leaf = getattr(component, "_main_leaf", None)
+                if main_leaf is not None:
+                    components.extend(inspect(main_leaf).parentage())
+        if descendants is not True:
+            return
+        components = [self]
+        while components:
+            component = components.pop()
+            component._format_cache = None
+            components.extend(getattr(component, "_components", ()))
+            for name in (
+                "_after_grace_container",
+                "_grace_container",
+                "_on_beat_grace_container",
+            ):
+                grace_container = getattr(component, name, None)
+                if grace_container is not None:
+                    components.append(grace_container)
+
+    def _clear_cached_leaf_table(self):
+        """
+        Clears leaf table cached at score root of component.
+        """
+        inspect(self).parentage().root._leaf_table = None
+
+    def _clear_cached_parentage(self):
+        """
+        Clears cached parentage of component and of components below
+        component, including grace music.
+
+        Components cache parentage only when every component in their
+        parentage also caches parentage; so skips containers with no cached
+        parentage.
+        """
+        components = [self]
+        while components:
+            component = components.pop()
+            if component._parentage is not None:
+                component._parentage = None
+                components.extend(getattr(component, "_components", ()))
+            for name in ("_grace_container", "_after_grace_container"):
+                grace_container = getattr(component, name, None)
+                if grace_container is not None:
+                    components.append(grace_container)
+
     def _extract(self, scale_contents=False):
         if scale_contents:
             self._scale_contents(self.multiplier)
@@ -238,25 +327,50 @@ class Component(object):
         return []
 
     def _format_component(self, pieces=False):
-        result = []
-        bundle = LilyPondFormatManager.bundle_format_contributions(self)
-        result.extend(self._format_absolute_before_slot(bundle))
-        result.extend(self._format_before_slot(bundle))
-        result.extend(self._format_open_brackets_slot(bundle))
-        result.extend(self._format_opening_slot(bundle))
-        result.extend(self._format_contents_slot(bundle))
-        result.extend(self._format_closing_slot(bundle))
-        result.extend(self._format_close_brackets_slot(bundle))
-        result.extend(self._format_after_slot(bundle))
-        result.extend(self._format_absolute_after_slot(bundle))
         contributions = []
-        for contributor, contribution in result:
-            contributions.extend(contribution)
+        self._format_component_lines(contributions, 0)
         if pieces:
             return contributions
         else:
             return "\n".join(contributions)
 
+    def _format_component_lines(self, lines, depth, inherited=None):
+        """
+        Appends format of component to ``lines``, indented ``depth`` times.
+
+        Containers append lines of contents at ``depth + 1``; so indents each
+        line once (rather than once per container).
+
+        Set ``inherited`` to indicators collected from components that contain
+        component.
+        """
+        bundle = LilyPondFormatManager.bundle_format_contributions(
+            self, inherited=inherited
+        )
+        slots = (
+            self._format_absolute_before_slot(bundle),
+            self._format_before_slot(bundle),
+            self._format_open_brackets_slot(bundle),
+            self._format_opening_slot(bundle),
+        )
+        for slot in slots:
+            for contributor, contribution in slot:
+                self._indent_format_lines(lines, contribution, depth)
+        self._format_contents_lines(bundle, lines, depth, inherited)
+        methods = (
+            self._format_closing_slot,
+            self._format_close_brackets_slot,
+            self._format_after_slot,
+            self._format_absolute_after_slot,
+        )
+        for method in methods:
+            for contributor, contribution in method(bundle):
+                self._indent_format_lines(lines, contribution, depth)
+
+    def _format_contents_lines(self, bundle, lines, depth, inherited=None):
+        for contributor, contribution in self._format_contents_slot(bundle):
+            self._indent_format_lines(lines, contribution, depth)
+
     def _format_contents_slot(self, bundle):
         return []
 
@@ -324,12 +438,23 @@ class Component(object):
             return parentage.prolation * self._get_preprolated_duration()
 
     def _get_effective(
-        self, prototype, *, attributes=None, command=None, n=0, unwrap=True
+        self,
+        prototype,
+        *,
+        attributes=None,
+        command=None,
+        exclude=None,
+        n=0,
+        unwrap=True,
     ):
         from .Context import Context
         from .Voice import Voice
 
         self._update_now(indicators=True)
+        start_offset = None
+        use_index = n == 0 and (
+            attributes is None or list(attributes) == ["command"]
+        )
         candidate_wrappers = {}
         parentage = inspect(self).parentage()
         enclosing_voice_name = None
@@ -346,6 +471,8 @@ class Component(object):
             for wrapper in component._wrappers:
                 if wrapper.annotation:
                     continue
+                if exclude and id(wrapper) in exclude:
+                    continue
                 if isinstance(wrapper.indicator, prototype):
                     append_wrapper = True
                     if (
@@ -372,9 +499,25 @@ class Component(object):
                 candidate_wrappers.setdefault(offset, []).append(wrapper)
             if not isinstance(component, Context):
                 continue
+            if use_index:
+                if start_offset is None:
+                    start_offset = inspect(self).timespan().start_offset
+                triple = component._get_effective_dependent_wrapper(
+                    prototype,
+                    start_offset,
+                    attributes=attributes,
+                    command=command,
+                    exclude=exclude,
+                )
+                if triple is not None:
+                    offset, position, wrapper = triple
+                    candidate_wrappers.setdefault(offset, []).append(wrapper)
+                continue
             for wrapper in component._dependent_wrappers:
                 if wrapper.annotation:
                     continue
+                if exclude and id(wrapper) in exclude:
+                    continue
                 if isinstance(wrapper.indicator, prototype):
                     append_wrapper = True
                     if (
@@ -393,7 +536,8 @@ class Component(object):
         if not candidate_wrappers:
             return
         all_offsets = sorted(candidate_wrappers)
-        start_offset = inspect(self).timespan().start_offset
+        if start_offset is None:
+            start_offset = inspect(self).timespan().start_offset
         index = bisect.bisect(all_offsets, start_offset) - 1 + int(n)
         if index < 0:
             return
@@ -520,6 +664,10 @@ class Component(object):
             return tuple(x for x in markup if x.direction is enums.Down)
         return markup
 
+    def _get_measure_map(self):
+        update_manager = UpdateManager()
+        return update_manager._get_measure_map(self)
+
     def _get_sibling(self, n):
         assert n in (-1, 0, 1), repr(self, n)
         if n == 0:
@@ -615,6 +763,10 @@ class Component(object):
             return candidate._after_grace_container[-1]
         return candidate
 
+    def _get_tempo_map(self):
+        update_manager = UpdateManager()
+        return update_manager._get_tempo_map(self)
+
     def _get_timespan(self, in_seconds=False):
         if in_seconds:
             self._update_now(offsets_in_seconds=True)
@@ -655,6 +807,97 @@ class Component(object):
                 break
         return component in successors
 
+    @staticmethod
+    def _indent_format_lines(lines, strings, depth):
+        """
+        Appends ``strings`` to ``lines``, indented ``depth`` times.
+
+        Splits strings into lines when ``depth`` is positive; same as
+        indenting (and normalizing) once per container.
+        """
+        if depth == 0:
+            lines.extend(strings)
+            return
+        indent = LilyPondFormatManager.indent
+        prefix = depth * indent
+        for string in strings:
+            for line in string.split("\n"):
+                if not line or line.isspace():
+                    lines.append(indent)
+                else:
+                    lines.append(prefix + line)
+
+    def _iterate_contents_contributions(self, bundle, depth=0, inherited=None):
+        for contributor, contribution in self._format_contents_slot(bundle):
+            lines = []
+            self._indent_format_lines(lines, contribution, depth)
+            yield from lines
+
+    def _iterate_format_contributions(self, depth=0, inherited=None):
+        """
+        Iterates format contributions of component, indented ``depth`` times.
+
+        Same as ``_format_component(pieces=True)`` but yields contents
+        contributions lazily; containers format children only as contributions
+        are consumed.
+        """
+        bundle = LilyPondFormatManager.bundle_format_contributions(
+            self, inherited=inherited
+        )
+        slots = (
+            self._format_absolute_before_slot(bundle),
+            self._format_before_slot(bundle),
+            self._format_open_brackets_slot(bundle),
+            self._format_opening_slot(bundle),
+        )
+        lines = []
+        for slot in slots:
+            for contributor, contribution in slot:
+                self._indent_format_lines(lines, contribution, depth)
+        yield from lines
+        yield from self._iterate_contents_contributions(
+            bundle, depth, inherited
+        )
+        methods = (
+            self._format_closing_slot,
+            self._format_close_brackets_slot,
+            self._format_after_slot,
+            self._format_absolute_after_slot,
+        )
+        for method in methods:
+            lines = []
+            for contributor, contribution in method(bundle):
+                self._indent_format_lines(lines, contribution, depth)
+            yield from lines
+
+    def _iterate_lilypond_format_pieces(self, depth=0, inherited=None):
+        """
+        Iterates LilyPond format of component one line at a time.
+
+        Joining lines with newlines gives ``format(self, 'lilypond')``.
+
+        Lines are indented ``depth`` times.
+        """
+        if FormatCache._current is not None and self._format_cache is not None:
+            FormatCache._current._hits += 1
+            if depth == 0:
+                yield from self._format_cache.split("\n")
+            else:
+                lines = []
+                self._indent_format_lines(lines, [self._format_cache], depth)
+                yield from lines
+            return
+        self._update_now(indicators=True)
+        contributions = self._iterate_format_contributions(depth, inherited)
+        if depth != 0:
+            yield from contributions
+            return
+        for contribution in contributions:
+            for line in contribution.split("\n"):
+                if line.isspace():
+                    line = ""
+                yield line
+
     def _move_indicators(self, recipient_component):
         for wrapper in inspect(self).wrappers():
             detach(wrapper, self)
@@ -670,9 +913,20 @@ class Component(object):
             for wrapper in component._dependent_wrappers[:]:
                 if wrapper.component is self:
                     component._dependent_wrappers.remove(wrapper)
+                    component._dependent_wrapper_index = None
         if self._parent is not None:
-            self._parent._components.remove(self)
+            components = self._parent._components
+            index = self._index_in_parent
+            if (
+                index is not None
+                and index < len(components)
+                and components[index] is self
+            ):
+                del components[index]
+            else:
+                components.remove(self)
         self._parent = None
+        self._clear_cached_parentage()
 
     def _remove_named_children_from_parentage(self, name_dictionary):
         if self._parent is not None and name_dictionary:
@@ -702,6 +956,7 @@ class Component(object):
         self._remove_named_children_from_parentage(named_children)
         self._remove_from_parent()
         self._parent = new_parent
+        self._clear_cached_parentage()
         self._restore_named_children_to_parentage(named_children)
         self._update_later(offsets=True)
 
@@ -717,15 +972,22 @@ class Component(object):
 
     def _update_later(self, offsets=False, offsets_in_seconds=False):
         assert offsets or offsets_in_seconds
-        for component in inspect(self).parentage():
+        if offsets:
+            self._clear_cached_format(descendants=True)
+        parentage = inspect(self).parentage()
+        for component in parentage:
+            component._leaf_table = None
+            component._tempo_map = None
             if offsets:
+                component._measure_map = None
                 component._offsets_are_current = False
             elif offsets_in_seconds:
                 component._offsets_in_seconds_are_current = False
-
-    def _update_measure_numbers(self):
-        update_manager = UpdateManager()
-        update_manager._update_measure_numbers(self)
+        main_leaf = getattr(parentage.root, "_main_leaf", None)
+        if main_leaf is not None:
+            main_leaf._update_later(
+                offsets=offsets, offsets_in_seconds=offsets_in_seconds
+            )
 
     def _update_now(
         self, offsets=False, offsets_in_seconds=False, indicators=False
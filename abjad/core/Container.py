@@ -7,6 +7,7 @@ from abjad import mathtools
 from abjad import rhythmtrees
 from abjad.indicators.TimeSignature import TimeSignature
 from abjad.mathtools import NonreducedFraction
+from abjad.system.FormatCache import FormatCache
 from abjad.system.FormatSpecification import FormatSpecification
 from abjad.system.LilyPondFormatManager import LilyPondFormatManager
 from abjad.top.inspect import inspect
@@ -305,7 +306,12 @@ class Container(Component):
         components = self[i]
         if not isinstance(components, Selection):
             components = select([components])
-        components._set_parents(None)
+        if not components:
+            return
+        indices = [self.index(_) for _ in components]
+        for index in sorted(indices, reverse=True):
+            self._components[index]._set_parent(None)
+        self._update_child_indices(min(indices))
 
     def __getitem__(self, argument) -> typing.Union[Component, Selection]:
         """
@@ -458,12 +464,21 @@ class Container(Component):
 
     def _copy_with_children(self):
         new_container = self.__copy__()
+        new_components = []
         for component in self:
             if isinstance(component, Container):
                 new_component = component._copy_with_children()
             else:
                 new_component = component.__copy__()
-            new_container.append(new_component)
+            new_components.append(new_component)
+        # new components are orphans: set parent without _set_item() checks
+        new_container._components.extend(new_components)
+        for new_component in new_components:
+            new_component._set_parent(new_container)
+        new_container._update_child_indices()
+        for component in iterate(new_components).components():
+            for wrapper in inspect(component).wrappers():
+                wrapper._update_effective_context()
         return new_container
 
     def _eject_contents(self):
@@ -515,18 +530,22 @@ class Container(Component):
         return self._format_slot_contributions_with_indent(result)
 
     def _format_content_pieces(self):
-        indent = LilyPondFormatManager.indent
         strings = []
-        for component in self.components:
-            string = component.__format__(format_specification="lilypond")
-            for string in string.split("\n"):
-                if string.isspace():
-                    string = ""
-                else:
-                    string = indent + string
-                strings.append(string)
+        self._format_contents_lines(None, strings, 0)
         return strings
 
+    def _format_contents_lines(self, bundle, lines, depth, inherited=None):
+        depth += 1
+        manager = LilyPondFormatManager
+        inherited = manager._collect_inherited_indicators(self, inherited)
+        for component in self.components:
+            if FormatCache._current is None:
+                component._update_now(indicators=True)
+                component._format_component_lines(lines, depth, inherited)
+            else:
+                string = component.__format__(format_specification="lilypond")
+                self._indent_format_lines(lines, [string], depth)
+
     def _format_contents_slot(self, bundle):
         result = []
         result.append(
@@ -682,6 +701,7 @@ class Container(Component):
         if self._all_are_orphan_components(components):
             self._components = list(components)
             self[:]._set_parents(self)
+            self._update_child_indices()
         elif isinstance(components, str):
             parsed = self._parse_string(components)
             self._components = []
@@ -713,6 +733,14 @@ class Container(Component):
 
         return recurse(self)
 
+    def _iterate_contents_contributions(self, bundle, depth=0, inherited=None):
+        manager = LilyPondFormatManager
+        inherited = manager._collect_inherited_indicators(self, inherited)
+        for component in self.components:
+            yield from component._iterate_lilypond_format_pieces(
+                depth + 1, inherited
+            )
+
     def _iterate_top_down(self):
         def recurse(node):
             yield node
@@ -734,12 +762,12 @@ class Container(Component):
                 yield component
 
     def _parse_string(self, string):
-        from abjad.parser.ReducedLyParser import ReducedLyParser
+        from abjad.parser.parse_reduced_ly_syntax import _reduced_ly_parser
         from abjad.lilypondfile.LilyPondFile import LilyPondFile
 
         user_input = string.strip()
         if user_input.startswith("abj:"):
-            parser = ReducedLyParser()
+            parser = _reduced_ly_parser
             parsed = parser(user_input[4:])
             if parser._toplevel_component_count == 1:
                 parent = inspect(parsed).parentage().parent
@@ -815,6 +843,7 @@ class Container(Component):
         self._components.__setitem__(slice(start, start), argument)
         for component in argument:
             component._set_parent(self)
+        self._update_child_indices(start)
         for indicator in argument_indicators:
             if hasattr(indicator, "_update_effective_context"):
                 indicator._update_effective_context()
@@ -860,6 +889,7 @@ class Container(Component):
             )
             for part in nonempty_halves:
                 part._set_parent(parent)
+            parent._update_child_indices(start)
         else:
             left._set_parent(None)
             right._set_parent(None)
@@ -972,6 +1002,17 @@ class Container(Component):
         # return list-wrapped halves of container
         return [left_container], [right_container]
 
+    def _update_child_indices(self, start=0):
+        """
+        Caches index of each child from ``start`` forward.
+
+        Cached indices are hints: ``Container.index()`` checks the hint and
+        recaches all children when the hint is stale.
+        """
+        components = self._components
+        for i in range(start, len(components)):
+            components[i]._index_in_parent = i
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -1009,6 +1050,7 @@ class Container(Component):
     def identifier(self, argument):
         assert isinstance(argument, (str, type(None))), repr(argument)
         self._identifier: typing.Optional[str] = argument
+        self._clear_cached_format()
 
     @property
     def simultaneous(self) -> typing.Optional[bool]:
@@ -1100,6 +1142,7 @@ class Container(Component):
             message += " only other containers."
             raise ValueError(message)
         self._is_simultaneous = argument
+        self._clear_cached_format()
         self._update_later(offsets=True)
 
     @property
@@ -1169,6 +1212,7 @@ class Container(Component):
                 else:
                     named_children[argument].append(self)
         self._name = argument
+        self._clear_cached_format()
 
     ### PUBLIC METHODS ###
 
@@ -1300,12 +1344,15 @@ class Container(Component):
             3
 
         """
-        for i, element in enumerate(self.components):
-            if element is component:
-                return i
-        else:
-            message = f"component {component!r} not in container {self!r}."
-            raise ValueError(message)
+        components = self._components
+        i = getattr(component, "_index_in_parent", None)
+        if i is None or len(components) <= i or components[i] is not component:
+            self._update_child_indices()
+            i = getattr(component, "_index_in_parent", None)
+            if i is None or components[i] is not component:
+                message = f"component {component!r} not in container {self!r}."
+                raise ValueError(message)
+        return i
 
     def insert(self, i, component) -> None:
         r"""
@@ -1,3 +1,4 @@
+import bisect
 import copy
 import typing
 from abjad.instruments import Instrument
@@ -38,6 +39,7 @@ class Context(Container):
     __slots__ = (
         "_lilypond_type",
         "_consists_commands",
+        "_dependent_wrapper_index",
         "_dependent_wrappers",
         "_remove_commands",
     )
@@ -78,6 +80,7 @@ class Context(Container):
         tag: str = None,
     ) -> None:
         self._consists_commands: typing.List[str] = []
+        self._dependent_wrapper_index = None
         self._dependent_wrappers: typing.List[Wrapper] = []
         self._remove_commands: typing.List[str] = []
         self.lilypond_type = lilypond_type
@@ -231,6 +234,71 @@ class Context(Container):
             result.append(string)
         return result
 
+    def _get_dependent_wrapper_index(self):
+        """
+        Maps (indicator class, command) pairs to sorted start offsets,
+        dependent-wrapper positions and dependent wrappers.
+
+        Cached until dependent wrappers bind or unbind or until offsets of
+        context change.
+        """
+        if self._dependent_wrapper_index is not None:
+            return self._dependent_wrapper_index
+        triples_by_key: typing.Dict = {}
+        for position, wrapper in enumerate(self._dependent_wrappers):
+            if wrapper.annotation:
+                continue
+            indicator = wrapper.indicator
+            key = (type(indicator), getattr(indicator, "command", None))
+            triple = (wrapper.start_offset, position, wrapper)
+            triples_by_key.setdefault(key, []).append(triple)
+        index = {}
+        for key, triples in triples_by_key.items():
+            triples.sort(key=lambda _: (_[0], _[1]))
+            index[key] = tuple(zip(*triples))
+        self._dependent_wrapper_index = index
+        return index
+
+    def _get_effective_dependent_wrapper(
+        self, prototype, offset, *, attributes=None, command=None, exclude=None
+    ):
+        """
+        Gets (start offset, position, wrapper) triple of dependent wrapper
+        with greatest start offset less than or equal to ``offset``.
+
+        Breaks ties in favor of earliest-bound dependent wrapper.
+
+        Filters on ``command`` attribute only.
+
+        Skips wrappers whose IDs appear in ``exclude``.
+        """
+        assert attributes is None or list(attributes) == ["command"]
+        result = None
+        index = self._get_dependent_wrapper_index()
+        for key, (offsets, positions, wrappers) in index.items():
+            class_, command_ = key
+            if not issubclass(class_, prototype):
+                continue
+            if command is not None and command_ != command:
+                continue
+            if attributes is not None and command_ != attributes["command"]:
+                continue
+            i = bisect.bisect_right(offsets, offset)
+            if i == 0:
+                continue
+            i = bisect.bisect_left(offsets, offsets[i - 1])
+            if exclude:
+                i = self._skip_excluded_wrappers(offsets, wrappers, i, exclude)
+                if i is None:
+                    continue
+            if (
+                result is None
+                or result[0] < offsets[i]
+                or (result[0] == offsets[i] and positions[i] < result[1])
+            ):
+                result = (offsets[i], positions[i], wrappers[i])
+        return result
+
     def _get_format_pieces(self):
         return self._format_component(pieces=True)
 
@@ -276,6 +344,18 @@ class Context(Container):
         else:
             return ["simultaneous", "lilypond_type", "name"]
 
+    @staticmethod
+    def _skip_excluded_wrappers(offsets, wrappers, i, exclude):
+        stop = bisect.bisect_right(offsets, offsets[i])
+        while True:
+            for j in range(i, stop):
+                if id(wrappers[j]) not in exclude:
+                    return j
+            if i == 0:
+                return None
+            stop = i
+            i = bisect.bisect_left(offsets, offsets[i - 1])
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -315,7 +395,7 @@ class Context(Container):
             ...     )
             >>> context.lilypond_type
             'ViolinStaff'
-        
+
         Gets and sets lilypond type of context.
 
         Returns string.
@@ -329,6 +409,7 @@ class Context(Container):
         else:
             argument = str(argument)
         self._lilypond_type = argument
+        self._clear_cached_format()
 
     @property
     def lilypond_context(self):
@@ -22,13 +22,16 @@ from .Container import Container
 from .Descendants import Descendants
 from .GraceContainer import GraceContainer
 from .Leaf import Leaf
+from .LeafTable import LeafTable
 from .Lineage import Lineage
 from .LogicalTie import LogicalTie
+from .MeasureMap import MeasureMap
 from .Note import Note
 from .OnBeatGraceContainer import OnBeatGraceContainer
 from .Parentage import Parentage
 from .Selection import Selection
 from .Staff import Staff
+from .TempoMap import TempoMap
 from .Tuplet import Tuplet
 from .VerticalMoment import VerticalMoment
 from .Wellformedness import Wellformedness
@@ -1934,6 +1937,60 @@ class Inspection(object):
                 return leaf
         return None
 
+    def leaf_table(self) -> LeafTable:
+        r"""
+        Gets leaf table.
+
+        ..  container:: example
+
+            >>> staff = abjad.Staff("c'4 <d' f'>8 r8 e'2")
+            >>> abjad.show(staff) # doctest: +SKIP
+
+            ..  docs::
+
+                >>> abjad.f(staff)
+                \new Staff
+                {
+                    c'4
+                    <d' f'>8
+                    r8
+                    e'2
+                }
+
+            >>> table = abjad.inspect(staff).leaf_table()
+            >>> table.start_offset_numerators
+            array('q', [0, 1, 3, 1])
+            >>> table.start_offset_denominators
+            array('q', [1, 4, 8, 2])
+            >>> table.midi_pitches
+            array('d', [60.0, nan, 62.0, 65.0, nan, nan, 64.0, nan])
+
+        ..  container:: example
+
+            Caches leaf table at score root until score changes:
+
+            >>> abjad.inspect(staff).leaf_table() is table
+            True
+
+            >>> staff[0].written_pitch = "cs'"
+            >>> table = abjad.inspect(staff).leaf_table()
+            >>> table.midi_pitches
+            array('d', [61.0, nan, 62.0, 65.0, nan, nan, 64.0, nan])
+
+            Leaf tables of selections and of components below score root are
+            built afresh on each call.
+
+        Builds leaf table in one traversal of client.
+        """
+        if isinstance(self.client, Component):
+            client = self.client
+            if client is not inspect(client).parentage().root:
+                return LeafTable(iterate(client).leaves())
+            if client._leaf_table is None:
+                client._leaf_table = LeafTable(iterate(client).leaves())
+            return client._leaf_table
+        return LeafTable(iterate(self.client).leaves())
+
     def lineage(self) -> Lineage:
         r"""
         Gets lineage.
@@ -2107,6 +2164,50 @@ class Inspection(object):
         result = self.client._get_markup(direction=direction)
         return list(result)
 
+    def measure_map(self) -> MeasureMap:
+        r"""
+        Gets measure map of score that contains client.
+
+        ..  container:: example
+
+            >>> staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4 a'4")
+            >>> abjad.attach(abjad.TimeSignature((3, 8)), staff[0])
+            >>> abjad.attach(abjad.TimeSignature((3, 4)), staff[3])
+            >>> abjad.show(staff) # doctest: +SKIP
+
+            ..  docs::
+
+                >>> abjad.f(staff)
+                \new Staff
+                {
+                    \time 3/8
+                    c'4
+                    d'4
+                    e'4
+                    \time 3/4
+                    f'4
+                    g'4
+                    a'4
+                }
+
+            >>> measure_map = abjad.inspect(staff[4]).measure_map()
+            >>> for offset in measure_map.measure_start_offsets:
+            ...     offset
+            ...
+            Offset((0, 1))
+            Offset((3, 8))
+            Offset((3, 4))
+
+            >>> measure_map.measure_timespan(abjad.Offset(1, 2))
+            Timespan(Offset((3, 8)), Offset((3, 4)))
+
+        Measure map is cached on the root of the score and rebuilt after
+        offsets change or time signatures are attached or detached.
+        """
+        if not isinstance(self.client, Component):
+            raise Exception("can only get measure map on component.")
+        return self.client._get_measure_map()
+
     def measure_number(self) -> int:
         r"""
         Gets measure number.
@@ -2215,9 +2316,9 @@ class Inspection(object):
         """
         if not isinstance(self.client, Component):
             raise Exception("can only get measure number on component.")
-        self.client._update_measure_numbers()
-        assert isinstance(self.client._measure_number, int)
-        return self.client._measure_number
+        measure_map = self.client._get_measure_map()
+        start_offset = self.client._get_timespan().start_offset
+        return measure_map.measure_number(start_offset)
 
     def on_beat_grace_container(self) -> typing.Optional[OnBeatGraceContainer]:
         r"""
@@ -2383,7 +2484,7 @@ class Inspection(object):
             message = "can only get parentage on component"
             message += f" (not {self.client})."
             raise Exception(message)
-        return Parentage(self.client)
+        return Parentage._get_cached_parentage(self.client)
 
     def pitches(self) -> typing.Optional[PitchSet]:
         r"""
@@ -2667,6 +2768,50 @@ class Inspection(object):
             strings.append(string)
         return "\n".join(strings)
 
+    def tempo_map(self) -> TempoMap:
+        r"""
+        Gets tempo map of score that contains client.
+
+        ..  container:: example
+
+            >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+            >>> score = abjad.Score([staff])
+            >>> mark = abjad.MetronomeMark((1, 4), 60)
+            >>> abjad.attach(mark, staff[0])
+            >>> mark = abjad.MetronomeMark((1, 8), 60)
+            >>> abjad.attach(mark, staff[2])
+            >>> abjad.show(score) # doctest: +SKIP
+
+            ..  docs::
+
+                >>> abjad.f(score)
+                \new Score
+                <<
+                    \new Staff
+                    {
+                        \tempo 4=60
+                        c'4
+                        d'4
+                        \tempo 8=60
+                        e'4
+                        f'4
+                    }
+                >>
+
+            >>> tempo_map = abjad.inspect(staff[-1]).tempo_map()
+            >>> tempo_map.offset_to_seconds(abjad.Offset(3, 4))
+            Offset((4, 1))
+
+            >>> tempo_map.seconds_to_offset(6)
+            Offset((1, 1))
+
+        Tempo map is cached on the root of the score and rebuilt after
+        offsets change or metronome marks are attached or detached.
+        """
+        if not isinstance(self.client, Component):
+            raise Exception("can only get tempo map on component.")
+        return self.client._get_tempo_map()
+
     def timespan(self, in_seconds: bool = False) -> Timespan:
         r"""
         Gets timespan.
@@ -1,4 +1,6 @@
+import bisect
 import collections
+import fractions
 from abjad import enums
 from abjad.instruments import Instrument
 from abjad.pitch import NamedPitch
@@ -8,7 +10,6 @@ from abjad.pitch import PitchSet
 from abjad.system.StorageFormatManager import StorageFormatManager
 from abjad.utilities.Enumerator import Enumerator
 from abjad.utilities.Offset import Offset
-from abjad.utilities.OrderedDict import OrderedDict
 from abjad.utilities.Sequence import Sequence
 from abjad.top.inspect import inspect
 
@@ -71,6 +72,21 @@ class Iteration(object):
         assert isinstance(exclude, tuple), repr(exclude)
         return exclude
 
+    @staticmethod
+    def _get_offset_key(offset):
+        """
+        Gets sort key of ``offset``: value, then grace displacement.
+
+        Compares plain fractions so that offsets with equal value but
+        different grace displacements never collapse into one moment.
+        """
+        value = fractions.Fraction(offset.numerator, offset.denominator)
+        displacement = offset._get_displacement()
+        displacement = fractions.Fraction(
+            displacement.numerator, displacement.denominator
+        )
+        return value, displacement
+
     @staticmethod
     def _iterate_components(
         client,
@@ -81,138 +97,143 @@ class Iteration(object):
         grace=None,
         reverse=None,
     ):
+        """
+        Iterates components depth-first with an explicit stack of child
+        iterators.
+
+        Reads grace containers from leaf slots and tracks grace music while
+        descending rather than inspecting each component; recurses only into
+        grace containers.
+        """
         from .AfterGraceContainer import AfterGraceContainer
         from .Component import Component
         from .GraceContainer import GraceContainer
         from .OnBeatGraceContainer import OnBeatGraceContainer
         from .Leaf import Leaf
 
-        argument = client
         prototype = prototype or Component
-        grace_container = None
-        on_beat_grace_container = None
-        after_grace_container = None
         exclude = Iteration._coerce_exclude(exclude)
         assert isinstance(exclude, tuple), repr(exclude)
-        if grace is not False and isinstance(argument, Leaf):
-            inspection = inspect(argument)
-            grace_container = inspection.grace_container()
-            on_beat_grace_container = inspection.on_beat_grace_container()
-            after_grace_container = inspection.after_grace_container()
-        if not reverse:
-            if (
-                not do_not_iterate_grace_containers
-                and grace is not False
-                and grace_container
-            ):
-                yield from Iteration._iterate_components(
-                    grace_container,
-                    prototype,
-                    do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                    grace=grace,
-                    reverse=reverse,
-                )
-            if (
-                not do_not_iterate_grace_containers
-                and grace is not False
-                and on_beat_grace_container
-            ):
-                yield from Iteration._iterate_components(
-                    on_beat_grace_container,
-                    prototype,
-                    do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                    grace=grace,
-                    reverse=reverse,
-                )
-            if isinstance(argument, prototype):
-                if (
-                    grace is None
-                    or (grace is True and inspect(argument).grace())
-                    or (grace is False and not inspect(argument).grace())
-                ):
-                    if not Iteration._should_exclude(argument, exclude):
-                        yield argument
-            if (
-                not do_not_iterate_grace_containers
-                and grace is not False
-                and after_grace_container
-            ):
-                yield from Iteration._iterate_components(
-                    after_grace_container,
-                    prototype,
-                    exclude=exclude,
-                    do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                    grace=grace,
-                    reverse=reverse,
-                )
-            if isinstance(argument, collections.abc.Iterable):
-                for item in argument:
-                    yield from Iteration._iterate_components(
-                        item,
-                        prototype,
-                        exclude=exclude,
-                        do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                        grace=grace,
-                        reverse=reverse,
+        iterate_grace_containers = (
+            not do_not_iterate_grace_containers and grace is not False
+        )
+        grace_prototype = (
+            AfterGraceContainer,
+            GraceContainer,
+            OnBeatGraceContainer,
+        )
+        is_grace = False
+        if grace is not None:
+            is_grace = inspect(client).grace()
+        frames = [(iter((client,)), is_grace)]
+        while frames:
+            iterator, parent_is_grace = frames[-1]
+            for argument in iterator:
+                if grace is not None:
+                    is_grace = parent_is_grace or isinstance(
+                        argument, grace_prototype
                     )
-        else:
-            if (
-                not do_not_iterate_grace_containers
-                and grace is not False
-                and after_grace_container
-            ):
-                yield from Iteration._iterate_components(
-                    after_grace_container,
-                    prototype,
-                    exclude=exclude,
-                    do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                    grace=grace,
-                    reverse=reverse,
-                )
-            if isinstance(argument, prototype):
+                before, after = (), ()
+                if iterate_grace_containers and isinstance(argument, Leaf):
+                    grace_container = argument._grace_container
+                    on_beat_grace_container = argument._on_beat_grace_container
+                    after_grace_container = argument._after_grace_container
+                    if not reverse:
+                        # grace music before leaf ignores exclude:
+                        before = (
+                            (grace_container, None),
+                            (on_beat_grace_container, None),
+                        )
+                        after = ((after_grace_container, exclude),)
+                    else:
+                        before = ((after_grace_container, exclude),)
+                        after = (
+                            (on_beat_grace_container, exclude),
+                            (grace_container, exclude),
+                        )
+                for container, exclude_ in before:
+                    if container:
+                        yield from Iteration._iterate_components(
+                            container,
+                            prototype,
+                            exclude=exclude_,
+                            do_not_iterate_grace_containers=do_not_iterate_grace_containers,
+                            grace=grace,
+                            reverse=reverse,
+                        )
                 if (
-                    grace is None
-                    or (grace is True and inspect(argument).grace())
-                    or (grace is False and not inspect(argument).grace())
-                ):
-                    if not Iteration._should_exclude(argument, exclude):
-                        yield argument
-            if (
-                not do_not_iterate_grace_containers
-                and grace is not False
-                and on_beat_grace_container
-            ):
-                yield from Iteration._iterate_components(
-                    on_beat_grace_container,
-                    prototype,
-                    exclude=exclude,
-                    do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                    grace=grace,
-                    reverse=reverse,
-                )
-            if (
-                not do_not_iterate_grace_containers
-                and grace is not False
-                and grace_container
-            ):
-                yield from Iteration._iterate_components(
-                    grace_container,
-                    prototype,
-                    exclude=exclude,
-                    do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                    grace=grace,
-                    reverse=reverse,
-                )
-            if isinstance(argument, collections.abc.Iterable):
-                for item in reversed(argument):
-                    yield from Iteration._iterate_components(
-                        item,
-                        prototype,
-                        exclude=exclude,
-                        do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                        grace=grace,
-                        reverse=reverse,
+                    isinstance(argument, prototype)
+                    and (grace is None or grace is is_grace)
+                    and not (
+                        exclude
+                        and Iteration._should_exclude(argument, exclude)
                     )
+                ):
+                    yield argument
+                for container, exclude_ in after:
+                    if container:
+                        yield from Iteration._iterate_components(
+                            container,
+                            prototype,
+                            exclude=exclude_,
+                            do_not_iterate_grace_containers=do_not_iterate_grace_containers,
+                            grace=grace,
+                            reverse=reverse,
+                        )
+                if isinstance(argument, collections.abc.Iterable):
+                    if not reverse:
+                        children = iter(argument)
+                    else:
+                        children = reversed(argument)
+                    frames.append((children, is_grace))
+                    break
+            else:
+                frames.pop()
+
+    def _iterate_vertical_moments(self, reverse=None):
+        """
+        Sweeps start offsets once, adding components to the moment at which
+        they start and removing them after the moment at which they stop.
+
+        Gets timespan and score index of each component only once.
+        """
+        from .VerticalMoment import VerticalMoment
+
+        pairs = [(_, inspect(_).timespan()) for _ in self.components()]
+        pairs.sort(key=lambda _: Iteration._get_offset_key(_[1].start_offset))
+        keys, offsets = [], []
+        for component, timespan in pairs:
+            key = Iteration._get_offset_key(timespan.start_offset)
+            if not keys or keys[-1] != key:
+                keys.append(key)
+                offsets.append(timespan.start_offset)
+        score_indices = [
+            inspect(_[0]).parentage().score_index() for _ in pairs
+        ]
+        positions = list(range(len(pairs)))
+        positions.sort(key=lambda _: score_indices[_])
+        components = [pairs[_][0] for _ in positions]
+        starts = [[] for _ in offsets]
+        stops = [[] for _ in offsets]
+        for rank, position in enumerate(positions):
+            timespan = pairs[position][1]
+            key = Iteration._get_offset_key(timespan.start_offset)
+            first = bisect.bisect_left(keys, key)
+            key = Iteration._get_offset_key(timespan.stop_offset)
+            last = bisect.bisect_left(keys, key) - 1
+            if first <= last:
+                starts[first].append(rank)
+                stops[last].append(rank)
+        indices = range(len(offsets))
+        if reverse is True:
+            indices = reversed(indices)
+            starts, stops = stops, starts
+        ranks = set()
+        for i in indices:
+            ranks.update(starts[i])
+            list_ = [components[_] for _ in sorted(ranks)]
+            yield VerticalMoment(components=list_, offset=offsets[i])
+            ranks.difference_update(stops[i])
 
     @staticmethod
     def _should_exclude(argument, exclude):
@@ -1338,6 +1359,54 @@ class Iteration(object):
         for pitch in result:
             yield pitch
 
+    def stream_vertical_moments(self, reverse=None):
+        r"""
+        Iterates vertical moments one at a time.
+
+        ..  container:: example
+
+            >>> score = abjad.Score()
+            >>> score.append(abjad.Staff("c'4 d'4 e'4 f'4"))
+            >>> score.append(abjad.Staff("g'2 a'8 b'8 c''4"))
+            >>> abjad.show(score) # doctest: +SKIP
+
+            ..  docs::
+
+                >>> abjad.f(score)
+                \new Score
+                <<
+                    \new Staff
+                    {
+                        c'4
+                        d'4
+                        e'4
+                        f'4
+                    }
+                    \new Staff
+                    {
+                        g'2
+                        a'8
+                        b'8
+                        c''4
+                    }
+                >>
+
+            >>> for moment in abjad.iterate(score).stream_vertical_moments():
+            ...     moment.offset, moment.leaves
+            ...
+            (Offset((0, 1)), Selection([Note("c'4"), Note("g'2")]))
+            (Offset((1, 4)), Selection([Note("d'4"), Note("g'2")]))
+            (Offset((1, 2)), Selection([Note("e'4"), Note("a'8")]))
+            (Offset((5, 8)), Selection([Note("e'4"), Note("b'8")]))
+            (Offset((3, 4)), Selection([Note("f'4"), Note("c''4")]))
+
+        Yields the same vertical moments as ``vertical_moments()`` without
+        first building all of them.
+
+        Returns generator.
+        """
+        yield from self._iterate_vertical_moments(reverse=reverse)
+
     def timeline(self, prototype=None, *, exclude=None, reverse=None):
         r"""
         Iterates timeline.
@@ -1472,20 +1541,12 @@ class Iteration(object):
 
         Iterates leaves when ``prototype`` is none.
         """
-        components = self.leaves(prototype=prototype, exclude=exclude)
-        components = list(components)
-        components.sort(key=lambda _: inspect(_).timespan().start_offset)
-        offset_to_components = OrderedDict()
-        for component in components:
-            start_offset = inspect(component).timespan().start_offset
-            if start_offset not in offset_to_components:
-                offset_to_components[start_offset] = []
-        for component in components:
+        pairs = []
+        for component in self.leaves(prototype=prototype, exclude=exclude):
             start_offset = inspect(component).timespan().start_offset
-            offset_to_components[start_offset].append(component)
-        components = []
-        for start_offset, list_ in offset_to_components.items():
-            components.extend(list_)
+            pairs.append((start_offset, component))
+        pairs.sort(key=lambda _: _[0])
+        components = [_[1] for _ in pairs]
         if reverse:
             components.reverse()
         return tuple(components)
@@ -1630,35 +1691,4 @@ class Iteration(object):
 
         Returns tuple.
         '''
-        from .Selection import Selection
-        from .VerticalMoment import VerticalMoment
-
-        moments = []
-        components = list(self.components())
-        components.sort(key=lambda _: inspect(_).timespan().start_offset)
-        offset_to_components = OrderedDict()
-        for component in components:
-            start_offset = inspect(component).timespan().start_offset
-            if start_offset not in offset_to_components:
-                offset_to_components[start_offset] = []
-        # TODO: optimize with bisect
-        for component in components:
-            inserted = False
-            timespan = inspect(component).timespan()
-            for offset, list_ in offset_to_components.items():
-                if (
-                    timespan.start_offset <= offset < timespan.stop_offset
-                    and component not in list_
-                ):
-                    list_.append(component)
-                    inserted = True
-                elif inserted is True:
-                    break
-        moments = []
-        for offset, list_ in offset_to_components.items():
-            list_.sort(key=lambda _: inspect(_).parentage().score_index())
-            moment = VerticalMoment(components=list_, offset=offset)
-            moments.append(moment)
-        if reverse is True:
-            moments.reverse()
-        return tuple(moments)
+        return tuple(self._iterate_vertical_moments(reverse=reverse))
@@ -1813,7 +1813,7 @@ class Label(object):
         if self._expression:
             return self._update_expression(inspect.currentframe())
         prototype = prototype or int
-        vertical_moments = iterate(self.client).vertical_moments()
+        vertical_moments = iterate(self.client).stream_vertical_moments()
         for index, vertical_moment in enumerate(vertical_moments):
             label = None
             if prototype is int:
@@ -560,6 +560,7 @@ class Leaf(Component):
         else:
             multiplier = Multiplier(argument)
         self._multiplier = multiplier
+        self._update_later(offsets=True)
 
     @property
     def written_duration(self) -> Duration:
@@ -575,3 +576,4 @@ class Leaf(Component):
             message = f"not assignable duration: {duration!r}."
             raise exceptions.AssignabilityError(message)
         self._written_duration = duration
+        self._update_later(offsets=True)
@@ -0,0 +1,351 @@
+import array
+import math
+import typing
+from abjad.system.StorageFormatManager import StorageFormatManager
+from abjad.top.inspect import inspect
+from .Leaf import Leaf
+from .Staff import Staff
+from .Voice import Voice
+
+
+class LeafTable(object):
+    r"""
+    Leaf table.
+
+    ..  container:: example
+
+        >>> string = r"c'4 ~ c'8 <e' g'>8 r4 \times 2/3 { d'4 e' f' }"
+        >>> staff = abjad.Staff(string)
+        >>> abjad.show(staff) # doctest: +SKIP
+
+        ..  docs::
+
+            >>> abjad.f(staff)
+            \new Staff
+            {
+                c'4
+                ~
+                c'8
+                <e' g'>8
+                r4
+                \times 2/3 {
+                    d'4
+                    e'4
+                    f'4
+                }
+            }
+
+        >>> table = abjad.inspect(staff).leaf_table()
+        >>> len(table)
+        7
+
+        >>> table.start_offset_numerators
+        array('q', [0, 1, 3, 1, 3, 11, 13])
+        >>> table.start_offset_denominators
+        array('q', [1, 4, 8, 2, 4, 12, 12])
+
+        >>> table.duration_numerators
+        array('q', [1, 1, 1, 1, 1, 1, 1])
+        >>> table.duration_denominators
+        array('q', [4, 8, 8, 4, 6, 6, 6])
+
+        >>> table.leaf_classes
+        (<class 'abjad.core.Note.Note'>, <class 'abjad.core.Chord.Chord'>, <class 'abjad.core.Rest.Rest'>)
+        >>> table.leaf_class_codes
+        array('q', [0, 0, 1, 2, 0, 0, 0])
+
+        >>> table.logical_tie_ids
+        array('q', [0, 0, 1, 2, 3, 4, 5])
+
+        Pitches are MIDI numbers, ``pitch_width`` to a row and padded with
+        NaN:
+
+        >>> table.pitch_width
+        2
+        >>> table.midi_pitches
+        array('d', [60.0, nan, 60.0, nan, 64.0, 67.0, nan, nan, 62.0, nan, 64.0, nan, 65.0, nan])
+
+    Columns are typed arrays from the standard library ``array`` module and
+    support the buffer protocol; pass any column to ``numpy.asarray()`` to
+    view it as a NumPy array without copying.
+
+    Start and stop offsets ignore grace-note displacement; use the ``grace``
+    column to tell grace notes apart.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Collaborators"
+
+    __slots__ = (
+        "_duration_denominators",
+        "_duration_numerators",
+        "_grace",
+        "_leaf_class_codes",
+        "_leaf_classes",
+        "_leaves",
+        "_logical_tie_ids",
+        "_midi_pitches",
+        "_pitch_width",
+        "_staff_ids",
+        "_staves",
+        "_start_offset_denominators",
+        "_start_offset_numerators",
+        "_stop_offset_denominators",
+        "_stop_offset_numerators",
+        "_voice_ids",
+        "_voices",
+        "_written_duration_denominators",
+        "_written_duration_numerators",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, leaves: typing.Iterable[Leaf] = None) -> None:
+        self._leaves = tuple(leaves or ())
+        self._duration_denominators = array.array("q")
+        self._duration_numerators = array.array("q")
+        self._grace = array.array("b")
+        self._leaf_class_codes = array.array("q")
+        self._logical_tie_ids = array.array("q")
+        self._staff_ids = array.array("q")
+        self._start_offset_denominators = array.array("q")
+        self._start_offset_numerators = array.array("q")
+        self._stop_offset_denominators = array.array("q")
+        self._stop_offset_numerators = array.array("q")
+        self._voice_ids = array.array("q")
+        self._written_duration_denominators = array.array("q")
+        self._written_duration_numerators = array.array("q")
+        leaf_class_codes: typing.Dict = {}
+        logical_tie_count = 0
+        logical_tie_ids: typing.Dict = {}
+        staff_ids: typing.Dict = {}
+        voice_ids: typing.Dict = {}
+        pitch_lists = []
+        for leaf in self._leaves:
+            inspection = inspect(leaf)
+            timespan = inspection.timespan()
+            self._start_offset_numerators.append(
+                timespan.start_offset.numerator
+            )
+            self._start_offset_denominators.append(
+                timespan.start_offset.denominator
+            )
+            self._stop_offset_numerators.append(timespan.stop_offset.numerator)
+            self._stop_offset_denominators.append(
+                timespan.stop_offset.denominator
+            )
+            self._written_duration_numerators.append(
+                leaf.written_duration.numerator
+            )
+            self._written_duration_denominators.append(
+                leaf.written_duration.denominator
+            )
+            duration = inspection.duration()
+            self._duration_numerators.append(duration.numerator)
+            self._duration_denominators.append(duration.denominator)
+            self._grace.append(int(inspection.grace()))
+            code = leaf_class_codes.setdefault(
+                type(leaf), len(leaf_class_codes)
+            )
+            self._leaf_class_codes.append(code)
+            parentage = inspection.parentage()
+            voice = parentage.get(Voice)
+            if voice is None:
+                self._voice_ids.append(-1)
+            else:
+                id_ = voice_ids.setdefault(id(voice), (len(voice_ids), voice))
+                self._voice_ids.append(id_[0])
+            staff = parentage.get(Staff)
+            if staff is None:
+                self._staff_ids.append(-1)
+            else:
+                id_ = staff_ids.setdefault(id(staff), (len(staff_ids), staff))
+                self._staff_ids.append(id_[0])
+            if id(leaf) not in logical_tie_ids:
+                for leaf_ in inspection.logical_tie():
+                    logical_tie_ids[id(leaf_)] = logical_tie_count
+                logical_tie_count += 1
+            self._logical_tie_ids.append(logical_tie_ids[id(leaf)])
+            if hasattr(leaf, "written_pitches"):
+                pitches = list(leaf.written_pitches)
+            elif getattr(leaf, "written_pitch", None) is not None:
+                pitches = [leaf.written_pitch]
+            else:
+                pitches = []
+            pitch_lists.append([_.number + 60 for _ in pitches])
+        self._leaf_classes = tuple(leaf_class_codes)
+        self._staves = tuple(_[1] for _ in staff_ids.values())
+        self._voices = tuple(_[1] for _ in voice_ids.values())
+        pitch_width = max([len(_) for _ in pitch_lists] or [0])
+        self._pitch_width = pitch_width
+        self._midi_pitches = array.array("d")
+        for pitch_list in pitch_lists:
+            self._midi_pitches.extend(pitch_list)
+            padding = pitch_width - len(pitch_list)
+            self._midi_pitches.extend(padding * [math.nan])
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self) -> int:
+        """
+        Gets number of leaves in leaf table.
+        """
+        return len(self.leaves)
+
+    def __repr__(self) -> str:
+        """
+        Gets interpreter representation.
+        """
+        return StorageFormatManager(self).get_repr_format()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def duration_denominators(self) -> array.array:
+        """
+        Gets denominators of leaf durations.
+
+        Leaf durations include leaf multipliers and tuplet prolation.
+        """
+        return self._duration_denominators
+
+    @property
+    def duration_numerators(self) -> array.array:
+        """
+        Gets numerators of leaf durations.
+
+        Leaf durations include leaf multipliers and tuplet prolation.
+        """
+        return self._duration_numerators
+
+    @property
+    def grace(self) -> array.array:
+        """
+        Gets grace flags: 1 for grace notes and 0 otherwise.
+        """
+        return self._grace
+
+    @property
+    def leaf_class_codes(self) -> array.array:
+        """
+        Gets leaf class codes.
+
+        Codes index ``leaf_classes``.
+        """
+        return self._leaf_class_codes
+
+    @property
+    def leaf_classes(self) -> typing.Tuple[type, ...]:
+        """
+        Gets leaf classes in order of first appearance.
+        """
+        return self._leaf_classes
+
+    @property
+    def leaves(self) -> typing.Tuple[Leaf, ...]:
+        """
+        Gets leaves; one leaf to a row.
+        """
+        return self._leaves
+
+    @property
+    def logical_tie_ids(self) -> array.array:
+        """
+        Gets logical tie IDs.
+
+        Leaves in the same logical tie share the same ID; IDs count from 0
+        in order of first appearance.
+        """
+        return self._logical_tie_ids
+
+    @property
+    def midi_pitches(self) -> array.array:
+        """
+        Gets MIDI pitch numbers.
+
+        Holds ``pitch_width`` pitches to a row, padded with NaN; rests and
+        skips hold only NaN.
+        """
+        return self._midi_pitches
+
+    @property
+    def pitch_width(self) -> int:
+        """
+        Gets greatest number of pitches in any leaf.
+        """
+        return self._pitch_width
+
+    @property
+    def staff_ids(self) -> array.array:
+        """
+        Gets staff IDs.
+
+        IDs index ``staves``; leaves outside any staff have ID -1.
+        """
+        return self._staff_ids
+
+    @property
+    def staves(self) -> typing.Tuple[Staff, ...]:
+        """
+        Gets staves in order of first appearance.
+        """
+        return self._staves
+
+    @property
+    def start_offset_denominators(self) -> array.array:
+        """
+        Gets denominators of leaf start offsets.
+        """
+        return self._start_offset_denominators
+
+    @property
+    def start_offset_numerators(self) -> array.array:
+        """
+        Gets numerators of leaf start offsets.
+        """
+        return self._start_offset_numerators
+
+    @property
+    def stop_offset_denominators(self) -> array.array:
+        """
+        Gets denominators of leaf stop offsets.
+        """
+        return self._stop_offset_denominators
+
+    @property
+    def stop_offset_numerators(self) -> array.array:
+        """
+        Gets numerators of leaf stop offsets.
+        """
+        return self._stop_offset_numerators
+
+    @property
+    def voice_ids(self) -> array.array:
+        """
+        Gets voice IDs.
+
+        IDs index ``voices``; leaves outside any voice have ID -1.
+        """
+        return self._voice_ids
+
+    @property
+    def voices(self) -> typing.Tuple[Voice, ...]:
+        """
+        Gets voices in order of first appearance.
+        """
+        return self._voices
+
+    @property
+    def written_duration_denominators(self) -> array.array:
+        """
+        Gets denominators of leaf written durations.
+        """
+        return self._written_duration_denominators
+
+    @property
+    def written_duration_numerators(self) -> array.array:
+        """
+        Gets numerators of leaf written durations.
+        """
+        return self._written_duration_numerators
@@ -0,0 +1,199 @@
+import bisect
+import typing
+from abjad.indicators.TimeSignature import TimeSignature
+from abjad.system.StorageFormatManager import StorageFormatManager
+from abjad.timespans import Timespan
+from abjad.utilities.Offset import Offset
+
+
+class MeasureMap(object):
+    r"""
+    Measure map.
+
+    ..  container:: example
+
+        >>> staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4 a'4 b'4 c''4")
+        >>> abjad.attach(abjad.TimeSignature((3, 4)), staff[0])
+        >>> abjad.attach(abjad.TimeSignature((2, 4)), staff[6])
+        >>> abjad.show(staff) # doctest: +SKIP
+
+        ..  docs::
+
+            >>> abjad.f(staff)
+            \new Staff
+            {
+                \time 3/4
+                c'4
+                d'4
+                e'4
+                f'4
+                g'4
+                a'4
+                \time 2/4
+                b'4
+                c''4
+            }
+
+        >>> measure_map = abjad.inspect(staff).measure_map()
+        >>> for offset in measure_map.measure_start_offsets:
+        ...     offset
+        ...
+        Offset((0, 1))
+        Offset((3, 4))
+        Offset((3, 2))
+
+        >>> measure_map.measure_number(abjad.Offset(7, 4))
+        3
+
+        >>> measure_map.measure_timespan(abjad.Offset(7, 4))
+        Timespan(Offset((3, 2)), Offset((2, 1)))
+
+    Measure maps are cached on the root of the score and rebuilt only after
+    offsets change or time signatures are attached or detached.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Collaborators"
+
+    __slots__ = ("_measure_start_offsets", "_stop_offset", "_time_signatures")
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        measure_start_offsets: typing.Sequence[Offset] = None,
+        time_signatures: typing.Sequence[TimeSignature] = None,
+        stop_offset: Offset = None,
+    ) -> None:
+        measure_start_offsets = measure_start_offsets or ()
+        measure_start_offsets = tuple(Offset(_) for _ in measure_start_offsets)
+        time_signatures = tuple(time_signatures or ())
+        assert len(measure_start_offsets) == len(time_signatures)
+        self._measure_start_offsets = measure_start_offsets
+        self._time_signatures = time_signatures
+        if stop_offset is not None:
+            stop_offset = Offset(stop_offset)
+        self._stop_offset = stop_offset
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self) -> int:
+        """
+        Gets number of measures in measure map.
+        """
+        return len(self.measure_start_offsets)
+
+    def __repr__(self) -> str:
+        """
+        Gets interpreter representation.
+        """
+        return StorageFormatManager(self).get_repr_format()
+
+    ### PRIVATE METHODS ###
+
+    def _get_measure_index(self, offset):
+        offset = Offset(offset)
+        displacement = offset.displacement
+        if displacement is not None:
+            offset = Offset(offset, displacement=None)
+            # score-initial grace music only:
+            if displacement < 0 and offset == 0:
+                return -1
+        measure_index = bisect.bisect_right(self.measure_start_offsets, offset)
+        measure_index -= 1
+        if measure_index < 0:
+            message = f"can not find measure number for {offset!r}:\n"
+            message += f"   {self.measure_start_offsets!r}"
+            raise ValueError(message)
+        return measure_index
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def measure_start_offsets(self) -> typing.Tuple[Offset, ...]:
+        """
+        Gets measure start offsets.
+        """
+        return self._measure_start_offsets
+
+    @property
+    def stop_offset(self) -> typing.Optional[Offset]:
+        """
+        Gets stop offset of score.
+        """
+        return self._stop_offset
+
+    @property
+    def time_signatures(self) -> typing.Tuple[TimeSignature, ...]:
+        """
+        Gets time signature in force for each measure.
+        """
+        return self._time_signatures
+
+    ### PUBLIC METHODS ###
+
+    def measure_number(self, offset) -> int:
+        """
+        Gets number of measure that contains ``offset``.
+
+        ..  container:: example
+
+            >>> staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4 a'4 b'4 c''4")
+            >>> abjad.attach(abjad.TimeSignature((3, 4)), staff[0])
+            >>> measure_map = abjad.inspect(staff).measure_map()
+            >>> measure_map.measure_number(abjad.Offset(0))
+            1
+            >>> measure_map.measure_number(abjad.Offset(3, 4))
+            2
+            >>> measure_map.measure_number(abjad.Offset(7, 4))
+            3
+
+        Counts score-initial grace music as measure 0.
+
+        Raises value error when no measure contains ``offset``.
+        """
+        return self._get_measure_index(offset) + 1
+
+    def measure_timespan(self, offset) -> Timespan:
+        """
+        Gets timespan of measure that contains ``offset``.
+
+        ..  container:: example
+
+            >>> staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4 a'4 b'4 c''4")
+            >>> abjad.attach(abjad.TimeSignature((3, 4)), staff[0])
+            >>> measure_map = abjad.inspect(staff).measure_map()
+            >>> measure_map.measure_timespan(abjad.Offset(1, 4))
+            Timespan(Offset((0, 1)), Offset((3, 4)))
+
+            >>> measure_map.measure_timespan(abjad.Offset(7, 4))
+            Timespan(Offset((3, 2)), Offset((9, 4)))
+
+        Measures cut short by a following time signature stop at the start
+        of the next measure.
+        """
+        measure_index = max(self._get_measure_index(offset), 0)
+        start_offset = self.measure_start_offsets[measure_index]
+        time_signature = self.time_signatures[measure_index]
+        stop_offset = start_offset + time_signature.duration
+        if measure_index + 1 < len(self):
+            next_start_offset = self.measure_start_offsets[measure_index + 1]
+            stop_offset = min(stop_offset, next_start_offset)
+        return Timespan(start_offset=start_offset, stop_offset=stop_offset)
+
+    def time_signature(self, offset) -> TimeSignature:
+        """
+        Gets time signature in force at ``offset``.
+
+        ..  container:: example
+
+            >>> staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4 a'4 b'4 c''4")
+            >>> abjad.attach(abjad.TimeSignature((3, 4)), staff[0])
+            >>> measure_map = abjad.inspect(staff).measure_map()
+            >>> measure_map.time_signature(abjad.Offset(7, 4))
+            TimeSignature((3, 4))
+
+        """
+        measure_index = max(self._get_measure_index(offset), 0)
+        return self.time_signatures[measure_index]
@@ -778,6 +778,7 @@ class Mutation(object):
             context = wrapper._find_correct_effective_context()
             if context is not None:
                 context._dependent_wrappers.append(wrapper)
+                context._dependent_wrapper_index = None
 
     def rewrite_meter(
         self,
@@ -3188,9 +3189,11 @@ class Mutation(object):
             raise Exception(message)
         container._components = list(selection)
         container[:]._set_parents(container)
+        container._update_child_indices()
         if parent is not None:
             parent._components.insert(start, container)
             container._set_parent(parent)
+            parent._update_child_indices(start)
         for component in selection:
             for wrapper in component._wrappers:
                 wrapper._effective_context = None
@@ -4,7 +4,7 @@ from abjad import instruments
 from abjad import typings
 from abjad.pitch.NamedPitch import NamedPitch
 from abjad.top.inspect import inspect
-from abjad.top.parse import parse
+from abjad.top.parse import _parse_leaf_string
 from abjad.utilities.Duration import Duration
 from .DrumNoteHead import DrumNoteHead
 from .Leaf import Leaf
@@ -66,10 +66,7 @@ class Note(Leaf):
 
         assert len(arguments) in (0, 1, 2)
         if len(arguments) == 1 and isinstance(arguments[0], str):
-            string = f"{{ {arguments[0]} }}"
-            parsed = parse(string)
-            assert len(parsed) == 1 and isinstance(parsed[0], Leaf)
-            arguments = tuple([parsed[0]])
+            arguments = tuple([_parse_leaf_string(arguments[0])])
         written_pitch = None
         is_cautionary = False
         is_forced = False
@@ -102,7 +99,9 @@ class Note(Leaf):
             raise ValueError("can not initialize note from {arguments!r}.")
         Leaf.__init__(self, written_duration, multiplier=multiplier, tag=tag)
         if written_pitch is not None:
-            if written_pitch not in drums:
+            if not isinstance(written_pitch, str) or (
+                written_pitch not in drums
+            ):
                 self.note_head = NoteHead(
                     written_pitch=written_pitch,
                     is_cautionary=is_cautionary,
@@ -224,10 +223,13 @@ class Note(Leaf):
         if isinstance(argument, type(None)):
             self._note_head = None
         elif isinstance(argument, NoteHead):
+            argument._client = self
             self._note_head = argument
         else:
             note_head = NoteHead(client=self, written_pitch=argument)
             self._note_head = note_head
+        self._clear_cached_format(descendants=True)
+        self._clear_cached_leaf_table()
 
     @property
     def written_duration(self) -> Duration:
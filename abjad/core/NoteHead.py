@@ -178,6 +178,11 @@ class NoteHead(object):
 
     ### PRIVATE METHODS ###
 
+    def _clear_client_caches(self):
+        if hasattr(self.client, "_clear_cached_format"):
+            self.client._clear_cached_format(descendants=True)
+            self.client._clear_cached_leaf_table()
+
     def _get_format_specification(self):
         arguments = [repr(str(self))]
         if self.tweaks:
@@ -313,6 +318,7 @@ class NoteHead(object):
             assert isinstance(argument[1], str), repr(argument)
             assert isinstance(argument[2], str), repr(argument)
         self._alternative = argument
+        self._clear_client_caches()
 
     @property
     def client(self):
@@ -362,6 +368,7 @@ class NoteHead(object):
         if argument is not None:
             argument = bool(argument)
         self._is_cautionary = argument
+        self._clear_client_caches()
 
     @property
     def is_forced(self) -> bool:
@@ -396,6 +403,7 @@ class NoteHead(object):
         if argument is not None:
             argument = bool(argument)
         self._is_forced = argument
+        self._clear_client_caches()
 
     @property
     def is_parenthesized(self) -> bool:
@@ -432,6 +440,7 @@ class NoteHead(object):
         if argument is not None:
             argument = bool(argument)
         self._is_parenthesized = argument
+        self._clear_client_caches()
 
     @property
     def named_pitch(self) -> NamedPitch:
@@ -551,5 +560,6 @@ class NoteHead(object):
     def written_pitch(self, argument):
         written_pitch = NamedPitch(argument)
         self._written_pitch = written_pitch
+        self._clear_client_caches()
         if self.alternative is not None:
             self.alternative[0].written_pitch = written_pitch
@@ -79,9 +79,15 @@ class NoteHeadList(TypedList):
 
     def _on_insertion(self, item):
         item._client = self.client
+        if self.client is not None:
+            self.client._clear_cached_format(descendants=True)
+            self.client._clear_cached_leaf_table()
 
     def _on_removal(self, item):
         item._client = None
+        if self.client is not None:
+            self.client._clear_cached_format(descendants=True)
+            self.client._clear_cached_leaf_table()
 
     ### PUBLIC METHODS ###
 
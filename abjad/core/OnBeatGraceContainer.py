@@ -212,12 +212,15 @@ class OnBeatGraceContainer(Container):
             raise TypeError(f"must attach to leaf (not {leaf!r}).")
         leaf._on_beat_grace_container = self
         self._main_leaf = leaf
+        self._update_later(offsets=True)
 
     def _detach(self):
         if self._main_leaf is not None:
             main_leaf = self._main_leaf
             main_leaf._on_beat_grace_container = None
             self._main_leaf = None
+            self._clear_cached_format(descendants=True)
+            main_leaf._update_later(offsets=True)
         return self
 
     def _format_opening_slot(self, bundle):
@@ -63,13 +63,19 @@ class Parentage(collections.abc.Sequence):
         <Staff-"Bass_Staff"{1}>
         <Score<<2>>>
 
+    Inspection caches parentage on each component; caches clear when
+    components change parent and when grace containers attach or detach.
     '''
 
     ### CLASS VARIABLES ###
 
     __documentation_section__ = "Selections"
 
-    __slots__ = ("_component", "_components")
+    __slots__ = ("_component", "_components", "_prolation")
+
+    _cache_hits = 0
+
+    _cache_misses = 0
 
     ### INITIALIZER ###
 
@@ -93,6 +99,7 @@ class Parentage(collections.abc.Sequence):
                     parent = parent._parent
             components = tuple(components)
         self._components = components
+        self._prolation = None
 
     ### SPECIAL METHODS ###
 
@@ -118,6 +125,38 @@ class Parentage(collections.abc.Sequence):
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _from_components(class_, components):
+        parentage = class_.__new__(class_)
+        parentage._component = components[0]
+        parentage._components = components
+        parentage._prolation = None
+        return parentage
+
+    @staticmethod
+    def _get_cached_parentage(component):
+        """
+        Gets parentage cached on ``component``.
+
+        Caches parentage on every uncached component in parentage, too, so
+        that components cache parentage only when every component in their
+        parentage also caches parentage.
+        """
+        parentage = component._parentage
+        if parentage is not None:
+            Parentage._cache_hits += 1
+            return parentage
+        Parentage._cache_misses += 1
+        parentage = Parentage(component)
+        components = parentage.components
+        component._parentage = parentage
+        for i in range(1, len(components)):
+            if components[i]._parentage is not None:
+                break
+            parentage_ = Parentage._from_components(components[i:])
+            components[i]._parentage = parentage_
+        return parentage
+
     @staticmethod
     def _id_string(component):
         lhs = component.__class__.__name__
@@ -400,9 +439,11 @@ class Parentage(collections.abc.Sequence):
             Multiplier(2, 3)
 
         """
-        prolations = [Multiplier(1)] + self._prolations()
-        products = mathtools.cumulative_products(prolations)
-        return products[-1]
+        if self._prolation is None:
+            prolations = [Multiplier(1)] + self._prolations()
+            products = mathtools.cumulative_products(prolations)
+            self._prolation = products[-1]
+        return self._prolation
 
     @property
     def root(self) -> Component:
@@ -455,12 +496,40 @@ class Parentage(collections.abc.Sequence):
             Voice("c'4 d'4 e'4 f'4")
 
         """
-        root = self.get(n=-1)
+        root = self.components[-1]
         assert isinstance(root, Component), repr(root)
         return root
 
     ### PUBLIC METHODS ###
 
+    @staticmethod
+    def cache_info() -> typing.Tuple[int, int]:
+        r"""
+        Gets parentage cache hits and misses.
+
+        ..  container:: example
+
+            >>> staff = abjad.Staff(r"c'4 \times 2/3 { d'8 e'8 f'8 } g'4")
+            >>> abjad.Parentage.reset_cache_info()
+            >>> abjad.inspect(staff[1][0]).parentage().prolation
+            Multiplier(2, 3)
+
+            >>> abjad.inspect(staff[1][1]).parentage().prolation
+            Multiplier(2, 3)
+
+            >>> abjad.inspect(staff[1]).parentage().prolation
+            Multiplier(2, 3)
+
+            >>> abjad.Parentage.cache_info()
+            (1, 2)
+
+        Parentage of tuplet caches together with parentage of first note in
+        tuplet.
+
+        Returns (hits, misses) pair.
+        """
+        return Parentage._cache_hits, Parentage._cache_misses
+
     def count(self, prototype=None) -> int:
         r"""
         Gets number of ``prototype`` in parentage.
@@ -1010,6 +1079,21 @@ class Parentage(collections.abc.Sequence):
         logical_voice_ = OrderedDict(logical_voice)
         return logical_voice_
 
+    @staticmethod
+    def reset_cache_info() -> None:
+        """
+        Resets parentage cache hits and misses to zero.
+
+        ..  container:: example
+
+            >>> abjad.Parentage.reset_cache_info()
+            >>> abjad.Parentage.cache_info()
+            (0, 0)
+
+        """
+        Parentage._cache_hits = 0
+        Parentage._cache_misses = 0
+
     def score_index(self) -> typing.Tuple[typing.Union[int, str], ...]:
         r"""
         Gets score index.
@@ -1,5 +1,5 @@
 from abjad import typings
-from abjad.top.parse import parse
+from abjad.top.parse import _parse_leaf_string
 from abjad.utilities.Duration import Duration
 from .Leaf import Leaf
 
@@ -45,10 +45,7 @@ class Rest(Leaf):
         if isinstance(written_duration, Leaf):
             multiplier = written_duration.multiplier
         if isinstance(written_duration, str):
-            string = f"{{ {written_duration} }}"
-            parsed = parse(string)
-            assert len(parsed) == 1 and isinstance(parsed[0], Leaf)
-            written_duration = parsed[0]
+            written_duration = _parse_leaf_string(written_duration)
         if isinstance(written_duration, Leaf):
             written_duration = written_duration.written_duration
         elif written_duration is None:
@@ -538,6 +538,7 @@ class Selection(collections.abc.Sequence):
             components.extend(getattr(component, "components", ()))
         container._components.extend(components)
         container[:]._set_parents(container)
+        container._update_child_indices()
 
     def _give_position_in_parent_to_container(self, container):
         """
@@ -552,6 +553,7 @@ class Selection(collections.abc.Sequence):
             parent._components.__setitem__(slice(start, start), [container])
             container._set_parent(parent)
             self._set_parents(None)
+            parent._update_child_indices(start)
 
     @staticmethod
     def _head_filter_subresult(result, head):
@@ -3842,14 +3844,15 @@ class Selection(collections.abc.Sequence):
             assert isinstance(component, Component)
             return component
 
+        selections = []
+        first_component = _get_first_component(self)
+        measure_map = first_component._get_measure_map()
+
         def _get_measure_number(argument):
             first_component = _get_first_component(argument)
-            assert first_component._measure_number is not None
-            return first_component._measure_number
+            start_offset = first_component._get_timespan().start_offset
+            return measure_map.measure_number(start_offset)
 
-        selections = []
-        first_component = _get_first_component(self)
-        first_component._update_measure_numbers()
         pairs = itertools.groupby(self, _get_measure_number)
         for value, group in pairs:
             selection = type(self)(group)
@@ -0,0 +1,247 @@
+import bisect
+import typing
+from abjad.indicators.MetronomeMark import MetronomeMark
+from abjad.system.StorageFormatManager import StorageFormatManager
+from abjad.utilities.Multiplier import Multiplier
+from abjad.utilities.Offset import Offset
+
+
+class TempoMap(object):
+    r"""
+    Tempo map.
+
+    ..  container:: example
+
+        >>> staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4 a'4")
+        >>> score = abjad.Score([staff])
+        >>> mark = abjad.MetronomeMark((1, 4), 60)
+        >>> abjad.attach(mark, staff[0])
+        >>> mark = abjad.MetronomeMark((1, 4), 120)
+        >>> abjad.attach(mark, staff[2])
+        >>> abjad.show(score) # doctest: +SKIP
+
+        ..  docs::
+
+            >>> abjad.f(score)
+            \new Score
+            <<
+                \new Staff
+                {
+                    \tempo 4=60
+                    c'4
+                    d'4
+                    \tempo 4=120
+                    e'4
+                    f'4
+                    g'4
+                    a'4
+                }
+            >>
+
+        >>> tempo_map = abjad.inspect(score).tempo_map()
+        >>> tempo_map.offset_to_seconds(abjad.Offset(3, 4))
+        Offset((5, 2))
+
+        >>> tempo_map.seconds_to_offset(abjad.Offset(5, 2))
+        Offset((3, 4))
+
+        >>> tempo_map.offsets_to_seconds([0, (1, 4), (1, 2), (3, 2)])
+        [Offset((0, 1)), Offset((1, 1)), Offset((2, 1)), Offset((4, 1))]
+
+    Tempo maps are cached on the root of the score and rebuilt only after
+    offsets change or metronome marks are attached or detached.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Collaborators"
+
+    __slots__ = (
+        "_clocktime_durations",
+        "_clocktime_start_offsets",
+        "_pairs",
+        "_start_offsets",
+        "_stop_offset",
+        "_stop_offsets",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        pairs: typing.Sequence[typing.Tuple[Offset, MetronomeMark]] = None,
+        stop_offset: Offset = None,
+    ) -> None:
+        pairs = [(Offset(_[0]), _[1]) for _ in pairs or ()]
+        pairs.sort(key=lambda _: _[0])
+        self._pairs = tuple(pairs)
+        if stop_offset is not None:
+            stop_offset = Offset(stop_offset)
+        elif pairs:
+            stop_offset = pairs[-1][0]
+        self._stop_offset = stop_offset
+        start_offsets, stop_offsets = [], []
+        clocktime_start_offsets, clocktime_durations = [], []
+        clocktime_start_offset = Offset(0)
+        for i, pair in enumerate(pairs):
+            start_offset, metronome_mark = pair
+            if i + 1 < len(pairs):
+                stop_offset = pairs[i + 1][0]
+            else:
+                stop_offset = self.stop_offset
+            duration = stop_offset - start_offset
+            multiplier = Multiplier(60, metronome_mark.units_per_minute)
+            clocktime_duration = duration / metronome_mark.reference_duration
+            clocktime_duration *= multiplier
+            start_offsets.append(start_offset)
+            stop_offsets.append(stop_offset)
+            clocktime_start_offsets.append(clocktime_start_offset)
+            clocktime_durations.append(clocktime_duration)
+            clocktime_start_offset += clocktime_duration
+        self._start_offsets = tuple(start_offsets)
+        self._stop_offsets = tuple(stop_offsets)
+        self._clocktime_start_offsets = tuple(clocktime_start_offsets)
+        self._clocktime_durations = tuple(clocktime_durations)
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self) -> int:
+        """
+        Gets number of metronome marks in tempo map.
+        """
+        return len(self.pairs)
+
+    def __repr__(self) -> str:
+        """
+        Gets interpreter representation.
+        """
+        return StorageFormatManager(self).get_repr_format()
+
+    ### PRIVATE METHODS ###
+
+    def _get_clocktime_offset(self, offset, i):
+        start_offset = self._start_offsets[i]
+        local_offset = offset - start_offset
+        duration = self._stop_offsets[i] - start_offset
+        multiplier = local_offset / duration
+        duration = multiplier * self._clocktime_durations[i]
+        return Offset(self._clocktime_start_offsets[i] + duration)
+
+    def _get_index(self, offset):
+        """
+        Gets index of tempo timespan with start offset less than or equal
+        to ``offset`` and stop offset greater than ``offset``.
+
+        Returns none when no such timespan exists.
+        """
+        i = bisect.bisect_right(self._start_offsets, offset) - 1
+        if 0 <= i and offset < self._stop_offsets[i]:
+            return i
+        return None
+
+    def _to_clocktime(self, offset, stop=False):
+        i = self._get_index(offset)
+        if i is not None:
+            return self._get_clocktime_offset(offset, i)
+        if stop and self.pairs and offset == self.stop_offset:
+            clocktime_offset = self._clocktime_start_offsets[-1]
+            clocktime_offset += self._clocktime_durations[-1]
+            return Offset(clocktime_offset)
+        return None
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def pairs(self) -> typing.Tuple[typing.Tuple[Offset, MetronomeMark], ...]:
+        """
+        Gets (offset, metronome mark) pairs in tempo map.
+        """
+        return self._pairs
+
+    @property
+    def stop_offset(self) -> typing.Optional[Offset]:
+        """
+        Gets stop offset of score.
+        """
+        return self._stop_offset
+
+    ### PUBLIC METHODS ###
+
+    def offset_to_seconds(self, offset) -> Offset:
+        """
+        Converts ``offset`` to seconds.
+
+        ..  container:: example
+
+            >>> pairs = [
+            ...     (abjad.Offset(0), abjad.MetronomeMark((1, 4), 60)),
+            ...     (abjad.Offset(1), abjad.MetronomeMark((1, 8), 60)),
+            ... ]
+            >>> tempo_map = abjad.TempoMap(pairs, stop_offset=2)
+            >>> tempo_map.offset_to_seconds(abjad.Offset(1, 2))
+            Offset((2, 1))
+
+            >>> tempo_map.offset_to_seconds(abjad.Offset(3, 2))
+            Offset((8, 1))
+
+            >>> tempo_map.offset_to_seconds(abjad.Offset(2))
+            Offset((12, 1))
+
+        Raises value error when ``offset`` falls outside tempo map.
+        """
+        offset = Offset(offset)
+        result = self._to_clocktime(offset, stop=True)
+        if result is None:
+            raise ValueError(f"offset {offset!r} not in tempo map.")
+        return result
+
+    def offsets_to_seconds(self, offsets) -> typing.List[Offset]:
+        """
+        Converts ``offsets`` to seconds.
+
+        ..  container:: example
+
+            >>> pairs = [
+            ...     (abjad.Offset(0), abjad.MetronomeMark((1, 4), 60)),
+            ...     (abjad.Offset(1), abjad.MetronomeMark((1, 8), 60)),
+            ... ]
+            >>> tempo_map = abjad.TempoMap(pairs, stop_offset=2)
+            >>> tempo_map.offsets_to_seconds([0, (1, 2), 1, (3, 2)])
+            [Offset((0, 1)), Offset((2, 1)), Offset((4, 1)), Offset((8, 1))]
+
+        Returns list.
+        """
+        return [self.offset_to_seconds(_) for _ in offsets]
+
+    def seconds_to_offset(self, seconds) -> Offset:
+        """
+        Converts ``seconds`` to offset.
+
+        ..  container:: example
+
+            >>> pairs = [
+            ...     (abjad.Offset(0), abjad.MetronomeMark((1, 4), 60)),
+            ...     (abjad.Offset(1), abjad.MetronomeMark((1, 8), 60)),
+            ... ]
+            >>> tempo_map = abjad.TempoMap(pairs, stop_offset=2)
+            >>> tempo_map.seconds_to_offset(2)
+            Offset((1, 2))
+
+            >>> tempo_map.seconds_to_offset(8)
+            Offset((3, 2))
+
+        Raises value error when ``seconds`` falls outside tempo map.
+        """
+        seconds = Offset(seconds)
+        if not self.pairs or seconds < 0:
+            raise ValueError(f"seconds {seconds!r} not in tempo map.")
+        i = bisect.bisect_right(self._clocktime_start_offsets, seconds) - 1
+        local_seconds = seconds - self._clocktime_start_offsets[i]
+        clocktime_duration = self._clocktime_durations[i]
+        if clocktime_duration < local_seconds:
+            raise ValueError(f"seconds {seconds!r} not in tempo map.")
+        if clocktime_duration == 0:
+            return self._start_offsets[i]
+        duration = self._stop_offsets[i] - self._start_offsets[i]
+        multiplier = local_seconds / clocktime_duration
+        return Offset(self._start_offsets[i] + multiplier * duration)
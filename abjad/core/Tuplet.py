@@ -406,6 +406,7 @@ class Tuplet(Container):
         elif not isinstance(argument, type(None)):
             raise TypeError(argument)
         self._denominator = argument
+        self._clear_cached_format()
 
     @property
     def force_fraction(self) -> typing.Optional[bool]:
@@ -589,6 +590,7 @@ class Tuplet(Container):
     def force_fraction(self, argument):
         if isinstance(argument, (bool, type(None))):
             self._force_fraction = argument
+            self._clear_cached_format()
         else:
             message = f"force fraction must be boolean (not {argument!r})."
             raise TypeError(message)
@@ -667,6 +669,7 @@ class Tuplet(Container):
     def hide(self, argument):
         assert isinstance(argument, (bool, type(None))), repr(argument)
         self._hide = argument
+        self._clear_cached_format()
 
     @property
     def implied_prolation(self) -> Multiplier:
@@ -749,6 +752,10 @@ class Tuplet(Container):
             raise ValueError(message)
         if 0 < rational:
             self._multiplier = rational
+            for component in iterate(self).components():
+                component._offsets_are_current = False
+                component._parentage = None
+            self._update_later(offsets=True)
         else:
             message = f"tuplet multiplier must be positive: {argument!r}."
             raise ValueError(message)
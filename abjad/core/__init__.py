@@ -18,9 +18,11 @@ from .Inspection import Inspection
 from .Iteration import Iteration
 from .Label import Label
 from .LeafMaker import LeafMaker
+from .LeafTable import LeafTable
 from .Lineage import Lineage
 from .Selection import Selection
 from .LogicalTie import LogicalTie
+from .MeasureMap import MeasureMap
 from .MultimeasureRest import MultimeasureRest
 from .Mutation import Mutation
 from .Note import Note
@@ -33,6 +35,7 @@ from .Score import Score
 from .Skip import Skip
 from .Staff import Staff
 from .StaffGroup import StaffGroup
+from .TempoMap import TempoMap
 from .TremoloContainer import TremoloContainer
 from .Tuplet import Tuplet
 from .VerticalMoment import VerticalMoment
@@ -120,6 +120,8 @@ class TimeSignature(object):
 
     _format_slot = "opening"
 
+    _mutates_measure_map = True
+
     _persistent = True
 
     ### INITIALIZER ###
@@ -143,33 +143,7 @@ class Block(object):
     ### PRIVATE METHODS ###
 
     def _format_item(self, item, depth=1):
-        indent = LilyPondFormatManager.indent * depth
-        result = []
-        if isinstance(item, (list, tuple)):
-            result.append(indent + "{")
-            depth_ = depth + 1
-            for x in item:
-                pieces = self._format_item(x, depth=depth_)
-                result.extend(pieces)
-            result.append(indent + "}")
-        elif isinstance(item, str):
-            if item.isspace():
-                string = ""
-            else:
-                string = indent + item
-            result.append(string)
-        elif "_get_format_pieces" in dir(item):
-            try:
-                pieces = item._get_format_pieces()
-            except TypeError:
-                pieces = item._get_format_pieces()
-            for piece in pieces:
-                if piece.isspace():
-                    piece = ""
-                else:
-                    piece = indent + piece
-                result.append(piece)
-        return result
+        return list(self._iterate_item_pieces(item, depth=depth))
 
     def _formatted_context_blocks(self):
         from .ContextBlock import ContextBlock
@@ -184,48 +158,9 @@ class Block(object):
         return result
 
     def _get_format_pieces(self, tag=None):
-        from abjad.core.Leaf import Leaf
-        from abjad.markups import Markup
-        from .ContextBlock import ContextBlock
-
-        indent = LilyPondFormatManager.indent
-        result = []
-        if (
-            not self._get_formatted_user_attributes()
-            and not getattr(self, "contexts", None)
-            and not getattr(self, "context_blocks", None)
-            and not len(self.items)
-        ):
-            if self.name == "score":
-                return ""
-            string = f"{self._escaped_name} {{}}"
-            result.append(string)
-            return result
-        string = f"{self._escaped_name} {{"
-        if tag is not None:
-            strings = LilyPondFormatManager.tag([string], tag=tag)
-            string = strings[0]
-        result.append(string)
-        for item in self.items:
-            if isinstance(item, ContextBlock):
-                continue
-            if isinstance(item, (Leaf, Markup)):
-                item = [item]
-            result.extend(self._format_item(item))
-        formatted_attributes = self._get_formatted_user_attributes()
-        formatted_attributes = [indent + _ for _ in formatted_attributes]
-        result.extend(formatted_attributes)
-        formatted_context_blocks = self._formatted_context_blocks()
-        formatted_context_blocks = [
-            indent + _ for _ in formatted_context_blocks
-        ]
-        result.extend(formatted_context_blocks)
-        string = "}"
-        if tag is not None:
-            strings = LilyPondFormatManager.tag([string], tag=tag)
-            string = strings[0]
-        result.append(string)
-
+        result = list(self._iterate_format_pieces(tag=tag))
+        if not result:
+            return ""
         return result
 
     def _get_format_specification(self):
@@ -272,6 +207,76 @@ class Block(object):
     def _get_lilypond_format(self, tag=None):
         return "\n".join(self._get_format_pieces(tag=tag))
 
+    def _iterate_format_pieces(self, tag=None, stream=None):
+        from abjad.core.Leaf import Leaf
+        from abjad.markups import Markup
+        from .ContextBlock import ContextBlock
+
+        indent = LilyPondFormatManager.indent
+        if (
+            not self._get_formatted_user_attributes()
+            and not getattr(self, "contexts", None)
+            and not getattr(self, "context_blocks", None)
+            and not len(self.items)
+        ):
+            if self.name == "score":
+                return
+            yield f"{self._escaped_name} {{}}"
+            return
+        string = f"{self._escaped_name} {{"
+        if tag is not None:
+            strings = LilyPondFormatManager.tag([string], tag=tag)
+            string = strings[0]
+        yield string
+        for item in self.items:
+            if isinstance(item, ContextBlock):
+                continue
+            if isinstance(item, (Leaf, Markup)):
+                item = [item]
+            yield from self._iterate_item_pieces(item, stream=stream)
+        for string in self._get_formatted_user_attributes():
+            yield indent + string
+        for string in self._formatted_context_blocks():
+            yield indent + string
+        string = "}"
+        if tag is not None:
+            strings = LilyPondFormatManager.tag([string], tag=tag)
+            string = strings[0]
+        yield string
+
+    def _iterate_item_pieces(self, item, depth=1, stream=None):
+        from abjad.core.Container import Container
+
+        indent = LilyPondFormatManager.indent * depth
+        if isinstance(item, (list, tuple)):
+            yield indent + "{"
+            depth_ = depth + 1
+            for x in item:
+                yield from self._iterate_item_pieces(
+                    x, depth=depth_, stream=stream
+                )
+            yield indent + "}"
+        elif isinstance(item, str):
+            if item.isspace():
+                string = ""
+            else:
+                string = indent + item
+            yield string
+        elif "_get_format_pieces" in dir(item):
+            if stream is True and isinstance(item, Container):
+                pieces = item._iterate_format_contributions()
+            else:
+                try:
+                    pieces = item._get_format_pieces()
+                except TypeError:
+                    pieces = item._get_format_pieces()
+            for piece in pieces:
+                if piece.isspace():
+                    piece = ""
+                else:
+                    piece = indent + piece
+                yield piece
+
     ### PUBLIC PROPERTIES ###
 
     @property
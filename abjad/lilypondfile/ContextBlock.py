@@ -122,6 +122,9 @@ class ContextBlock(Block):
         result.append("}")
         return result
 
+    def _iterate_format_pieces(self, tag=None, stream=None):
+        yield from self._get_format_pieces(tag=tag)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -1,6 +1,7 @@
 import collections
 import copy
 import inspect
+import itertools
 import pathlib
 import typing
 from abjad.indicators.LilyPondLiteral import LilyPondLiteral
@@ -475,7 +476,7 @@ class LilyPondFile(object):
 
     ### PRIVATE METHODS ###
 
-    def _get_format_pieces(self, tag=None):
+    def _get_format_pieces(self, tag=None, blocks=True):
         result = []
         if self.date_time_token is not None:
             string = f"% {self.date_time_token}"
@@ -500,6 +501,8 @@ class LilyPondFile(object):
         postincludes.extend(self._get_formatted_includes())
         postincludes.extend(self._get_formatted_scheme_settings())
         result.extend(postincludes)
+        if not blocks:
+            return result
         result.extend(self._get_formatted_blocks())
         return result
 
@@ -510,18 +513,8 @@ class LilyPondFile(object):
 
     def _get_formatted_blocks(self):
         result = []
-        for item in self.items:
-            if "_get_lilypond_format" in dir(item) and not isinstance(
-                item, str
-            ):
-                try:
-                    string = item._get_lilypond_format(tag=self.tag)
-                except TypeError:
-                    string = item._get_lilypond_format()
-                if string:
-                    result.append(string)
-            else:
-                result.append(str(item))
+        for pieces in self._iterate_formatted_blocks():
+            result.append("\n".join(pieces))
         return result
 
     def _get_formatted_comments(self):
@@ -579,6 +572,46 @@ class LilyPondFile(object):
     def _get_lilypond_format(self):
         return "\n\n".join(self._get_format_pieces())
 
+    def _iterate_formatted_blocks(self, stream=None):
+        for item in self.items:
+            if isinstance(item, Block):
+                pieces = item._iterate_format_pieces(
+                    tag=self.tag, stream=stream
+                )
+                piece = next(pieces, None)
+                if piece is not None:
+                    yield itertools.chain([piece], pieces)
+            elif "_get_lilypond_format" in dir(item) and not isinstance(
+                item, str
+            ):
+                try:
+                    string = item._get_lilypond_format(tag=self.tag)
+                except TypeError:
+                    string = item._get_lilypond_format()
+                if string:
+                    yield [string]
+            else:
+                yield [str(item)]
+
+    def _iterate_lilypond_format_pieces(self):
+        """
+        Iterates LilyPond format of LilyPond file one piece at a time.
+
+        Joining pieces with newlines gives ``format(self, 'lilypond')``;
+        formats one block item at a time.
+        """
+        first = True
+        for piece in self._get_format_pieces(blocks=False):
+            if not first:
+                yield ""
+            yield piece
+            first = False
+        for pieces in self._iterate_formatted_blocks(stream=True):
+            if not first:
+                yield ""
+            yield from pieces
+            first = False
+
     @staticmethod
     def _make_global_context_block(
         font_size=3, minimum_distance=10, padding=4
@@ -366,7 +366,7 @@ class Meter(object):
             increase_monotonic = argument.increase_monotonic
         elif isinstance(argument, (str, rhythmtrees.RhythmTreeContainer)):
             if isinstance(argument, str):
-                parsed = rhythmtrees.RhythmTreeParser()(argument)
+                parsed = rhythmtrees._rhythm_tree_parser(argument)
                 assert len(parsed) == 1
                 root = parsed[0]
             else:
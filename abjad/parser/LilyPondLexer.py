@@ -0,0 +1,227 @@
+import re
+import typing
+from ply import lex  # type: ignore
+
+
+class LilyPondLexer(lex.Lexer):
+    """
+    LilyPond lexer.
+
+    Lexes with one compiled alternation of named groups per lexer state.
+    Reads the pattern and function of each rule from a PLY lexer built from
+    ``LilyPondLexicalDefinition``; dispatches on the name of the matching
+    group.
+
+    Resolves note names and keywords from tables precomputed from
+    ``abjad.ly.language_pitch_names``, ``abjad.ly.drums`` and the keywords
+    of ``LilyPondLexicalDefinition``. Discards whitespace and comments
+    without calling rule functions. Calls rule functions for all other
+    tokens, as PLY does.
+
+    Not composer-safe.
+
+    Used internally by ``LilyPondParser``. Set ``ply_lexer=True`` when
+    initializing ``LilyPondParser`` to lex with PLY instead.
+    """
+
+    ### CLASS VARIABLES ###
+
+    _discarded_rule_names = (
+        "t_ANY_165",
+        "t_INITIAL_markup_notes_214",
+        "t_INITIAL_markup_notes_214_EOF",
+        "t_INITIAL_markup_notes_216",
+        "t_INITIAL_markup_notes_218",
+        "t_INITIAL_markup_notes_220",
+        "t_INITIAL_markup_notes_222",
+        "t_longcomment_291",
+        "t_longcomment_293",
+    )
+
+    _keyword_rule_names = ("t_INITIAL_646", "t_notes_421")
+
+    _keyword_table: typing.Dict = {}
+
+    _note_word_rule_names = ("t_notes_417",)
+
+    _note_word_tables: typing.Dict = {}
+
+    ### INITIALIZER ###
+
+    def __init__(self, lexer=None, client=None):
+        lex.Lexer.__init__(self)
+        if lexer is not None:
+            self.__dict__.update(lexer.__dict__)
+        self._client = client
+        self._note_word_table = None
+        self._pitch_names = None
+        self._compile_states()
+        if self.lexstate in self._rules_by_state:
+            self.begin(self.lexstate)
+
+    ### PRIVATE METHODS ###
+
+    def _compile_states(self):
+        self._rules_by_state = {}
+        for state, chunks in self.lexstatere.items():
+            patterns, rules = [], {}
+            for regex, functions in chunks:
+                patterns.append(regex.pattern)
+                for name, index in regex.groupindex.items():
+                    function, type_ = functions[index]
+                    if name in self._discarded_rule_names:
+                        kind = "discard"
+                    elif name in self._keyword_rule_names:
+                        kind = "keyword"
+                    elif name in self._note_word_rule_names:
+                        kind = "note word"
+                    elif function is not None:
+                        kind = "function"
+                    elif type_ is not None:
+                        kind = "token"
+                    else:
+                        kind = "discard"
+                    rules[name] = (kind, function, type_)
+            # literals match only where no rule matches, as in PLY
+            if self.lexliterals:
+                literals = "".join(re.escape(_) for _ in self.lexliterals)
+                patterns.append("(?P<literal>[{}])".format(literals))
+                rules["literal"] = ("literal", None, None)
+            regex = re.compile("|".join(patterns), self.lexreflags)
+            self._rules_by_state[state] = (regex, rules)
+        if not LilyPondLexer._keyword_table:
+            from .LilyPondLexicalDefinition import LilyPondLexicalDefinition
+
+            keywords = LilyPondLexicalDefinition.keywords
+            for word, type_ in keywords.items():
+                if type_ not in ("MARKUP", "WITH"):
+                    LilyPondLexer._keyword_table[word] = type_
+
+    def _get_note_word_table(self):
+        pitch_names = self._client._pitch_names
+        if pitch_names is self._pitch_names:
+            return self._note_word_table
+        from abjad.ly.drums import drums
+        from abjad.ly.language_pitch_names import language_pitch_names
+
+        for language, language_pitch_names_ in language_pitch_names.items():
+            if language_pitch_names_ is pitch_names:
+                break
+        else:
+            language = None
+        table = LilyPondLexer._note_word_tables.get(language)
+        if table is None:
+            table = {
+                "r": ("RESTNAME", "r"),
+                "s": ("RESTNAME", "s"),
+                "R": ("MULTI_MEASURE_REST", "R"),
+            }
+            for word, pitch in drums.items():
+                table[word] = ("NOTENAME_PITCH", pitch)
+            for word, pitch in pitch_names.items():
+                table[word] = ("NOTENAME_PITCH", pitch)
+            if language is not None:
+                LilyPondLexer._note_word_tables[language] = table
+        self._note_word_table = table
+        self._pitch_names = pitch_names
+        return table
+
+    def _handle_error(self, lexpos):
+        character = self.lexdata[lexpos]
+        if self.lexerrorf is None:
+            message = "Illegal character {!r} at index {}."
+            message = message.format(character, lexpos)
+            raise lex.LexError(message, self.lexdata[lexpos:])
+        token = lex.LexToken()
+        token.type = "error"
+        token.value = self.lexdata[lexpos:]
+        token.lineno = self.lineno
+        token.lexpos = lexpos
+        token.lexer = self
+        self.lexpos = lexpos
+        token = self.lexerrorf(token)
+        if lexpos == self.lexpos:
+            message = "Scanning error. Illegal character {!r}."
+            message = message.format(character)
+            raise lex.LexError(message, self.lexdata[lexpos:])
+        return token
+
+    ### PUBLIC METHODS ###
+
+    def begin(self, state):
+        """
+        Begins lexing in ``state``.
+
+        Returns none.
+        """
+        lex.Lexer.begin(self, state)
+        self._regex, self._rules = self._rules_by_state[state]
+
+    def clone(self, object=None):
+        """
+        Clones lexer; binds rule functions to ``object`` when ``object`` is
+        not none.
+
+        Returns new lexer.
+        """
+        lexer = lex.Lexer.clone(self, object)
+        if object is not None:
+            lexer._compile_states()
+            lexer.begin(lexer.lexstate)
+        return lexer
+
+    def token(self):
+        """
+        Gets next token.
+
+        Returns PLY token or none at end of input.
+        """
+        lexdata, lexlen, lexpos = self.lexdata, self.lexlen, self.lexpos
+        regex, rules, lexignore = self._regex, self._rules, self.lexignore
+        while lexpos < lexlen:
+            if lexdata[lexpos] in lexignore:
+                lexpos += 1
+                continue
+            match = regex.match(lexdata, lexpos)
+            if match is None:
+                token = self._handle_error(lexpos)
+                if token is not None:
+                    return token
+                lexpos = self.lexpos
+                regex, rules = self._regex, self._rules
+                lexignore = self.lexignore
+                continue
+            kind, function, type_ = rules[match.lastgroup]
+            if kind == "discard":
+                lexpos = match.end()
+                continue
+            token = lex.LexToken()
+            token.type = type_
+            token.value = value = match.group()
+            token.lineno = self.lineno
+            token.lexpos = lexpos
+            self.lexpos = match.end()
+            if kind == "token":
+                return token
+            elif kind == "literal":
+                token.type = value
+                return token
+            elif kind == "note word":
+                entry = self._get_note_word_table().get(value)
+                if entry is not None:
+                    token.type, token.value = entry
+                    return token
+            elif kind == "keyword":
+                type_ = self._keyword_table.get(value)
+                if type_ is not None:
+                    token.type = type_
+                    return token
+            token.lexer = self
+            self.lexmatch = match
+            token = function(token)
+            if token is not None:
+                return token
+            lexpos = self.lexpos
+            regex, rules, lexignore = self._regex, self._rules, self.lexignore
+        self.lexpos = lexpos
+        return None
@@ -19,6 +19,7 @@ class LilyPondLexicalDefinition(object):
 
     def __init__(self, client=None):
         self.client = client
+        self._scheme_parser = None
 
     states = (
         # lexer.ll:115
@@ -409,11 +410,17 @@ class LilyPondLexicalDefinition(object):
 
         # t.type = 'SCHEME_START'
         # t.lexer.push_state('INITIAL')
-        scheme_parser = abjad_parser.SchemeParser(debug=False)
-        input_string = t.lexer.lexdata[t.lexpos + 1 :]
+        if self._scheme_parser is None:
+            self._scheme_parser = abjad_parser.SchemeParser(debug=False)
+        scheme_parser = self._scheme_parser
+        # scheme lexer starts after hash; copies no input
+        scheme_parser.lexer.input(t.lexer.lexdata)
+        scheme_parser.lexer.lexpos = t.lexpos + 1
+        scheme_parser.lexer.lexstatestack = []
+        scheme_parser.lexer.begin("INITIAL")
         # print 'PREPARSE'
         try:
-            scheme_parser(input_string)
+            scheme_parser(None)
         except exceptions.SchemeParserFinishedError:
             result = scheme_parser.result
             cursor_end = scheme_parser.cursor_end
@@ -9,6 +9,7 @@ from abjad import pitch as abjad_pitch
 from abjad import core
 from abjad.system.Parser import Parser
 from ._parse import _parse
+from ._parse import _parse_incrementally
 from ._parse_debug import _parse_debug
 from abjad.top.annotate import annotate
 from abjad.top.attach import attach
@@ -21,6 +22,7 @@ from abjad.top.sequence import sequence
 # apply monkey patch
 ply.yacc.LRParser._lilypond_patch_parse = _parse
 ply.yacc.LRParser._lilypond_patch_parse_debug = _parse_debug
+ply.yacc.LRParser._lilypond_patch_parse_incrementally = _parse_incrementally
 
 
 class LilyPondParser(Parser):
@@ -330,12 +332,14 @@ class LilyPondParser(Parser):
         "_default_duration",
         "_default_language",
         "_guile",
+        "_is_parsing_incrementally",
         "_language_pitch_names",
         "_last_chord",
         "_lexdef",
         "_markup_functions",
         "_markup_list_functions",
         "_pitch_names",
+        "_ply_lexer",
         "_repeated_chords",
         "_scope_stack",
         "_syndef",
@@ -343,7 +347,9 @@ class LilyPondParser(Parser):
 
     ### INITIALIZER ###
 
-    def __init__(self, default_language="english", debug=False):
+    def __init__(
+        self, default_language="english", debug=False, ply_lexer=False
+    ):
         from abjad import parser as abjad_parser
         from abjad.ly.current_module import current_module
         from abjad.ly.language_pitch_names import language_pitch_names
@@ -361,6 +367,8 @@ class LilyPondParser(Parser):
         # attach parser and lexer rules
         self._lexdef = abjad_parser.LilyPondLexicalDefinition(self)
         self._syndef = abjad_parser.LilyPondSyntacticalDefinition(self)
+        self._is_parsing_incrementally = False
+        self._ply_lexer = bool(ply_lexer)
 
         # build PLY parser and lexer
         Parser.__init__(self, debug=debug)
@@ -375,14 +383,15 @@ class LilyPondParser(Parser):
 
         Returns Abjad components.
         """
+        self._check_not_parsing_incrementally()
         self._reset_parser_variables()
         if self._debug:
-            result = self._parser._lilypond_patch_parse_debug(
-                input_string, lexer=self._lexer, debug=self._logger
+            result = self.parser._lilypond_patch_parse_debug(
+                input_string, lexer=self.lexer, debug=self._logger
             )
         else:
-            result = self._parser._lilypond_patch_parse(
-                input_string, lexer=self._lexer
+            result = self.parser._lilypond_patch_parse(
+                input_string, lexer=self.lexer
             )
         return result
 
@@ -414,6 +423,12 @@ class LilyPondParser(Parser):
             token.lineno = 0
             self._push_extra_token(token)
 
+    def _check_not_parsing_incrementally(self):
+        if self._is_parsing_incrementally:
+            message = "can not parse while incremental parse is active;"
+            message += " exhaust or close generator first."
+            raise Exception(message)
+
     def _construct_context_specced_music(
         self, context, optional_id, optional_context_mod, music
     ):
@@ -571,6 +586,14 @@ class LilyPondParser(Parser):
             "symbol?": lambda x: True,
         }
 
+    def _make_lexer(self):
+        from abjad import parser as abjad_parser
+
+        lexer = Parser._make_lexer(self)
+        if self._ply_lexer:
+            return lexer
+        return abjad_parser.LilyPondLexer(lexer, self)
+
     def _pop_variable_scope(self):
         if self._scope_stack:
             self._scope_stack.pop()
@@ -646,7 +669,7 @@ class LilyPondParser(Parser):
             pass
         self._scope_stack = [{}]
         self._chord_pitch_orders = {}
-        self._lexer.push_state("notes")
+        self.lexer.push_state("notes")
         self._default_duration = abjad_parser.LilyPondDuration((1, 4), None)
         self._last_chord = None
         # LilyPond's default!
@@ -1329,6 +1352,66 @@ class LilyPondParser(Parser):
             music_functions.append(name)
         return sorted(music_functions)
 
+    def parse_incrementally(self, input_) -> typing.Generator:
+        r"""
+        Parses LilyPond ``input_`` incrementally.
+
+        ..  container:: example
+
+            Yields top-level expressions one at a time:
+
+            >>> string = r'''
+            ... \header { title = "Etudes" }
+            ... etude = { c'4 d'4 }
+            ... \score { \new Staff \etude }
+            ... { e'4 f'4 }
+            ... '''
+            >>> parser = abjad.parser.LilyPondParser()
+            >>> for expression in parser.parse_incrementally(string):
+            ...     expression
+            ...
+            <Block(name='header')>
+            <Block(name='score')>
+            Container("e'4 f'4")
+
+        ..  container:: example
+
+            Reads file objects:
+
+            >>> import io
+            >>> file_pointer = io.StringIO(string)
+            >>> expressions = parser.parse_incrementally(file_pointer)
+            >>> next(expressions)
+            <Block(name='header')>
+
+            Stops parsing when caller stops iterating:
+
+            >>> expressions.close()
+
+        ``input_`` is a string or a file object.
+
+        Yields each top-level expression (blocks, music expressions, markup)
+        as soon as the expression parses; holds no other parsed top-level
+        expressions. Assignments define variables for later expressions and
+        yield nothing, as when calling parser.
+
+        Raises exception when parser is called, or parses incrementally
+        again, before generator is exhausted or closed.
+
+        Returns generator.
+        """
+        self._check_not_parsing_incrementally()
+        if hasattr(input_, "read"):
+            input_ = input_.read()
+        self._reset_parser_variables()
+        self._is_parsing_incrementally = True
+        try:
+            yield from self.parser._lilypond_patch_parse_incrementally(
+                input_, lexer=self.lexer, expressions=[]
+            )
+        finally:
+            self._is_parsing_incrementally = False
+
     @classmethod
     def register_markup_function(class_, name, signature, undo=None) -> None:
         r"""
@@ -1747,7 +1747,12 @@ class LilyPondSyntacticalDefinition(object):
 
     def p_lilypond__lilypond__toplevel_expression(self, p):
         "lilypond : lilypond toplevel_expression"
-        p[0] = p[1] + [p[2]]
+        expressions = getattr(p, "expressions", None)
+        if expressions is not None:
+            expressions.append(p[2])
+        else:
+            p[1].append(p[2])
+        p[0] = p[1]
 
     ### lilypond_header ###
 
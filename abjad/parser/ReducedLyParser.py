@@ -1,3 +1,5 @@
+import re
+import typing
 from abjad import Left, Right
 from abjad import indicators
 from abjad import utilities
@@ -169,15 +171,69 @@ class ReducedLyParser(Parser):
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("_default_duration", "_toplevel_component_count")
+    __slots__ = (
+        "_default_duration",
+        "_leaf_indicator_classes",
+        "_toplevel_component_count",
+    )
+
+    _pitch_class_names: typing.Dict = {}
+
+    _post_event_classes = {
+        "[": indicators.StartBeam,
+        "]": indicators.StopBeam,
+        "(": indicators.StartSlur,
+        ")": indicators.StopSlur,
+        "~": indicators.Tie,
+    }
+
+    # same tokens, in same order, as PLY lexer rules below
+    _token_regex = re.compile(
+        r"""
+        [ \t\r\n]*
+        (?:
+            (?P<FRACTION>[1-9]\d*/[1-9]\d*)
+            | (?P<INTEGER_N>-[1-9]\d*)
+            | (?P<INTEGER_P>[1-9]\d*)
+            | (?P<PITCHNAME>[a-g](?:ff|ss|f|s|tqf|tqs|qs|qf)?)
+            | (?P<SYMBOL>[\[\]<>.()|'{},r~])
+        )
+        """,
+        re.VERBOSE,
+    )
 
     ### INITIALIZER ###
 
     def __init__(self, debug=False):
         self._default_duration = utilities.Duration((1, 4))
+        self._leaf_indicator_classes = None
         self._toplevel_component_count = None
         Parser.__init__(self, debug=debug)
 
+    ### SPECIAL METHODS ###
+
+    def __call__(self, string):
+        """
+        Parses ``string``.
+
+        Parses with recursive descent. Parses with PLY in debug mode and when
+        recursive descent fails, to report errors as PLY does.
+
+        Returns Abjad component.
+        """
+        if not self.debug:
+            self._setup()
+            try:
+                result = self._parse_recursively(string)
+            except Exception:
+                # PLY parser raises exception or recovers from error
+                result = None
+            finally:
+                self._leaf_indicator_classes = None
+            if result is not None:
+                return result
+        return Parser.__call__(self, string)
+
     ### LEX SETUP ###
 
     tokens = (
@@ -634,10 +690,179 @@ class ReducedLyParser(Parser):
             return annotations[0]["post events"]
         return {}
 
+    def _parse_component(self, tokens, i):
+        type_, value = tokens[i]
+        if type_ == "{":
+            # PLY parser reads FRACTION here as fixed-duration container
+            if tokens[i + 1][0] == "FRACTION":
+                return None
+            return self._parse_container(tokens, i)
+        if type_ == "FRACTION":
+            result = self._parse_container(tokens, i + 1)
+            if result is None:
+                return None
+            container, i = result
+            leaves = container[:]
+            container[:] = []
+            fraction = self._parse_fraction(value)
+            return core.Tuplet(fraction, leaves), i
+        return self._parse_leaf(tokens, i)
+
+    def _parse_components(self, tokens, i, stop):
+        components = []
+        while tokens[i][0] != stop:
+            result = self._parse_component(tokens, i)
+            if result is None:
+                return None
+            component, i = result
+            components.append(component)
+        return components, i + 1
+
+    def _parse_container(self, tokens, i):
+        if tokens[i][0] != "{":
+            return None
+        result = self._parse_components(tokens, i + 1, "}")
+        if result is None:
+            return None
+        components, i = result
+        container = core.Container()
+        for component in components:
+            container.append(component)
+        return container, i
+
+    def _parse_duration(self, tokens, i):
+        duration_log = tokens[i][1]
+        i += 1
+        dots = ""
+        while tokens[i][0] == ".":
+            dots += "."
+            i += 1
+        string = f"{abs(int(duration_log))}{dots}"
+        duration = utilities.Duration.from_lilypond_duration_string(string)
+        self._default_duration = duration
+        return duration, i
+
+    def _parse_fraction(self, string):
+        numerator, denominator = string.split("/")
+        return mathtools.NonreducedFraction(int(numerator), int(denominator))
+
+    def _parse_leaf(self, tokens, i):
+        type_ = tokens[i][0]
+        if type_ == "<":
+            i += 1
+            pitches = []
+            while tokens[i][0] == "PITCHNAME":
+                pitch, i = self._parse_pitch(tokens, i)
+                pitches.append(pitch)
+            if not pitches or tokens[i][0] != ">":
+                return None
+            duration, i = self._parse_optional_duration(tokens, i + 1)
+            leaf = core.Chord(pitches, duration)
+        elif type_ == "PITCHNAME":
+            pitch, i = self._parse_pitch(tokens, i)
+            duration, i = self._parse_optional_duration(tokens, i)
+            leaf = core.Note(pitch, duration)
+        elif type_ == "INTEGER_P":
+            duration, i = self._parse_duration(tokens, i)
+            leaf = core.Note(0, duration)
+        elif type_ == "RESTNAME":
+            duration, i = self._parse_optional_duration(tokens, i + 1)
+            leaf = core.Rest(duration)
+        elif type_ == "INTEGER_N":
+            duration, i = self._parse_duration(tokens, i)
+            leaf = core.Rest(duration)
+        else:
+            return None
+        indicator_classes = []
+        while tokens[i][0] in self._post_event_classes:
+            indicator_class = self._post_event_classes[tokens[i][0]]
+            if indicator_class not in indicator_classes:
+                indicator_classes.append(indicator_class)
+            i += 1
+        if indicator_classes:
+            self._leaf_indicator_classes.append((leaf, indicator_classes))
+        return leaf, i
+
+    def _parse_measure(self, tokens, i):
+        if tokens[i + 1][0] != "FRACTION":
+            return None
+        fraction = self._parse_fraction(tokens[i + 1][1])
+        result = self._parse_components(tokens, i + 2, "|")
+        if result is None:
+            return None
+        components, i = result
+        measure = core.Container()
+        for x in components:
+            measure.append(x)
+        leaf = inspect(measure).leaf(0)
+        time_signature = indicators.TimeSignature(fraction.pair)
+        attach(time_signature, leaf)
+        return measure, i
+
+    def _parse_optional_duration(self, tokens, i):
+        if tokens[i][0] == "INTEGER_P":
+            return self._parse_duration(tokens, i)
+        return self._default_duration, i
+
+    def _parse_pitch(self, tokens, i):
+        name = tokens[i][1]
+        if name not in self._pitch_class_names:
+            pitch_class = abjad_pitch.NamedPitchClass(name)
+            self._pitch_class_names[name] = str(pitch_class)
+        name = self._pitch_class_names[name]
+        i += 1
+        type_ = tokens[i][0]
+        while type_ in ("'", ",") and tokens[i][0] == type_:
+            name += type_
+            i += 1
+        return abjad_pitch.NamedPitch(name), i
+
+    def _parse_recursively(self, string):
+        tokens = self._tokenize(string)
+        if tokens is None:
+            return None
+        self._leaf_indicator_classes = []
+        parsed, i = [], 0
+        while tokens[i][0] != "$end":
+            if tokens[i][0] == "|":
+                result = self._parse_measure(tokens, i)
+            else:
+                result = self._parse_component(tokens, i)
+            if result is None:
+                return None
+            component, i = result
+            parsed.append(component)
+        self._toplevel_component_count = len(parsed)
+        container = core.Container()
+        for x in parsed:
+            container.append(x)
+        for leaf, indicator_classes in self._leaf_indicator_classes:
+            for indicator_class in indicator_classes:
+                attach(indicator_class(), leaf)
+        if 1 < self._toplevel_component_count:
+            return container
+        return container[0]
+
     def _setup(self):
         self._toplevel_component_count = 0
         self._default_duration = utilities.Duration((1, 4))
 
+    def _tokenize(self, string):
+        tokens, i = [], 0
+        match = self._token_regex.match(string, i)
+        while match is not None:
+            type_ = match.lastgroup
+            value = match.group(type_)
+            if type_ == "SYMBOL":
+                type_ = "RESTNAME" if value == "r" else value
+            tokens.append((type_, value))
+            i = match.end()
+            match = self._token_regex.match(string, i)
+        if string[i:].strip(" \t\r\n"):
+            return None
+        tokens.append(("$end", None))
+        return tokens
+
     ### PUBLIC PROPERTIES ###
 
     @property
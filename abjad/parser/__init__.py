@@ -9,6 +9,7 @@ from .LilyPondDuration import LilyPondDuration
 from .LilyPondEvent import LilyPondEvent
 from .LilyPondFraction import LilyPondFraction
 from .LilyPondGrammarGenerator import LilyPondGrammarGenerator
+from .LilyPondLexer import LilyPondLexer
 from .LilyPondLexicalDefinition import LilyPondLexicalDefinition
 from ._parse import _parse
 from ._parse_debug import _parse_debug
@@ -10,6 +10,37 @@ from ply.yacc import (  # type: ignore
 def _parse(
     self, input=None, lexer=None, debug=None, tracking=0, tokenfunc=None
 ):
+    generator = _parse_incrementally(
+        self,
+        input=input,
+        lexer=lexer,
+        debug=debug,
+        tracking=tracking,
+        tokenfunc=tokenfunc,
+    )
+    try:
+        next(generator)
+    except StopIteration as exception:
+        return exception.value
+    raise RuntimeError("yacc: yielded expression outside incremental parse.")
+
+
+def _parse_incrementally(
+    self,
+    input=None,
+    lexer=None,
+    debug=None,
+    tracking=0,
+    tokenfunc=None,
+    expressions=None,
+):
+    """
+    Parses like ``_parse()``; passes ``expressions`` to grammar rules on
+    production object; yields each expression grammar rules append to
+    ``expressions`` as soon as grammar rules append expression.
+
+    Returns parse result when exhausted.
+    """
     self.lookahead = None  # Current lookahead symbol
     actions = (
         self.action
@@ -30,6 +61,7 @@ def _parse(
     # Set up the lexer and parser objects on pslice
     pslice.lexer = lexer
     pslice.parser = self
+    pslice.expressions = expressions
 
     # If input was supplied, pass to lexer
     if input is not None:
@@ -174,6 +206,8 @@ def _parse(
                         self.lookahead = sym
                         errorcount = error_count
                         self.errorok = 0
+                    while expressions:
+                        yield expressions.pop(0)
                     continue
                     # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
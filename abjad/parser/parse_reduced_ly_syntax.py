@@ -1,5 +1,7 @@
 from .ReducedLyParser import ReducedLyParser
 
+_reduced_ly_parser = ReducedLyParser()
+
 
 def parse_reduced_ly_syntax(string):
     """
@@ -21,4 +23,4 @@ def parse_reduced_ly_syntax(string):
 
     Returns list.
     """
-    return ReducedLyParser()(string)
+    return _reduced_ly_parser(string)
@@ -3,6 +3,7 @@ Tools for modeling IRCAM-style rhythm trees.
 """
 
 import abc
+import re
 import typing
 import uqbar.containers
 import uqbar.graphs
@@ -582,7 +583,7 @@ class RhythmTreeContainer(RhythmTreeMixin, uqbar.containers.UniqueTreeList):
         Returns new RhythmTreeContainer.
         """
         if isinstance(argument, str):
-            argument = RhythmTreeParser()(argument)
+            argument = _rhythm_tree_parser(argument)
             assert 1 == len(argument) and isinstance(argument[0], type(self))
             argument = argument[0]
         container = type(self)(
@@ -770,20 +771,20 @@ class RhythmTreeContainer(RhythmTreeMixin, uqbar.containers.UniqueTreeList):
 
     def _prepare_setitem_single(self, expr):
         if isinstance(expr, str):
-            expr = RhythmTreeParser()(expr)[0]
+            expr = _rhythm_tree_parser(expr)[0]
             assert len(expr) == 1
             expr = expr[0]
         return expr
 
     def _prepare_setitem_multiple(self, expr):
         if isinstance(expr, str):
-            expr = RhythmTreeParser()(expr)
+            expr = _rhythm_tree_parser(expr)
         elif (
             isinstance(expr, list)
             and len(expr) == 1
             and isinstance(expr[0], str)
         ):
-            expr = RhythmTreeParser()(expr[0])
+            expr = _rhythm_tree_parser(expr[0])
         return expr
 
     def _pretty_rtm_format_pieces(self):
@@ -911,6 +912,118 @@ class RhythmTreeParser(Parser):
 
     """
 
+    ### CLASS VARIABLES ###
+
+    _durations: typing.Dict = {}
+
+    # same tokens, in same order, as PLY lexer rules below
+    _token_regex = re.compile(
+        r"""
+        [ \n\t\r]*
+        (?:
+            (?P<DURATION>-?[1-9]\d*(?:/[1-9]\d*)?)
+            | (?P<PAREN>[()])
+        )
+        """,
+        re.VERBOSE,
+    )
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, string):
+        """
+        Parses ``string``.
+
+        Parses with recursive descent. Parses with PLY in debug mode and when
+        recursive descent fails, to report errors as PLY does.
+
+        Returns list of rhythm-tree nodes.
+        """
+        if not self.debug:
+            try:
+                nodes = self._parse_recursively(string)
+            except Exception:
+                # PLY parser raises exception or recovers from error
+                nodes = None
+            if nodes is not None:
+                return nodes
+        return Parser.__call__(self, string)
+
+    ### PRIVATE METHODS ###
+
+    def _parse_duration(self, string):
+        import abjad
+
+        parts = string.partition("/")
+        if not parts[2]:
+            return abjad.Duration(int(parts[0]))
+        numerator, denominator = int(parts[0]), int(parts[2])
+        fraction = abjad.NonreducedFraction(numerator, denominator)
+        preprolated_duration = abjad.Duration(fraction)
+        if fraction.numerator == preprolated_duration.numerator:
+            return preprolated_duration
+        return fraction
+
+    def _parse_node(self, tokens, i):
+        type_, value = tokens[i]
+        if type_ == "DURATION":
+            leaf = RhythmTreeLeaf(
+                preprolated_duration=abs(value), is_pitched=0 < value
+            )
+            return leaf, i + 1
+        if (
+            type_ != "("
+            or tokens[i + 1][0] != "DURATION"
+            or tokens[i + 2][0] != "("
+        ):
+            return None
+        preprolated_duration = abs(tokens[i + 1][1])
+        i += 3
+        children = []
+        while tokens[i][0] != ")":
+            result = self._parse_node(tokens, i)
+            if result is None:
+                return None
+            node, i = result
+            children.append(node)
+        if not children or tokens[i + 1][0] != ")":
+            return None
+        container = RhythmTreeContainer(
+            children=children, preprolated_duration=preprolated_duration
+        )
+        return container, i + 2
+
+    def _parse_recursively(self, string):
+        tokens = self._tokenize(string)
+        if tokens is None:
+            return None
+        nodes, i = [], 0
+        while tokens[i][0] != "$end":
+            result = self._parse_node(tokens, i)
+            if result is None:
+                return None
+            node, i = result
+            nodes.append(node)
+        return nodes
+
+    def _tokenize(self, string):
+        tokens, i = [], 0
+        match = self._token_regex.match(string, i)
+        while match is not None:
+            value = match.group(match.lastgroup)
+            if match.lastgroup == "PAREN":
+                tokens.append((value, value))
+            else:
+                if value not in self._durations:
+                    self._durations[value] = self._parse_duration(value)
+                tokens.append(("DURATION", self._durations[value]))
+            i = match.end()
+            match = self._token_regex.match(string, i)
+        if string[i:].strip(" \n\t\r"):
+            return None
+        tokens.append(("$end", None))
+        return tokens
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -937,19 +1050,7 @@ class RhythmTreeParser(Parser):
 
     def t_DURATION(self, t):
         r"-?[1-9]\d*(/[1-9]\d*)?"
-        import abjad
-
-        parts = t.value.partition("/")
-        if not parts[2]:
-            t.value = abjad.Duration(int(parts[0]))
-        else:
-            numerator, denominator = int(parts[0]), int(parts[2])
-            fraction = abjad.NonreducedFraction(numerator, denominator)
-            preprolated_duration = abjad.Duration(fraction)
-            if fraction.numerator == preprolated_duration.numerator:
-                t.value = preprolated_duration
-            else:
-                t.value = fraction
+        t.value = self._parse_duration(t.value)
         return t
 
     def t_error(self, t):
@@ -1037,6 +1138,9 @@ class RhythmTreeParser(Parser):
         p[0] = p[1] + [p[2]]
 
 
+_rhythm_tree_parser = RhythmTreeParser()
+
+
 def parse_rtm_syntax(rtm):
     r"""
     Parses RTM syntax.
@@ -1084,7 +1188,7 @@ def parse_rtm_syntax(rtm):
 
     Returns tuplet or container.
     """
-    result = RhythmTreeParser()(rtm)
+    result = _rhythm_tree_parser(rtm)
     container = core.Container()
     for node in result:
         tuplet = node((1, 4))
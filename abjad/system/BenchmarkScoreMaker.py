@@ -115,3 +115,53 @@ class BenchmarkScoreMaker(object):
             dynamic = abjad.Dynamic("f")
             abjad.attach(dynamic, note)
         return staff
+
+    def make_score_with_nested_tuplets_01(self):
+        """
+        Make score with 40 tuplets nested six deep in staff group.
+
+        3.0 (indent per container) LilyPond format:     755,989 function calls
+        3.0 (indent per line) LilyPond format:          714,613 function calls
+        3.0 (inherited indicators) LilyPond format:     615,479 function calls
+
+        """
+        import abjad
+
+        voice = abjad.Voice()
+        for _ in range(40):
+            tuplet = abjad.Tuplet((2, 3), "c'8 d'8 e'8")
+            for _ in range(5):
+                notes = [tuplet, abjad.Note("f'8"), abjad.Note("g'8")]
+                tuplet = abjad.Tuplet((2, 3), notes)
+            voice.append(tuplet)
+        staff = abjad.Staff([voice])
+        staff_group = abjad.StaffGroup([staff])
+        score = abjad.Score([staff_group])
+        return score
+
+    def make_score_with_tags_01(self):
+        """
+        Make 200-note staff with three tagged indicators on every note.
+
+        Tags every note, too; half of the articulations are deactivated.
+
+        3.0 (before fast tagging) LilyPond format:      349,965 function calls
+        3.0 (fast tagging) LilyPond format:             247,165 function calls
+
+        """
+        import abjad
+
+        staff = abjad.Staff()
+        for i in range(200):
+            note = abjad.Note("c'16", tag=f"MEASURE_{i // 16 + 1}")
+            staff.append(note)
+        for i, note in enumerate(staff):
+            tag = abjad.Tag("EXPLICIT_DYNAMIC:SEGMENT")
+            abjad.attach(abjad.Dynamic("f"), note, tag=tag)
+            tag = abjad.Tag("-PARTS:SEGMENT")
+            articulation = abjad.Articulation("accent")
+            abjad.attach(articulation, note, deactivate=bool(i % 2), tag=tag)
+            tag = abjad.Tag("SEGMENT:SPANNER_START")
+            markup = abjad.Markup("dolce", direction=abjad.Up)
+            abjad.attach(markup, note, tag=tag)
+        return staff
@@ -0,0 +1,108 @@
+import typing
+from .ContextManager import ContextManager
+
+
+class FormatCache(ContextManager):
+    r"""
+    A context manager for caching LilyPond format of components.
+
+    ..  container:: example
+
+        Components format once; unchanged components format again from cache:
+
+        >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+        >>> with abjad.FormatCache() as cache:
+        ...     string = format(staff)
+        ...     cache.cache_info()
+        ...     string = format(staff)
+        ...     cache.cache_info()
+        ...
+        (0, 5)
+        (1, 5)
+
+    ..  container:: example
+
+        Changing a component reformats only the component and the components
+        that contain it:
+
+        >>> with abjad.FormatCache() as cache:
+        ...     string = format(staff)
+        ...     staff[1].written_pitch = "ds'"
+        ...     abjad.attach(abjad.Articulation("."), staff[2])
+        ...     string = format(staff)
+        ...     cache.cache_info()
+        ...
+        (2, 8)
+
+        >>> abjad.f(staff)
+        \new Staff
+        {
+            c'4
+            ds'4
+            e'4
+            - \staccato
+            f'4
+        }
+
+    Components cache format only while a format cache is active; format
+    caches clear cached format on exit.
+
+    Attaching and detaching indicators, overriding and setting, tweaking note
+    heads, changing pitches, durations and multipliers, and mutating score
+    structure all clear cached format. Attaching and detaching context
+    indicators (like clefs) reformat every component in the effective
+    context of the indicator.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Context managers"
+
+    __slots__ = ("_components", "_hits", "_misses", "_previous")
+
+    _current: typing.Optional["FormatCache"] = None
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self._components: typing.List = []
+        self._hits = 0
+        self._misses = 0
+        self._previous = None
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "FormatCache":
+        """
+        Enters format cache.
+
+        Returns format cache.
+        """
+        self._previous = FormatCache._current
+        FormatCache._current = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Exits format cache.
+
+        Clears cached format.
+
+        Returns none.
+        """
+        FormatCache._current = self._previous
+        self._previous = None
+        for component in self._components:
+            component._format_cache = None
+        self._components[:] = []
+
+    ### PUBLIC METHODS ###
+
+    def cache_info(self) -> typing.Tuple[int, int]:
+        """
+        Gets cache hits and cache misses.
+
+        Cache misses count components formatted (or reformatted) while format
+        cache is active.
+        """
+        return self._hits, self._misses
@@ -27,18 +27,33 @@ class LilyPondFormatBundle(object):
         "_opening",
     )
 
+    _grob_contribution_names = (
+        "context_settings",
+        "grob_overrides",
+        "grob_reverts",
+    )
+
+    _slot_contribution_names = (
+        "absolute_before",
+        "absolute_after",
+        "before",
+        "after",
+        "opening",
+        "closing",
+    )
+
     ### INITIALIZER ###
 
     def __init__(self):
-        self._absolute_after = SlotContributions()
-        self._absolute_before = SlotContributions()
-        self._before = SlotContributions()
-        self._after = SlotContributions()
-        self._opening = SlotContributions()
-        self._closing = SlotContributions()
-        self._context_settings = []
-        self._grob_overrides = []
-        self._grob_reverts = []
+        self._absolute_after = None
+        self._absolute_before = None
+        self._before = None
+        self._after = None
+        self._opening = None
+        self._closing = None
+        self._context_settings = None
+        self._grob_overrides = None
+        self._grob_reverts = None
 
     ### SPECIAL METHODS ###
 
@@ -57,25 +72,17 @@ class LilyPondFormatBundle(object):
     ### PRIVATE METHODS ###
 
     def _get_format_specification(self):
-        slot_contribution_names = (
-            "absolute_before",
-            "absolute_after",
-            "before",
-            "after",
-            "opening",
-            "closing",
-        )
-        grob_contribution_names = (
-            "context_settings",
-            "grob_overrides",
-            "grob_reverts",
+        names = []
+        for name in self._slot_contribution_names:
+            slot_contributions = getattr(self, "_" + name)
+            if (
+                slot_contributions is not None
+                and slot_contributions.has_contributions
+            ):
+                names.append(name)
+        names.extend(
+            _ for _ in self._grob_contribution_names if getattr(self, "_" + _)
         )
-        names = [
-            _
-            for _ in slot_contribution_names
-            if getattr(self, _).has_contributions
-        ]
-        names.extend(_ for _ in grob_contribution_names if getattr(self, _))
         return FormatSpecification(
             client=self, storage_format_kwargs_names=names
         )
@@ -96,9 +103,13 @@ class LilyPondFormatBundle(object):
 
         Returns none.
         """
-        self._context_settings = tuple(sorted(set(self.context_settings)))
-        self._grob_overrides = tuple(sorted(set(self.grob_overrides)))
-        self._grob_reverts = tuple(sorted(set(self.grob_reverts)))
+        for name in self._grob_contribution_names:
+            strings = getattr(self, "_" + name)
+            if strings:
+                strings = tuple(sorted(set(strings)))
+            else:
+                strings = ()
+            setattr(self, "_" + name, strings)
 
     def tag_format_contributions(self, tag, deactivate=None):
         """
@@ -108,41 +119,41 @@ class LilyPondFormatBundle(object):
         """
         import abjad
 
-        self.absolute_before.tag(tag, deactivate)
-        self.absolute_after.tag(tag, deactivate)
-        self.before.tag(tag, deactivate)
-        self.after.tag(tag, deactivate)
-        self.opening.tag(tag, deactivate)
-        self.closing.tag(tag, deactivate)
-        self._context_settings = abjad.LilyPondFormatManager.tag(
-            self.context_settings, tag, deactivate
-        )
-        self._grob_overrides = abjad.LilyPondFormatManager.tag(
-            self.grob_overrides, tag, deactivate
-        )
-        self._grob_reverts = abjad.LilyPondFormatManager.tag(
-            self.grob_reverts, tag, deactivate
-        )
+        for name in self._slot_contribution_names:
+            slot_contributions = getattr(self, "_" + name)
+            if slot_contributions is not None:
+                slot_contributions.tag(tag, deactivate)
+        for name in self._grob_contribution_names:
+            strings = getattr(self, "_" + name)
+            if strings:
+                strings = abjad.LilyPondFormatManager.tag(
+                    strings, tag, deactivate
+                )
+                setattr(self, "_" + name, strings)
 
     def update(self, format_bundle):
         """
         Updates format bundle with all format contributions in
         ``format_bundle``.
 
+        Skips slots without contributions.
+
         Returns none.
         """
         if hasattr(format_bundle, "_get_lilypond_format_bundle"):
             format_bundle = format_bundle._get_lilypond_format_bundle()
         assert isinstance(format_bundle, type(self))
-        self.absolute_before.update(format_bundle.absolute_before)
-        self.absolute_after.update(format_bundle.absolute_after)
-        self.before.update(format_bundle.before)
-        self.after.update(format_bundle.after)
-        self.opening.update(format_bundle.opening)
-        self.closing.update(format_bundle.closing)
-        self.context_settings.extend(format_bundle.context_settings)
-        self.grob_overrides.extend(format_bundle.grob_overrides)
-        self.grob_reverts.extend(format_bundle.grob_reverts)
+        for name in self._slot_contribution_names:
+            slot_contributions = getattr(format_bundle, "_" + name)
+            if (
+                slot_contributions is not None
+                and slot_contributions.has_contributions
+            ):
+                getattr(self, name).update(slot_contributions)
+        for name in self._grob_contribution_names:
+            strings = getattr(format_bundle, "_" + name)
+            if strings:
+                getattr(self, name).extend(strings)
 
     ### PUBLIC PROPERTIES ###
 
@@ -153,6 +164,8 @@ class LilyPondFormatBundle(object):
 
         Returns slot contributions object.
         """
+        if self._absolute_after is None:
+            self._absolute_after = SlotContributions()
         return self._absolute_after
 
     @property
@@ -162,6 +175,8 @@ class LilyPondFormatBundle(object):
 
         Returns slot contributions object.
         """
+        if self._absolute_before is None:
+            self._absolute_before = SlotContributions()
         return self._absolute_before
 
     @property
@@ -171,6 +186,8 @@ class LilyPondFormatBundle(object):
 
         Returns slot contributions object.
         """
+        if self._after is None:
+            self._after = SlotContributions()
         return self._after
 
     @property
@@ -180,6 +197,8 @@ class LilyPondFormatBundle(object):
 
         Returns slot contributions object.
         """
+        if self._before is None:
+            self._before = SlotContributions()
         return self._before
 
     @property
@@ -189,6 +208,8 @@ class LilyPondFormatBundle(object):
 
         Returns slot contributions object.
         """
+        if self._closing is None:
+            self._closing = SlotContributions()
         return self._closing
 
     @property
@@ -198,6 +219,8 @@ class LilyPondFormatBundle(object):
 
         Returns list.
         """
+        if self._context_settings is None:
+            self._context_settings = []
         return self._context_settings
 
     @property
@@ -207,6 +230,8 @@ class LilyPondFormatBundle(object):
 
         Returns list.
         """
+        if self._grob_overrides is None:
+            self._grob_overrides = []
         return self._grob_overrides
 
     @property
@@ -216,6 +241,8 @@ class LilyPondFormatBundle(object):
 
         Returns list.
         """
+        if self._grob_reverts is None:
+            self._grob_reverts = []
         return self._grob_reverts
 
     @property
@@ -225,6 +252,8 @@ class LilyPondFormatBundle(object):
 
         Returns slot contributions object.
         """
+        if self._opening is None:
+            self._opening = SlotContributions()
         return self._opening
 
 
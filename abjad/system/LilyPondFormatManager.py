@@ -31,13 +31,51 @@ class LilyPondFormatManager(object):
     ### PRIVATE METHODS ###
 
     @staticmethod
-    def _collect_indicators(component):
+    def _classify_inherited_wrappers(wrappers, indicators):
         import abjad
 
-        wrappers = []
-        for parent in abjad.inspect(component).parentage():
-            wrappers_ = abjad.inspect(parent).wrappers()
-            wrappers.extend(wrappers_)
+        (
+            up_markup_wrappers,
+            down_markup_wrappers,
+            neutral_markup_wrappers,
+            noncontext_wrappers,
+        ) = indicators
+        for wrapper in wrappers:
+            # skip nonprinting indicators like annotation
+            indicator = wrapper.indicator
+            if not hasattr(indicator, "_get_lilypond_format") and not hasattr(
+                indicator, "_get_lilypond_format_bundle"
+            ):
+                continue
+            elif wrapper.annotation is not None:
+                continue
+            # skip comments and commands attached to container
+            elif (
+                wrapper.context is None
+                and hasattr(wrapper.indicator, "_format_leaf_children")
+                and not getattr(wrapper.indicator, "_format_leaf_children")
+            ):
+                continue
+            # store markup wrappers
+            elif isinstance(wrapper.indicator, abjad.Markup):
+                if wrapper.indicator.direction is enums.Up:
+                    up_markup_wrappers.append(wrapper)
+                elif wrapper.indicator.direction is enums.Down:
+                    down_markup_wrappers.append(wrapper)
+                elif wrapper.indicator.direction in (enums.Center, None):
+                    neutral_markup_wrappers.append(wrapper)
+            # skip context wrappers attached to container
+            elif wrapper.context is not None:
+                continue
+            # store noncontext wrappers
+            else:
+                noncontext_wrappers.append(wrapper)
+
+    @staticmethod
+    def _collect_indicators(component, inherited=None):
+        import abjad
+
+        wrappers = abjad.inspect(component).wrappers()
         up_markup_wrappers = []
         down_markup_wrappers = []
         neutral_markup_wrappers = []
@@ -79,6 +117,18 @@ class LilyPondFormatManager(object):
             # store noncontext wrappers
             else:
                 noncontext_wrappers.append(wrapper)
+        # add wrappers attached to components that contain component
+        if inherited is None:
+            manager = LilyPondFormatManager
+            parentage = abjad.inspect(component).parentage()
+            if 1 < len(parentage):
+                parent = parentage[1]
+                inherited = manager._collect_inherited_indicators(parent)
+        if inherited is not None:
+            up_markup_wrappers.extend(inherited[0])
+            down_markup_wrappers.extend(inherited[1])
+            neutral_markup_wrappers.extend(inherited[2])
+            noncontext_wrappers.extend(inherited[3])
         indicators = (
             up_markup_wrappers,
             down_markup_wrappers,
@@ -88,6 +138,32 @@ class LilyPondFormatManager(object):
         )
         return indicators
 
+    @staticmethod
+    def _collect_inherited_indicators(component, inherited=None):
+        """
+        Collects indicators contents of ``component`` inherit.
+
+        Collects markup wrappers and noncontext wrappers attached to
+        ``component`` and to components that contain ``component``.
+
+        Set ``inherited`` to indicators ``component`` itself inherits; so
+        classifies only wrappers attached to ``component``.
+        """
+        import abjad
+
+        manager = LilyPondFormatManager
+        indicators: typing.Tuple[typing.List, ...] = ([], [], [], [])
+        if inherited is None:
+            for parent in abjad.inspect(component).parentage():
+                wrappers = abjad.inspect(parent).wrappers()
+                manager._classify_inherited_wrappers(wrappers, indicators)
+        else:
+            wrappers = abjad.inspect(component).wrappers()
+            manager._classify_inherited_wrappers(wrappers, indicators)
+            for wrappers, wrappers_ in zip(indicators, inherited):
+                wrappers.extend(wrappers_)
+        return indicators
+
     @staticmethod
     def _populate_context_setting_format_contributions(component, bundle):
         import abjad
@@ -165,7 +241,9 @@ class LilyPondFormatManager(object):
             bundle.grob_reverts.extend(contributions)
 
     @staticmethod
-    def _populate_indicator_format_contributions(component, bundle):
+    def _populate_indicator_format_contributions(
+        component, bundle, inherited=None
+    ):
         manager = LilyPondFormatManager
         (
             up_markup_wrappers,
@@ -173,7 +251,9 @@ class LilyPondFormatManager(object):
             neutral_markup_wrappers,
             context_wrappers,
             noncontext_wrappers,
-        ) = LilyPondFormatManager._collect_indicators(component)
+        ) = LilyPondFormatManager._collect_indicators(
+            component, inherited=inherited
+        )
         manager._populate_markup_format_contributions(
             component,
             bundle,
@@ -255,30 +335,38 @@ class LilyPondFormatManager(object):
         Line-breaks ``string`` and aligns tags starting a column ``n``.
         """
         assert isinstance(n, int), repr(n)
+        if "%!" not in string:
+            return string
         lines = []
         for line in string.split("\n"):
-            if "%!" not in line:
+            location = line.find("%!")
+            if location == -1:
                 lines.append(line)
                 continue
-            location = line.find("%!")
             left = line[:location].rstrip()
             right = line[location:]
-            pad = n - len(left)
-            if pad < 1:
-                pad = 1
-            line = left + pad * " " + right
+            # pads left to column n with at least one space
+            line = (left + " ").ljust(n) + right
             lines.append(line)
         string = "\n".join(lines)
         return string
 
     @staticmethod
-    def bundle_format_contributions(component) -> LilyPondFormatBundle:
+    def bundle_format_contributions(
+        component, inherited=None
+    ) -> LilyPondFormatBundle:
         """
         Gets all format contributions for ``component``.
+
+        Set ``inherited`` to indicators collected from components that
+        contain ``component``; formatting sets ``inherited`` when descending
+        the score tree.
         """
         manager = LilyPondFormatManager
         bundle = LilyPondFormatBundle()
-        manager._populate_indicator_format_contributions(component, bundle)
+        manager._populate_indicator_format_contributions(
+            component, bundle, inherited=inherited
+        )
         manager._populate_spanner_format_contributions(component, bundle)
         manager._populate_context_setting_format_contributions(
             component, bundle
@@ -480,24 +568,20 @@ class LilyPondFormatManager(object):
         """
         Tags ``strings`` with ``tag``.
         """
-        if not tag:
-            return strings
         if not strings:
             return strings
+        if not tag:
+            return strings
         if deactivate is not None:
             assert isinstance(deactivate, type(True)), repr(deactivate)
-        length = max([len(_) for _ in strings])
+        length = max(map(len, strings))
+        suffix = " %! " + str(tag)
         strings_ = []
         for string in strings:
-            if "%!" in string and r"\tweak" in string:
-                strings_.append(string)
-                continue
             if "%!" not in string:
-                pad = length - len(string)
-            else:
-                pad = 0
-            tag_ = pad * " " + " " + "%!" + " " + str(tag)
-            string = string + tag_
+                string = string.ljust(length) + suffix
+            elif r"\tweak" not in string:
+                string = string + suffix
             strings_.append(string)
         if deactivate is True:
             strings_ = ["%@% " + _ for _ in strings_]
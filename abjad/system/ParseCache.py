@@ -0,0 +1,156 @@
+import collections
+import typing
+from .ContextManager import ContextManager
+
+
+class ParseCache(ContextManager):
+    r"""
+    A context manager for caching parsed LilyPond strings.
+
+    ..  container:: example
+
+        Strings parse once; repeated strings copy from cache:
+
+        >>> with abjad.ParseCache() as cache:
+        ...     for _ in range(3):
+        ...         container = abjad.Container("c'8 d'8 e'8 f'8")
+        ...         staff = abjad.Staff(r"\times 2/3 { c'8 d'8 e'8 }")
+        ...
+        ...     cache.cache_info()
+        ...
+        (4, 2)
+
+        >>> abjad.f(staff)
+        \new Staff
+        {
+            \times 2/3 {
+                c'8
+                d'8
+                e'8
+            }
+        }
+
+    ..  container:: example
+
+        Caches hold at most ``maxsize`` parsed strings and discard least
+        recently used strings first:
+
+        >>> with abjad.ParseCache(maxsize=1) as cache:
+        ...     container = abjad.Container("c'8 d'8 e'8 f'8")
+        ...     container = abjad.Container("g'4 a'4")
+        ...     container = abjad.Container("c'8 d'8 e'8 f'8")
+        ...
+        ...     cache.cache_info()
+        ...     len(cache)
+        ...
+        (0, 3)
+        1
+
+        >>> cache.clear()
+        >>> cache.cache_info()
+        (0, 0)
+
+        >>> len(cache)
+        0
+
+    Keys cache entries by string and language. Caches only strings that
+    parse to components; other strings parse again each time.
+
+    Parse caches keep cached components between ``with`` blocks; clear parse
+    caches explicitly.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Context managers"
+
+    __slots__ = ("_components", "_hits", "_maxsize", "_misses", "_previous")
+
+    _current: typing.Optional["ParseCache"] = None
+
+    ### INITIALIZER ###
+
+    def __init__(self, maxsize: int = 128) -> None:
+        assert isinstance(maxsize, int) and 0 < maxsize, repr(maxsize)
+        self._components: collections.OrderedDict = collections.OrderedDict()
+        self._hits = 0
+        self._maxsize = maxsize
+        self._misses = 0
+        self._previous = None
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "ParseCache":
+        """
+        Enters parse cache.
+
+        Returns parse cache.
+        """
+        self._previous = ParseCache._current
+        ParseCache._current = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Exits parse cache.
+
+        Keeps cached components.
+
+        Returns none.
+        """
+        ParseCache._current = self._previous
+        self._previous = None
+
+    def __len__(self) -> int:
+        """
+        Gets number of cached components.
+        """
+        return len(self._components)
+
+    ### PRIVATE METHODS ###
+
+    def _get(self, key):
+        from abjad.top.mutate import mutate
+
+        component = self._components.get(key)
+        if component is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._components.move_to_end(key)
+        return mutate(component).copy()
+
+    def _set(self, key, component):
+        from abjad.core.Component import Component
+        from abjad.top.mutate import mutate
+
+        if not isinstance(component, Component):
+            return
+        self._components[key] = mutate(component).copy()
+        if self._maxsize < len(self._components):
+            self._components.popitem(last=False)
+
+    ### PUBLIC METHODS ###
+
+    def cache_info(self) -> typing.Tuple[int, int]:
+        """
+        Gets cache hits and cache misses.
+        """
+        return self._hits, self._misses
+
+    def clear(self) -> None:
+        """
+        Clears cached components and resets cache hits and cache misses.
+        """
+        self._components.clear()
+        self._hits = 0
+        self._misses = 0
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Gets maximum number of cached components.
+        """
+        return self._maxsize
@@ -6,6 +6,8 @@ import ply  # type: ignore
 import sys
 from ply import yacc  # type: ignore
 import traceback
+import types
+import typing
 
 
 class Parser(object):
@@ -24,6 +26,10 @@ class Parser(object):
 
     _is_abstract = True
 
+    _lexers: typing.Dict = {}
+
+    _tables: typing.Dict = {}
+
     ### INITIALIZER ###
 
     def __init__(self, debug=False):
@@ -43,31 +49,6 @@ class Parser(object):
         else:
             self._logger = yacc.NullLogger()
 
-        self._lexer = ply.lex.lex(
-            debug=self.debug,
-            debuglog=self.logger,
-            object=self.lexer_rules_object,
-        )
-
-        if self.pickle_path and not os.path.exists(self.pickle_path):
-            try:
-                directory, _ = os.path.split(self.pickle_path)
-                if not os.path.exists(directory):
-                    os.makedirs(directory)
-                string = pickle.dumps(None)
-                with open(self.pickle_path, "wb") as file_pointer:
-                    file_pointer.write(string)
-            except (IOError, OSError):
-                traceback.print_exc()
-
-        self._parser = ply.yacc.yacc(
-            debug=self.debug,
-            debuglog=self.logger,
-            module=self.parser_rules_object,
-            outputdir=self.output_path,
-            picklefile=self.pickle_path,
-        )
-
     ### SPECIAL METHODS ###
 
     def __call__(self, string):
@@ -89,6 +70,104 @@ class Parser(object):
 
         return result
 
+    ### PRIVATE METHODS ###
+
+    def _get_rules_module(self, rules_object):
+        # PLY reads every attribute of the rules object; skip lexer and parser
+        # properties because reading them builds lexer and parser
+        dictionary = {}
+        for name in dir(rules_object):
+            if rules_object is self and name in ("lexer", "parser"):
+                continue
+            dictionary[name] = getattr(rules_object, name)
+        return types.SimpleNamespace(**dictionary)
+
+    def _make_lexer(self):
+        rules_object = self.lexer_rules_object
+        if self.debug:
+            module = self._get_rules_module(rules_object)
+            return ply.lex.lex(
+                debug=self.debug, debuglog=self.logger, module=module
+            )
+        class_ = type(self)
+        if class_ not in Parser._lexers:
+            module = self._get_rules_module(rules_object)
+            Parser._lexers[class_] = ply.lex.lex(
+                debug=self.debug, debuglog=self.logger, module=module
+            )
+        lexer = Parser._lexers[class_].clone(rules_object)
+        lexer.lexstatestack = []
+        lexer.begin("INITIAL")
+        return lexer
+
+    def _make_parser(self):
+        rules_object = self.parser_rules_object
+        if self.debug:
+            return self._make_yacc_parser()
+        class_ = type(self)
+        if class_ not in Parser._tables:
+            Parser._tables[class_] = self._read_tables()
+        action, goto, productions = Parser._tables[class_]
+        table = yacc.LRTable()
+        table.lr_method = "LALR"
+        table.lr_action = action
+        table.lr_goto = goto
+        table.lr_productions = [yacc.MiniProduction(*_) for _ in productions]
+        callables = {}
+        for production in table.lr_productions:
+            if production.func:
+                callable_ = getattr(rules_object, production.func)
+                callables[production.func] = callable_
+        table.bind_callables(callables)
+        error_function = getattr(rules_object, "p_error", None)
+        return yacc.LRParser(table, error_function)
+
+    def _make_yacc_parser(self):
+        if self.pickle_path and not os.path.exists(self.pickle_path):
+            try:
+                directory, _ = os.path.split(self.pickle_path)
+                if not os.path.exists(directory):
+                    os.makedirs(directory)
+                string = pickle.dumps(None)
+                with open(self.pickle_path, "wb") as file_pointer:
+                    file_pointer.write(string)
+            except (IOError, OSError):
+                traceback.print_exc()
+        return ply.yacc.yacc(
+            debug=self.debug,
+            debuglog=self.logger,
+            module=self._get_rules_module(self.parser_rules_object),
+            outputdir=self.output_path,
+            picklefile=self.pickle_path,
+            write_tables=False,
+        )
+
+    def _read_tables(self):
+        rules_object = self.parser_rules_object
+        table = yacc.LRTable()
+        try:
+            signature = table.read_pickle(self.table_path)
+        except (ImportError, yacc.VersionError):
+            signature = None
+        if signature is not None:
+            module = self._get_rules_module(rules_object)
+            dictionary = vars(module)
+            reflection = yacc.ParserReflect(dictionary, log=yacc.NullLogger())
+            reflection.get_all()
+            if signature != reflection.signature():
+                signature = None
+        if signature is None:
+            parser = self._make_yacc_parser()
+            action, goto = parser.action, parser.goto
+            productions = parser.productions
+        else:
+            action, goto = table.lr_action, table.lr_goto
+            productions = table.lr_productions
+        productions = tuple(
+            (_.str, _.name, _.len, _.func, _.file, _.line) for _ in productions
+        )
+        return action, goto, productions
+
     ### PUBLIC METHODS ###
 
     def tokenize(self, string):
@@ -99,6 +178,26 @@ class Parser(object):
         for token in self.lexer:
             print(token)
 
+    def write_tables(self):
+        """
+        Writes parser's parsing tables to ``table_path``.
+
+        Run by ``scr/devel/prime-parser-tables`` whenever grammar changes.
+
+        Returns none.
+        """
+        if os.path.exists(self.table_path):
+            os.remove(self.table_path)
+        directory, _ = os.path.split(self.table_path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        ply.yacc.yacc(
+            debuglog=self.logger,
+            module=self._get_rules_module(self.parser_rules_object),
+            picklefile=self.table_path,
+        )
+        Parser._tables.pop(type(self), None)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -112,7 +211,11 @@ class Parser(object):
     def lexer(self):
         """
         Gets parser's PLY Lexer instance.
+
+        Clones lexer built once per parser class.
         """
+        if self._lexer is None:
+            self._lexer = self._make_lexer()
         return self._lexer
 
     @abc.abstractproperty
@@ -161,7 +264,13 @@ class Parser(object):
     def parser(self):
         """
         Gets parser's PLY LRParser instance.
+
+        Reads parsing tables from ``table_path`` once per parser class;
+        generates parsing tables only when ``table_path`` is missing or out
+        of date.
         """
+        if self._parser is None:
+            self._parser = self._make_parser()
         return self._parser
 
     @abc.abstractproperty
@@ -182,3 +291,14 @@ class Parser(object):
             type(self).__name__, "-".join(str(x) for x in sys.version_info)
         )
         return os.path.join(self.output_path, file_name)
+
+    @property
+    def table_path(self):
+        """
+        Gets path of parser's precompiled parsing tables.
+
+        Tables ship with Abjad and are independent of Python version.
+        """
+        directory = os.path.dirname(os.path.dirname(__file__))
+        file_name = "{}.pkl".format(type(self).__name__)
+        return os.path.join(directory, "parser", "tables", file_name)
@@ -1,4 +1,6 @@
+import multiprocessing
 import os
+import pickle
 import re
 import shutil
 import tempfile
@@ -25,6 +27,8 @@ class PersistenceManager(object):
 
     _png_page_pattern = re.compile(r".+page(\d+)\.png")
 
+    _worker_component = None
+
     ### INITIALIZER ###
 
     def __init__(self, client=None):
@@ -38,6 +42,104 @@ class PersistenceManager(object):
         """
         return StorageFormatManager(self).get_repr_format()
 
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _format_contents_in_parallel(lilypond_file, workers, cache):
+        """
+        Formats contents of top-level simultaneous containers in
+        ``lilypond_file`` in ``workers`` worker processes.
+
+        Descends simultaneous containers; formats each other container in
+        worker process and adds format to ``cache``.
+
+        Worker processes unpickle whole score once; so contents format in the
+        same context as in serial formatting.
+        """
+        import abjad
+
+        components, items = [], [lilypond_file]
+        while items:
+            item = items.pop(0)
+            if isinstance(item, abjad.Component):
+                components.append(item)
+            elif hasattr(item, "items"):
+                items.extend(item.items)
+        for component in components:
+            if not isinstance(component, abjad.Container):
+                continue
+            if component._parent is not None or not component.simultaneous:
+                continue
+            pairs, containers = [], [(component, ())]
+            while containers:
+                container, path = containers.pop(0)
+                for i, child in enumerate(container):
+                    if not isinstance(child, abjad.Container):
+                        continue
+                    if child.simultaneous:
+                        containers.append((child, path + (i,)))
+                    else:
+                        pairs.append((child, path + (i,)))
+            if len(pairs) < 2:
+                continue
+            string = pickle.dumps(component, protocol=pickle.HIGHEST_PROTOCOL)
+            paths = [path for child, path in pairs]
+            with multiprocessing.Pool(
+                processes=workers,
+                initializer=PersistenceManager._initialize_worker,
+                initargs=(string,),
+            ) as pool:
+                strings = pool.map(PersistenceManager._format_in_worker, paths)
+            for (child, path), string in zip(pairs, strings):
+                child._format_cache = string
+                cache._components.append(child)
+
+    @staticmethod
+    def _format_in_worker(path):
+        component = PersistenceManager._worker_component
+        for i in path:
+            component = component[i]
+        return format(component, "lilypond")
+
+    @staticmethod
+    def _initialize_worker(string):
+        import abjad
+
+        abjad.FormatCache._current = None
+        PersistenceManager._worker_component = pickle.loads(string)
+
+    @staticmethod
+    def _stream_ly(lilypond_file, ly_file_path, strict, workers=None):
+        import abjad
+
+        directory = os.path.dirname(ly_file_path)
+        abjad.IOManager._ensure_directory_existence(directory)
+        if hasattr(lilypond_file, "_iterate_lilypond_format_pieces"):
+            pieces = lilypond_file._iterate_lilypond_format_pieces()
+        else:
+            pieces = [format(lilypond_file, "lilypond")]
+        if workers is not None:
+            cache = abjad.FormatCache()
+        else:
+            cache = abjad.NullContextManager()
+        timer = abjad.Timer()
+        with timer, cache, open(ly_file_path, "w") as file_pointer:
+            if workers is not None:
+                PersistenceManager._format_contents_in_parallel(
+                    lilypond_file, workers, cache
+                )
+            first = True
+            for piece in pieces:
+                if isinstance(strict, int):
+                    piece = abjad.LilyPondFormatManager.align_tags(
+                        piece, strict
+                    )
+                if not first:
+                    file_pointer.write("\n")
+                file_pointer.write(piece)
+                first = False
+        return ly_file_path, timer.elapsed_time
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -56,6 +158,8 @@ class PersistenceManager(object):
         ly_file_path=None,
         illustrate_function=None,
         strict=None,
+        stream=None,
+        workers=None,
         **keywords,
     ):
         """
@@ -63,6 +167,14 @@ class PersistenceManager(object):
 
         Autogenerates file path when ``ly_file_path`` is none.
 
+        Set ``stream`` to true to write LilyPond output to file as score is
+        formatted, instead of building one string first; output is the same
+        either way, but streaming keeps memory use flat for large scores.
+
+        Set ``workers`` to a positive integer to format contents of top-level
+        simultaneous containers (like the staves of a score) in that many
+        worker processes; output is the same as serial formatting.
+
         ..  container:: example
 
             >>> staff = abjad.Staff("c'4 e'4 d'4 f'4")
@@ -73,12 +185,15 @@ class PersistenceManager(object):
             0.04491996765136719
 
         Returns output path and elapsed formatting time when LilyPond output is
-        written.
+        written; elapsed formatting time includes writing when ``stream`` is
+        true.
         """
         import abjad
 
         if strict is not None:
             assert isinstance(strict, int), repr(strict)
+        if workers is not None:
+            assert isinstance(workers, int) and 0 < workers, repr(workers)
         if illustrate_function is None:
             assert hasattr(self._client, "__illustrate__")
             illustrate_function = self._client.__illustrate__
@@ -92,8 +207,20 @@ class PersistenceManager(object):
             ly_file_path = str(ly_file_path)
             ly_file_path = os.path.expanduser(ly_file_path)
         assert ly_file_path.endswith(".ly"), ly_file_path
+        if stream is True:
+            return self._stream_ly(
+                lilypond_file, ly_file_path, strict, workers=workers
+            )
+        if workers is not None:
+            cache = abjad.FormatCache()
+        else:
+            cache = abjad.NullContextManager()
         timer = abjad.Timer()
-        with timer:
+        with timer, cache:
+            if workers is not None:
+                self._format_contents_in_parallel(
+                    lilypond_file, workers, cache
+                )
             string = lilypond_file.__format__(format_specification="lilypond")
             if isinstance(strict, int):
                 string = abjad.LilyPondFormatManager.align_tags(string, strict)
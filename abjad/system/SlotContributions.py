@@ -23,20 +23,34 @@ class SlotContributions(object):
         "_trill_spanner_starts",
     )
 
+    _categories = (
+        "articulations",
+        "commands",
+        "comments",
+        "indicators",
+        "leaks",
+        "markup",
+        "spanners",
+        "spanner_starts",
+        "spanner_stops",
+        "stem_tremolos",
+        "trill_spanner_starts",
+    )
+
     ### INITIALIZER ###
 
     def __init__(self) -> None:
-        self._articulations: typing.List[str] = []
-        self._commands: typing.List[str] = []
-        self._comments: typing.List[str] = []
-        self._indicators: typing.List[str] = []
-        self._leaks: typing.List[str] = []
-        self._markup: typing.List[str] = []
-        self._spanners: typing.List[str] = []
-        self._spanner_starts: typing.List[str] = []
-        self._spanner_stops: typing.List[str] = []
-        self._stem_tremolos: typing.List[str] = []
-        self._trill_spanner_starts: typing.List[str] = []
+        self._articulations: typing.Optional[typing.List[str]] = None
+        self._commands: typing.Optional[typing.List[str]] = None
+        self._comments: typing.Optional[typing.List[str]] = None
+        self._indicators: typing.Optional[typing.List[str]] = None
+        self._leaks: typing.Optional[typing.List[str]] = None
+        self._markup: typing.Optional[typing.List[str]] = None
+        self._spanners: typing.Optional[typing.List[str]] = None
+        self._spanner_starts: typing.Optional[typing.List[str]] = None
+        self._spanner_stops: typing.Optional[typing.List[str]] = None
+        self._stem_tremolos: typing.Optional[typing.List[str]] = None
+        self._trill_spanner_starts: typing.Optional[typing.List[str]] = None
 
     ### SPECIAL METHODS ###
 
@@ -63,7 +77,7 @@ class SlotContributions(object):
             "stem_tremolos",
             "trill_spanner_starts",
         ]
-        names = [_ for _ in names if getattr(self, _)]
+        names = [_ for _ in names if getattr(self, "_" + _)]
         return abjad.FormatSpecification(
             client=self, storage_format_kwargs_names=names
         )
@@ -75,6 +89,8 @@ class SlotContributions(object):
         """
         Gets articulations.
         """
+        if self._articulations is None:
+            self._articulations = []
         return self._articulations
 
     @property
@@ -82,6 +98,8 @@ class SlotContributions(object):
         """
         Gets commands.
         """
+        if self._commands is None:
+            self._commands = []
         return self._commands
 
     @property
@@ -89,6 +107,8 @@ class SlotContributions(object):
         """
         Gets comments.
         """
+        if self._comments is None:
+            self._comments = []
         return self._comments
 
     @property
@@ -96,29 +116,15 @@ class SlotContributions(object):
         """
         Is true when has contributions.
         """
-        contribution_categories = (
-            "articulations",
-            "commands",
-            "comments",
-            "indicators",
-            "leaks",
-            "markup",
-            "spanners",
-            "spanner_starts",
-            "spanner_stops",
-            "stem_tremolos",
-            "trill_spanner_starts",
-        )
-        return any(
-            getattr(self, contribution_category)
-            for contribution_category in contribution_categories
-        )
+        return any(getattr(self, "_" + _) for _ in self._categories)
 
     @property
     def indicators(self) -> typing.List[str]:
         """
         Gets indicators.
         """
+        if self._indicators is None:
+            self._indicators = []
         return self._indicators
 
     @property
@@ -126,6 +132,8 @@ class SlotContributions(object):
         """
         Gets leaks.
         """
+        if self._leaks is None:
+            self._leaks = []
         return self._leaks
 
     @property
@@ -133,6 +141,8 @@ class SlotContributions(object):
         """
         Gets markup.
         """
+        if self._markup is None:
+            self._markup = []
         return self._markup
 
     @property
@@ -140,6 +150,8 @@ class SlotContributions(object):
         """
         Gets spanner starts.
         """
+        if self._spanner_starts is None:
+            self._spanner_starts = []
         return self._spanner_starts
 
     @property
@@ -147,6 +159,8 @@ class SlotContributions(object):
         """
         Gets spanner stops.
         """
+        if self._spanner_stops is None:
+            self._spanner_stops = []
         return self._spanner_stops
 
     @property
@@ -154,6 +168,8 @@ class SlotContributions(object):
         """
         Gets spanners.
         """
+        if self._spanners is None:
+            self._spanners = []
         return self._spanners
 
     @property
@@ -161,6 +177,8 @@ class SlotContributions(object):
         """
         Gets stem tremolos.
         """
+        if self._stem_tremolos is None:
+            self._stem_tremolos = []
         return self._stem_tremolos
 
     @property
@@ -168,6 +186,8 @@ class SlotContributions(object):
         """
         Gets trill spanner starts.
         """
+        if self._trill_spanner_starts is None:
+            self._trill_spanner_starts = []
         return self._trill_spanner_starts
 
     ### PUBLIC METHODS ###
@@ -184,56 +204,24 @@ class SlotContributions(object):
         """
         import abjad
 
-        self._articulations = abjad.LilyPondFormatManager.tag(
-            self.articulations, tag, deactivate
-        )
-        self._commands = abjad.LilyPondFormatManager.tag(
-            self.commands, tag, deactivate
-        )
-        self._comments = abjad.LilyPondFormatManager.tag(
-            self.comments, tag, deactivate
-        )
-        self._indicators = abjad.LilyPondFormatManager.tag(
-            self.indicators, tag, deactivate
-        )
-        self._leaks = abjad.LilyPondFormatManager.tag(
-            self.leaks, tag, deactivate
-        )
-        self._markup = abjad.LilyPondFormatManager.tag(
-            self.markup, tag, deactivate
-        )
-        self._spanners = abjad.LilyPondFormatManager.tag(
-            self.spanners, tag, deactivate
-        )
-        strings = []
-        # make sure each line of multiline markup is tagged
-        for string in self.spanner_starts:
-            strings.extend(string.split("\n"))
-        self._spanner_starts = abjad.LilyPondFormatManager.tag(
-            strings, tag, deactivate
-        )
-        self._spanner_stops = abjad.LilyPondFormatManager.tag(
-            self.spanner_stops, tag, deactivate
-        )
-        self._stem_tremolos = abjad.LilyPondFormatManager.tag(
-            self.stem_tremolos, tag, deactivate
-        )
+        manager = abjad.LilyPondFormatManager
+        for name in self._categories:
+            if name == "trill_spanner_starts":
+                continue
+            strings = getattr(self, "_" + name)
+            if not strings:
+                continue
+            if name == "spanner_starts":
+                # make sure each line of multiline markup is tagged
+                strings = [_ for string in strings for _ in string.split("\n")]
+            setattr(self, "_" + name, manager.tag(strings, tag, deactivate))
 
     def update(self, slot_contributions):
         """
         Updates contributions.
         """
         assert isinstance(slot_contributions, type(self))
-        self.articulations.extend(slot_contributions.articulations)
-        self.commands.extend(slot_contributions.commands)
-        self.comments.extend(slot_contributions.comments)
-        self.indicators.extend(slot_contributions.indicators)
-        self.leaks.extend(slot_contributions.leaks)
-        self.markup.extend(slot_contributions.markup)
-        self.spanners.extend(slot_contributions.spanners)
-        self.spanner_starts.extend(slot_contributions.spanner_starts)
-        self.spanner_stops.extend(slot_contributions.spanner_stops)
-        self.stem_tremolos.extend(slot_contributions.stem_tremolos)
-        self.trill_spanner_starts.extend(
-            slot_contributions.trill_spanner_starts
-        )
+        for name in self._categories:
+            strings = getattr(slot_contributions, "_" + name)
+            if strings:
+                getattr(self, name).extend(strings)
@@ -25,6 +25,8 @@ class StorageFormatManager(object):
         "_signature_positional_names",
     )
 
+    _attribute_names_cache: dict = {}
+
     _exclude_tools_package = (
         "core",
         "indicators",
@@ -41,6 +43,10 @@ class StorageFormatManager(object):
 
     _indented_whitespace = "    ", "\n", ",\n"
 
+    _signature_cache: dict = {}
+
+    _template_names_cache: dict = {}
+
     ### INITIALIZER ###
 
     def __init__(self, client=None):
@@ -304,7 +310,7 @@ class StorageFormatManager(object):
             kwargs_names = list(kwargs_names)
             names = self.signature_positional_names
             if not self.signature_accepts_args:
-                names += self.signature_keyword_names
+                names = names + self.signature_keyword_names
             names = names[: len(args_values)]
             for name in names:
                 if name in kwargs_names:
@@ -333,11 +339,104 @@ class StorageFormatManager(object):
         parts.append(class_name)
         return parts
 
+    def _get_slotted_values(self, names):
+        # Instances of slotted classes without __getattr__ resolve only
+        # attributes defined on their class; look those up once per class.
+        client = self._client
+        class_ = type(client)
+        try:
+            attribute_names = self._attribute_names_cache[class_]
+        except KeyError:
+            attribute_names = None
+            if not hasattr(class_, "__getattr__") and not hasattr(
+                client, "__dict__"
+            ):
+                attribute_names = {}
+            self._attribute_names_cache[class_] = attribute_names
+        if attribute_names is None:
+            return [self._get(_) for _ in names]
+        values = []
+        for name in names:
+            try:
+                names_ = attribute_names[name]
+            except KeyError:
+                names_ = []
+                for name_ in (name, "_" + name, "_" + name.rstrip("_")):
+                    if name_ not in names_ and hasattr(class_, name_):
+                        names_.append(name_)
+                names_ = tuple(names_)
+                attribute_names[name] = names_
+            value = None
+            for name_ in names_:
+                value = getattr(client, name_, None)
+                if value is not None:
+                    break
+            values.append(value)
+        return values
+
+    def _get_template_names(self):
+        template_names = self.format_specification.template_names
+        if template_names is not None:
+            return template_names
+        if isinstance(self._client, type):
+            class_ = self._client
+        else:
+            class_ = type(self._client)
+        # TODO: This will be factored out when SFS/SFM are removed.
+        if hasattr(self.client, "_get_storage_format_specification"):
+            specification = self.client._get_storage_format_specification()
+            names = specification._keyword_argument_names
+            key = (class_, True, tuple(names or ()))
+        else:
+            names = self.format_specification.storage_format_kwargs_names
+            key = (class_, False, names)
+        try:
+            template_names = self._template_names_cache[key]
+        except KeyError:
+            template_names = self.signature_names
+            template_names.extend(names or ())
+            template_names = tuple(sorted(set(template_names)))
+            self._template_names_cache[key] = template_names
+        return template_names
+
     def _get_whitespace(self, is_indented):
         if is_indented:
             return self._indented_whitespace
         return self._unindented_whitespace
 
+    @staticmethod
+    def _inspect_signature(subject):
+        positional_names = []
+        keyword_names = []
+        accepts_args = False
+        accepts_kwargs = False
+        try:
+            signature = inspect.signature(subject)
+        except ValueError:
+            return ((), (), accepts_args, accepts_kwargs)
+        for name, parameter in signature.parameters.items():
+            if parameter.kind == inspect._POSITIONAL_OR_KEYWORD:
+                if parameter.default == parameter.empty:
+                    positional_names.append(name)
+                else:
+                    keyword_names.append(name)
+            # Python 3 allow keyword only parameters:
+            elif (
+                hasattr(inspect, "_KEYWORD_ONLY")
+                and parameter.kind == inspect._KEYWORD_ONLY
+            ):
+                keyword_names.append(name)
+            elif parameter.kind == inspect._VAR_POSITIONAL:
+                accepts_args = True
+            elif parameter.kind == inspect._VAR_KEYWORD:
+                accepts_kwargs = True
+        return (
+            tuple(positional_names),
+            tuple(keyword_names),
+            accepts_args,
+            accepts_kwargs,
+        )
+
     @staticmethod
     def _make_hashable(value):
         if isinstance(value, dict):
@@ -351,7 +450,7 @@ class StorageFormatManager(object):
     def _map_positional_values_to_names(self, values):
         names = self.signature_positional_names
         if not self.signature_accepts_args:
-            names += self.signature_keyword_names
+            names = names + self.signature_keyword_names
         names = names[: len(values)]
         return names
 
@@ -410,9 +509,14 @@ class StorageFormatManager(object):
         elif not isinstance(object_two, type(object_one)):
             return False
         manager_two = StorageFormatManager(object_two)
-        template_1 = manager_one.get_template_dict()
-        template_2 = manager_two.get_template_dict()
-        return template_1 == template_2
+        names = manager_one._get_template_names()
+        if names != manager_two._get_template_names():
+            template_1 = manager_one.get_template_dict()
+            template_2 = manager_two.get_template_dict()
+            return template_1 == template_2
+        values_1 = manager_one._get_slotted_values(names)
+        values_2 = manager_two._get_slotted_values(names)
+        return values_1 == values_2
 
     def get_class_name_prefix(
         self, as_storage_format, include_root_package=None
@@ -445,8 +549,10 @@ class StorageFormatManager(object):
             values.append(self._client)
         else:
             values.append(type(self._client))
-        template_items = sorted(self.get_template_dict().items())
-        values.extend(self._make_hashable(v) for k, v in template_items)
+        names = sorted(set(self._get_template_names()))
+        values.extend(
+            self._make_hashable(_) for _ in self._get_slotted_values(names)
+        )
         return tuple(values)
 
     def get_repr_format(self):
@@ -534,20 +640,7 @@ class StorageFormatManager(object):
         """
         Gets template dictionary.
         """
-        template_names = self.format_specification.template_names
-        if template_names is None:
-            template_names = self.signature_names
-            # TODO: This will be factored out when SFS/SFM are removed.
-            if hasattr(self.client, "_get_storage_format_specification"):
-                specification = self.client._get_storage_format_specification()
-                template_names.extend(
-                    specification._keyword_argument_names or ()
-                )
-            else:
-                template_names.extend(
-                    self.format_specification.storage_format_kwargs_names or ()
-                )
-            template_names = sorted(set(template_names))
+        template_names = self._get_template_names()
         template_dict = collections.OrderedDict()
         for name in template_names:
             template_dict[name] = self._get(name)
@@ -570,35 +663,22 @@ class StorageFormatManager(object):
         """
         Inspects signature of ``subject``.
         """
-        positional_names = []
-        keyword_names = []
-        accepts_args = False
-        accepts_kwargs = False
         if not isinstance(subject, type):
             subject = type(subject)
         try:
-            signature = inspect.signature(subject)
-        except ValueError:
-            return (
-                positional_names,
-                keyword_names,
-                accepts_args,
-                accepts_kwargs,
-            )
-        for name, parameter in signature.parameters.items():
-            if parameter.kind == inspect._POSITIONAL_OR_KEYWORD:
-                if parameter.default == parameter.empty:
-                    positional_names.append(name)
-                else:
-                    keyword_names.append(name)
-            # Python 3 allow keyword only parameters:
-            elif (
-                hasattr(inspect, "_KEYWORD_ONLY")
-                and parameter.kind == inspect._KEYWORD_ONLY
-            ):
-                keyword_names.append(name)
-            elif parameter.kind == inspect._VAR_POSITIONAL:
-                accepts_args = True
-            elif parameter.kind == inspect._VAR_KEYWORD:
-                accepts_kwargs = True
-        return (positional_names, keyword_names, accepts_args, accepts_kwargs)
+            signature = class_._signature_cache[subject]
+        except KeyError:
+            signature = class_._inspect_signature(subject)
+            class_._signature_cache[subject] = signature
+        (
+            positional_names,
+            keyword_names,
+            accepts_args,
+            accepts_kwargs,
+        ) = signature
+        return (
+            list(positional_names),
+            list(keyword_names),
+            accepts_args,
+            accepts_kwargs,
+        )
@@ -104,7 +104,7 @@ class Tag(object):
             True
 
         """
-        return bool(str(self))
+        return bool(self._string)
 
     def __contains__(self, argument) -> bool:
         """
@@ -205,7 +205,7 @@ class Tag(object):
             '-PARTS:-SCORE:DEFAULT_CLEF'
 
         """
-        return self.string or ""
+        return self._string or ""
 
     ### PRIVATE METHODS ###
 
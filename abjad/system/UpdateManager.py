@@ -1,10 +1,7 @@
 from abjad import enums
 from abjad import exceptions
-from abjad import mathtools
 from abjad.indicators.MetronomeMark import MetronomeMark
 from abjad.indicators.TimeSignature import TimeSignature
-from abjad.timespans import AnnotatedTimespan
-from abjad.timespans import TimespanList
 from abjad.top.inspect import inspect
 from abjad.top.iterate import iterate
 from abjad.top.new import new
@@ -52,11 +49,10 @@ class UpdateManager(object):
         main_leaf = container._main_leaf
         main_leaf_stop_offset = main_leaf._stop_offset
         assert main_leaf_stop_offset is not None
+        index = container.index(leaf)
         displacement = -leaf.written_duration
-        sibling = leaf._sibling(1)
-        while sibling is not None and sibling._parent is container:
+        for sibling in container._components[index + 1 :]:
             displacement -= sibling.written_duration
-            sibling = sibling._sibling(1)
         start_offset = Offset(main_leaf_stop_offset, displacement=displacement)
         displacement += leaf.written_duration
         stop_offset = Offset(main_leaf_stop_offset, displacement=displacement)
@@ -68,11 +64,10 @@ class UpdateManager(object):
         main_leaf = container._main_leaf
         main_leaf_start_offset = main_leaf._start_offset
         assert main_leaf_start_offset is not None
+        index = container.index(leaf)
         displacement = -leaf.written_duration
-        sibling = leaf._sibling(1)
-        while sibling is not None and sibling._parent is container:
+        for sibling in container._components[index + 1 :]:
             displacement -= sibling.written_duration
-            sibling = sibling._sibling(1)
         start_offset = Offset(
             main_leaf_start_offset, displacement=displacement
         )
@@ -86,11 +81,10 @@ class UpdateManager(object):
         main_leaf = container._main_leaf
         main_leaf_start_offset = main_leaf._start_offset
         assert main_leaf_start_offset is not None
+        index = container.index(leaf)
         start_displacement = Duration(0)
-        sibling = leaf._sibling(-1)
-        while sibling is not None and sibling._parent is container:
+        for sibling in container._components[:index]:
             start_displacement += sibling.written_duration
-            sibling = sibling._sibling(-1)
         stop_displacement = start_displacement + leaf.written_duration
         if start_displacement == 0:
             start_displacement = None
@@ -102,40 +96,28 @@ class UpdateManager(object):
         )
         return start_offset, stop_offset
 
-    def _get_measure_start_offsets(self, component):
-        wrappers = []
-        prototype = TimeSignature
+    def _get_measure_map(self, component):
         root = inspect(component).parentage().root
-        for component_ in self._iterate_entire_score(root):
-            wrappers_ = inspect(component_).wrappers(prototype)
-            wrappers.extend(wrappers_)
-        pairs = []
-        for wrapper in wrappers:
-            component = wrapper.component
-            start_offset = inspect(component).timespan().start_offset
-            time_signature = wrapper.indicator
-            pair = start_offset, time_signature
-            pairs.append(pair)
-        offset_zero = Offset(0)
-        default_time_signature = TimeSignature((4, 4))
-        default_pair = (offset_zero, default_time_signature)
-        if pairs and not pairs[0] == offset_zero:
-            pairs.insert(0, default_pair)
-        elif not pairs:
-            pairs = [default_pair]
-        pairs.sort(key=lambda x: x[0])
-        score_stop_offset = inspect(root).timespan().stop_offset
-        dummy_last_pair = (score_stop_offset, None)
-        pairs.append(dummy_last_pair)
-        measure_start_offsets = []
-        for current_pair, next_pair in Sequence(pairs).nwise():
-            current_start_offset, current_time_signature = current_pair
-            next_start_offset, next_time_signature = next_pair
-            measure_start_offset = current_start_offset
-            while measure_start_offset < next_start_offset:
-                measure_start_offsets.append(measure_start_offset)
-                measure_start_offset += current_time_signature.duration
-        return measure_start_offsets
+        if getattr(root, "_main_leaf", None) is not None:
+            return self._make_measure_map(root)
+        if root._measure_map is None:
+            root._measure_map = self._make_measure_map(root)
+        return root._measure_map
+
+    @staticmethod
+    def _get_offset_prolation(component):
+        """
+        Gets prolation with which ``_update_subtree_offsets()`` visits
+        ``component``; parents must be updated first.
+        """
+        parent = component._parent
+        if parent is None:
+            return Multiplier(1)
+        if parent._offset_prolation is None:
+            return None
+        return parent._offset_prolation * getattr(
+            parent, "implied_prolation", 1
+        )
 
     @staticmethod
     def _get_score_tree_state_flags(parentage):
@@ -158,6 +140,16 @@ class UpdateManager(object):
             offsets_in_seconds_are_current,
         )
 
+    def _get_tempo_map(self, component):
+        root = inspect(component).parentage().root
+        if getattr(root, "_main_leaf", None) is not None:
+            self._update_offsets_incrementally(root)
+            return self._make_tempo_map(root)
+        if root._tempo_map is None:
+            self._update_offsets_incrementally(root)
+            root._tempo_map = self._make_tempo_map(root)
+        return root._tempo_map
+
     @staticmethod
     def _iterate_entire_score(root):
         """
@@ -168,7 +160,50 @@ class UpdateManager(object):
         components.extend(graces)
         return components
 
-    def _make_metronome_mark_map(self, root):
+    def _make_measure_map(self, root):
+        from abjad.core.MeasureMap import MeasureMap
+
+        wrappers = []
+        prototype = TimeSignature
+        for component in self._iterate_entire_score(root):
+            wrappers_ = inspect(component).wrappers(prototype)
+            wrappers.extend(wrappers_)
+        pairs = []
+        for wrapper in wrappers:
+            component = wrapper.component
+            start_offset = inspect(component).timespan().start_offset
+            time_signature = wrapper.indicator
+            pair = start_offset, time_signature
+            pairs.append(pair)
+        offset_zero = Offset(0)
+        default_time_signature = TimeSignature((4, 4))
+        default_pair = (offset_zero, default_time_signature)
+        if pairs and not pairs[0] == offset_zero:
+            pairs.insert(0, default_pair)
+        elif not pairs:
+            pairs = [default_pair]
+        pairs.sort(key=lambda x: x[0])
+        score_stop_offset = inspect(root).timespan().stop_offset
+        dummy_last_pair = (score_stop_offset, None)
+        pairs.append(dummy_last_pair)
+        measure_start_offsets, time_signatures = [], []
+        for current_pair, next_pair in Sequence(pairs).nwise():
+            current_start_offset, current_time_signature = current_pair
+            next_start_offset, next_time_signature = next_pair
+            measure_start_offset = current_start_offset
+            while measure_start_offset < next_start_offset:
+                measure_start_offsets.append(measure_start_offset)
+                time_signatures.append(current_time_signature)
+                measure_start_offset += current_time_signature.duration
+        return MeasureMap(
+            measure_start_offsets=measure_start_offsets,
+            time_signatures=time_signatures,
+            stop_offset=score_stop_offset,
+        )
+
+    def _make_tempo_map(self, root):
+        from abjad.core.TempoMap import TempoMap
+
         pairs = []
         all_stop_offsets = set()
         for component in self._iterate_entire_score(root):
@@ -182,56 +217,11 @@ class UpdateManager(object):
                 all_stop_offsets.add(component._stop_offset)
         pairs.sort(key=lambda _: _[0])
         if not pairs:
-            return
+            return TempoMap()
         if pairs[0][0] != 0:
-            return
+            return TempoMap()
         score_stop_offset = max(all_stop_offsets)
-        timespans = TimespanList()
-        clocktime_rate = MetronomeMark((1, 4), 60)
-        clocktime_start_offset = Offset(0)
-        for left, right in Sequence(pairs).nwise(wrapped=True):
-            metronome_mark = left[-1]
-            start_offset = left[0]
-            stop_offset = right[0]
-            # last timespan
-            if stop_offset == 0:
-                stop_offset = score_stop_offset
-            duration = stop_offset - start_offset
-            multiplier = Multiplier(60, metronome_mark.units_per_minute)
-            clocktime_duration = duration / metronome_mark.reference_duration
-            clocktime_duration *= multiplier
-            timespan = AnnotatedTimespan(
-                start_offset=start_offset,
-                stop_offset=stop_offset,
-                annotation=(clocktime_start_offset, clocktime_duration),
-            )
-            timespans.append(timespan)
-            clocktime_start_offset += clocktime_duration
-        return timespans
-
-    # TODO: reimplement with some type of bisection
-    def _to_measure_number(self, component, measure_start_offsets):
-        component_start_offset = inspect(component).timespan().start_offset
-        displacement = component_start_offset.displacement
-        if displacement is not None:
-            component_start_offset = Offset(
-                component_start_offset, displacement=None
-            )
-            # score-initial grace music only:
-            if displacement < 0 and component_start_offset == 0:
-                measure_number = 0
-                return measure_number
-        measure_start_offsets = measure_start_offsets[:]
-        measure_start_offsets.append(mathtools.Infinity())
-        pairs = Sequence(measure_start_offsets)
-        pairs = pairs.nwise()
-        for measure_index, pair in enumerate(pairs):
-            if pair[0] <= component_start_offset < pair[-1]:
-                measure_number = measure_index + 1
-                return measure_number
-        message = f"can not find measure number for {repr(component)}:\n"
-        message += f"   {repr(measure_start_offsets)}"
-        raise ValueError(message)
+        return TempoMap(pairs=pairs, stop_offset=score_stop_offset)
 
     def _update_all_indicators(self, root):
         """
@@ -262,55 +252,37 @@ class UpdateManager(object):
                 on_beat_grace_music.append(component)
             else:
                 self._update_component_offsets(component)
+                prolation = self._get_offset_prolation(component)
+                component._offset_prolation = prolation
                 component._offsets_are_current = True
         for component in on_beat_grace_music:
             self._update_component_offsets(component)
+            prolation = self._get_offset_prolation(component)
+            component._offset_prolation = prolation
             component._offsets_are_current = True
 
     def _update_all_offsets_in_seconds(self, root):
-        self._update_all_offsets(root)
-        timespans = self._make_metronome_mark_map(root)
+        self._update_offsets_incrementally(root)
+        tempo_map = self._get_tempo_map(root)
         for component in self._iterate_entire_score(root):
-            self._update_clocktime_offsets(component, timespans)
+            self._update_clocktime_offsets(component, tempo_map)
             component._offsets_in_seconds_are_current = True
 
     @staticmethod
-    def _update_clocktime_offsets(component, timespans):
-        if not timespans:
+    def _update_clocktime_offsets(component, tempo_map):
+        if not tempo_map:
             return
-        for timespan in timespans:
-            if (
-                timespan.start_offset
-                <= component._start_offset
-                < timespan.stop_offset
-            ):
-                pair = timespan.annotation
-                clocktime_start_offset, clocktime_duration = pair
-                local_offset = component._start_offset - timespan.start_offset
-                multiplier = local_offset / timespan.duration
-                duration = multiplier * clocktime_duration
-                offset = clocktime_start_offset + duration
-                component._start_offset_in_seconds = Offset(offset)
-            if (
-                timespan.start_offset
-                <= component._stop_offset
-                < timespan.stop_offset
-            ):
-                pair = timespan.annotation
-                clocktime_start_offset, clocktime_duration = pair
-                local_offset = component._stop_offset - timespan.start_offset
-                multiplier = local_offset / timespan.duration
-                duration = multiplier * clocktime_duration
-                offset = clocktime_start_offset + duration
-                component._stop_offset_in_seconds = Offset(offset)
-                return
-        if component._stop_offset == timespans[-1].stop_offset:
-            pair = timespans[-1].annotation
-            clocktime_start_offset, clocktime_duration = pair
-            offset = clocktime_start_offset + clocktime_duration
-            component._stop_offset_in_seconds = Offset(offset)
-            return
-        raise Exception(f"can not find {stop_offset} in {timespans}.")
+        start_offset = tempo_map._to_clocktime(component._start_offset)
+        if start_offset is not None:
+            component._start_offset_in_seconds = start_offset
+        stop_offset = tempo_map._to_clocktime(
+            component._stop_offset, stop=True
+        )
+        if stop_offset is None:
+            message = f"can not find {component._stop_offset!r}"
+            message += f" in {tempo_map!r}."
+            raise Exception(message)
+        component._stop_offset_in_seconds = stop_offset
 
     @classmethod
     def _update_component_offsets(class_, component):
@@ -360,15 +332,8 @@ class UpdateManager(object):
         component._stop_offset = stop_offset
         component._timespan._start_offset = start_offset
         component._timespan._stop_offset = stop_offset
-
-    def _update_measure_numbers(self, component):
-        measure_start_offsets = self._get_measure_start_offsets(component)
-        root = inspect(component).parentage().root
-        for component in self._iterate_entire_score(root):
-            measure_number = self._to_measure_number(
-                component, measure_start_offsets
-            )
-            component._measure_number = measure_number
+        if hasattr(component, "_dependent_wrapper_index"):
+            component._dependent_wrapper_index = None
 
     def _update_now(
         self,
@@ -391,8 +356,103 @@ class UpdateManager(object):
             ) = self._get_score_tree_state_flags(parentage)
         root = parentage.root
         if offsets and not offsets_are_current:
-            self._update_all_offsets(root)
+            self._update_offsets_incrementally(root)
         if offsets_in_seconds and not offsets_in_seconds_are_current:
             self._update_all_offsets_in_seconds(root)
         if indicators and not indicators_are_current:
             self._update_all_indicators(root)
+
+    def _update_offsets_incrementally(self, root):
+        """
+        Updates offsets of dirty components only.
+
+        ``Component._update_later()`` clears the offsets-are-current flag of
+        every component in the parentage of an edit. Walks down from
+        ``root`` and recomputes only dirty components and components whose
+        start offset or prolation has changed; clean subtrees that have
+        neither moved nor been reprolated are skipped without visiting their
+        descendants.
+
+        Gives the same offsets as ``_update_all_offsets()``.
+        """
+        from abjad.core.OnBeatGraceContainer import OnBeatGraceContainer
+
+        if hasattr(root, "_main_leaf"):
+            self._update_all_offsets(root)
+            return
+        grace_containers = []
+        self._update_subtree_offsets(
+            root, Offset(0), Multiplier(1), grace_containers
+        )
+        on_beat_grace_music = []
+        for grace_container in grace_containers:
+            for component in iterate(grace_container).components():
+                if isinstance(component, OnBeatGraceContainer) or isinstance(
+                    component._parent, OnBeatGraceContainer
+                ):
+                    on_beat_grace_music.append(component)
+                else:
+                    self._update_component_offsets(component)
+                    component._offsets_are_current = True
+        for component in on_beat_grace_music:
+            self._update_component_offsets(component)
+            component._offsets_are_current = True
+
+    @classmethod
+    def _update_subtree_offsets(
+        class_, component, start_offset, prolation, grace_containers
+    ):
+        grace_containers_ = (
+            getattr(component, "_grace_container", None),
+            getattr(component, "_on_beat_grace_container", None),
+            getattr(component, "_after_grace_container", None),
+        )
+        container = grace_containers_[1]
+        if container is not None:
+            durations = [_.written_duration for _ in container]
+            start_displacement = sum(durations)
+            start_offset = Offset(
+                start_offset, displacement=start_displacement
+            )
+        if (
+            component._offsets_are_current
+            and component._start_offset is not None
+            and component._start_offset == start_offset
+            and component._offset_prolation == prolation
+        ):
+            for container in grace_containers_:
+                if (
+                    container is not None
+                    and not container._offsets_are_current
+                ):
+                    grace_containers.append(container)
+            return
+        if hasattr(component, "_components"):
+            prolation_ = prolation * getattr(component, "implied_prolation", 1)
+            stop_offset = start_offset
+            if component.simultaneous:
+                for child in component:
+                    class_._update_subtree_offsets(
+                        child, start_offset, prolation_, grace_containers
+                    )
+                    stop_offset = max(stop_offset, child._stop_offset)
+            else:
+                for child in component:
+                    class_._update_subtree_offsets(
+                        child, stop_offset, prolation_, grace_containers
+                    )
+                    stop_offset = child._stop_offset
+        else:
+            duration = prolation * component._get_preprolated_duration()
+            stop_offset = start_offset + duration
+            for container in grace_containers_:
+                if container is not None:
+                    grace_containers.append(container)
+        component._start_offset = start_offset
+        component._stop_offset = stop_offset
+        component._timespan._start_offset = start_offset
+        component._timespan._stop_offset = stop_offset
+        if hasattr(component, "_dependent_wrapper_index"):
+            component._dependent_wrapper_index = None
+        component._offset_prolation = prolation
+        component._offsets_are_current = True
@@ -354,25 +354,49 @@ class Wrapper(object):
 
     ### PRIVATE METHODS ###
 
-    def _bind_component(self, component):
+    def _bind_component(self, component, check_duplicate_indicator=True):
         if getattr(self.indicator, "context", None) is not None:
-            self._warn_duplicate_indicator(component)
+            if check_duplicate_indicator is True:
+                self._warn_duplicate_indicator(component)
             self._unbind_component()
             self._component = component
             self._update_effective_context()
             if getattr(self.indicator, "_mutates_offsets_in_seconds", False):
                 self._component._update_later(offsets_in_seconds=True)
         component._wrappers.append(self)
+        component._clear_cached_leaf_table()
+        self._clear_cached_format(component)
+        if getattr(self.indicator, "_mutates_measure_map", False):
+            self._clear_measure_map(component)
 
     def _bind_effective_context(self, correct_effective_context):
         self._unbind_effective_context()
         if correct_effective_context is not None:
             correct_effective_context._dependent_wrappers.append(self)
+            correct_effective_context._dependent_wrapper_index = None
         self._effective_context = correct_effective_context
         self._update_effective_context()
         if getattr(self.indicator, "_mutates_offsets_in_seconds", False):
             correct_effective_context._update_later(offsets_in_seconds=True)
 
+    def _clear_cached_format(self, component):
+        import abjad
+
+        # sounding-pitch notes and chords format with effective instrument
+        if isinstance(self.indicator, abjad.Instrument):
+            component = abjad.inspect(component).parentage().root
+        # later leaves format with effective context indicators
+        elif self._effective_context is not None:
+            component = self._effective_context
+        component._clear_cached_format(descendants=True)
+
+    @staticmethod
+    def _clear_measure_map(component):
+        import abjad
+
+        for component_ in abjad.inspect(component).parentage():
+            component_._measure_map = None
+
     def _detach(self):
         self._unbind_component()
         self._unbind_effective_context()
@@ -466,6 +490,12 @@ class Wrapper(object):
     def _unbind_component(self):
         if self._component is not None and self in self._component._wrappers:
             self._component._wrappers.remove(self)
+            self._component._clear_cached_leaf_table()
+            self._clear_cached_format(self._component)
+            if getattr(self.indicator, "_mutates_measure_map", False):
+                self._clear_measure_map(self._component)
+            if getattr(self.indicator, "_mutates_offsets_in_seconds", False):
+                self._component._update_later(offsets_in_seconds=True)
         self._component = None
 
     def _unbind_effective_context(self):
@@ -474,6 +504,7 @@ class Wrapper(object):
             and self in self._effective_context._dependent_wrappers
         ):
             self._effective_context._dependent_wrappers.remove(self)
+            self._effective_context._dependent_wrapper_index = None
         self._effective_context = None
 
     def _update_effective_context(self):
@@ -482,15 +513,18 @@ class Wrapper(object):
         if self._effective_context is not correct_effective_context:
             self._bind_effective_context(correct_effective_context)
 
-    def _warn_duplicate_indicator(self, component):
+    def _warn_duplicate_indicator(self, component, exclude=None):
         import abjad
 
         if self.deactivate is True:
             return
         prototype = type(self.indicator)
         command = getattr(self.indicator, "command", None)
-        wrapper = abjad.inspect(component).effective_wrapper(
-            prototype, attributes={"command": command}
+        wrapper = component._get_effective(
+            prototype,
+            attributes={"command": command},
+            exclude=exclude,
+            unwrap=False,
         )
         if (
             wrapper is None
@@ -578,6 +612,8 @@ class Wrapper(object):
     def deactivate(self, argument):
         assert argument in (True, False, None)
         self._deactivate: typing.Optional[bool] = argument
+        if self.component is not None:
+            self._clear_cached_format(self.component)
 
     @property
     def indicator(self) -> typing.Any:
@@ -625,3 +661,5 @@ class Wrapper(object):
             raise Exception(f"string or tag: {argument!r}.")
         tag = Tag(argument)
         self._tag = tag
+        if self.component is not None:
+            self._clear_cached_format(self.component)
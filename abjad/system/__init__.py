@@ -8,11 +8,13 @@ from .Configuration import Configuration
 from .ContextManager import ContextManager
 from .FilesystemState import FilesystemState
 from .ForbidUpdate import ForbidUpdate
+from .FormatCache import FormatCache
 from .FormatSpecification import FormatSpecification
 from .IOManager import IOManager
 from .LilyPondFormatBundle import LilyPondFormatBundle
 from .LilyPondFormatManager import LilyPondFormatManager
 from .NullContextManager import NullContextManager
+from .ParseCache import ParseCache
 from .Parser import Parser
 from .PersistenceManager import PersistenceManager
 from .ProgressIndicator import ProgressIndicator
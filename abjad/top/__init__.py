@@ -5,6 +5,7 @@ Abjad's top-level functions.
 from .activate import activate
 from .annotate import annotate
 from .attach import attach
+from .attach_many import attach_many
 from .deactivate import deactivate
 from .detach import detach
 from .f import f
@@ -16,6 +17,7 @@ from .mutate import mutate
 from .new import new
 from .override import override
 from .parse import parse
+from .parse_many import parse_many
 from .persist import persist
 from .play import play
 from .select import select
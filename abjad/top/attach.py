@@ -7,6 +7,7 @@ def attach(
     synthetic_offset=None,
     tag=None,
     wrapper=None,
+    check_duplicate_indicator=True,
 ):
     r"""
     Attaches ``attachable`` to ``target``.
@@ -206,6 +207,10 @@ def attach(
             )
 
     Otherwise returns none.
+
+    Set ``check_duplicate_indicator`` to false to skip the duplicate
+    indicator check; ``abjad.attach_many()`` uses this to check a batch of
+    indicators only once all indicators in the batch have been attached.
     """
     import abjad
 
@@ -283,13 +288,16 @@ def attach(
 
     wrapper_ = abjad.Wrapper(
         annotation=annotation,
-        component=component,
         context=context,
         deactivate=deactivate,
         indicator=attachable,
         synthetic_offset=synthetic_offset,
         tag=tag,
     )
+    wrapper_._component = component
+    wrapper_._bind_component(
+        component, check_duplicate_indicator=check_duplicate_indicator
+    )
 
     if wrapper is True:
         return wrapper_
@@ -0,0 +1,116 @@
+from .attach import attach
+
+
+def attach_many(
+    pairs,
+    context=None,
+    deactivate=None,
+    do_not_test=None,
+    synthetic_offset=None,
+    tag=None,
+    wrapper=None,
+):
+    r"""
+    Attaches each ``(attachable, target)`` pair in ``pairs``.
+
+    ..  container:: example
+
+        Attaches dynamics to notes in staff:
+
+        >>> staff = abjad.Staff("c'4 d' e' f'")
+        >>> strings = ['p', 'mp', 'mf', 'f']
+        >>> pairs = [(abjad.Dynamic(_), __) for _, __ in zip(strings, staff)]
+        >>> abjad.attach_many(pairs)
+        >>> abjad.show(staff) # doctest: +SKIP
+
+        ..  docs::
+
+            >>> abjad.f(staff)
+            \new Staff
+            {
+                c'4
+                \p
+                d'4
+                \mp
+                e'4
+                \mf
+                f'4
+                \f
+            }
+
+    ..  container:: example
+
+        Same as calling ``abjad.attach()`` on each pair in turn, except that
+        duplicate contexted indicators are checked only once all indicators
+        have been attached. Raises the same persistent indicator error as
+        ``abjad.attach()``:
+
+        >>> staff = abjad.Staff("c'4 d' e' f'")
+        >>> pairs = [
+        ...     (abjad.Clef('treble'), staff[0]),
+        ...     (abjad.Clef('alto'), staff[0]),
+        ...     ]
+        >>> abjad.attach_many(pairs)
+        Traceback (most recent call last):
+            ...
+        abjad...PersistentIndicatorError: Can not attach ...
+
+        Leaves attached only those indicators that precede the first
+        offending indicator:
+
+        >>> abjad.inspect(staff[0]).indicators(abjad.Clef)
+        [Clef('treble')]
+
+    ..  container:: example
+
+        Returns wrappers when ``wrapper`` is true:
+
+        >>> staff = abjad.Staff("c'4 d' e' f'")
+        >>> pairs = [
+        ...     (abjad.Clef('alto'), staff[0]),
+        ...     (abjad.Clef('treble'), staff[2]),
+        ...     ]
+        >>> for wrapper in abjad.attach_many(pairs, wrapper=True):
+        ...     wrapper
+        ...
+        Wrapper(context='Staff', indicator=Clef('alto'), tag=Tag())
+        Wrapper(context='Staff', indicator=Clef('treble'), tag=Tag())
+
+    Attaching contexted indicators one at a time checks each indicator for
+    duplicates against the whole score; attaching many contexted indicators
+    to a large score in a batch is much faster.
+
+    Keywords apply to every pair; see ``abjad.attach()``.
+
+    Otherwise returns none.
+    """
+    wrappers = []
+    for attachable, target in pairs:
+        wrapper_ = attach(
+            attachable,
+            target,
+            context=context,
+            deactivate=deactivate,
+            do_not_test=do_not_test,
+            synthetic_offset=synthetic_offset,
+            tag=tag,
+            wrapper=True,
+            check_duplicate_indicator=False,
+        )
+        if wrapper_ is not None:
+            wrappers.append(wrapper_)
+    pending = set(id(_) for _ in wrappers if _.context is not None)
+    for i, wrapper_ in enumerate(wrappers):
+        if wrapper_.context is None:
+            continue
+        try:
+            wrapper_._warn_duplicate_indicator(
+                wrapper_.component, exclude=pending
+            )
+        except Exception:
+            for wrapper__ in wrappers[i:]:
+                wrapper__._detach()
+            raise
+        pending.remove(id(wrapper_))
+    if wrapper is True:
+        return wrappers
@@ -59,4 +59,6 @@ def override(argument):
     if getattr(argument, "_overrides", None) is None:
         manager = abjad.lilypondnames.LilyPondGrobNameManager()
         argument._overrides = manager
+    if hasattr(argument, "_clear_cached_format"):
+        argument._clear_cached_format()
     return argument._overrides
@@ -1,8 +1,94 @@
+import functools
+import re
 import typing
 
+_leaf_pitch_pattern = r"[a-g](?:tqs|tqf|qs|qf|ss|ff|s|f)?(?:'+|,+)?"
+
+_leaf_string_regex = re.compile(
+    r"""
+    (?:
+        (?P<rest>r)
+        |(?P<pitch>{pitch})
+        |<\s*(?P<pitches>{pitch}(?:\s+{pitch})*)\s*>
+    )
+    (?P<denominator>1|2|4|8|16|32|64|128)
+    (?P<dots>\.*)
+    (?:\s*\*\s*(?P<numerator_>[1-9]\d*)(?:/(?P<denominator_>[1-9]\d*))?)?
+    (?P<tie>\s*~)?
+    """.format(
+        pitch=_leaf_pitch_pattern
+    ),
+    re.VERBOSE,
+)
+
 _lilypond_parsers_by_language: typing.Dict = {}
 
 
+@functools.lru_cache(maxsize=1024)
+def _make_leaf_prototype(string):
+    """
+    Makes leaf prototype from simple LilyPond leaf ``string``.
+
+    Reads pitch (or chord pitches, or rest), duration, dots, multiplier and
+    tie; returns none for all other strings.
+
+    Caches prototypes: callers copy from prototypes and never change them.
+    """
+    from abjad.core.Chord import Chord
+    from abjad.core.Note import Note
+    from abjad.core.Rest import Rest
+    from abjad.indicators.Tie import Tie
+    from abjad.top.attach import attach
+    from abjad.utilities.Duration import Duration
+    from abjad.utilities.Multiplier import Multiplier
+
+    match = _leaf_string_regex.fullmatch(string.strip())
+    if match is None:
+        return None
+    if match.group("rest") and match.group("tie"):
+        return None
+    duration = Duration(1, int(match.group("denominator")))
+    written_duration = duration
+    for _ in match.group("dots"):
+        duration /= 2
+        written_duration += duration
+    multiplier = None
+    if match.group("numerator_"):
+        numerator = int(match.group("numerator_"))
+        denominator = int(match.group("denominator_") or 1)
+        multiplier = Multiplier(numerator, denominator)
+    if match.group("rest"):
+        return Rest(written_duration, multiplier=multiplier)
+    if match.group("pitch"):
+        leaf = Note(
+            match.group("pitch"), written_duration, multiplier=multiplier
+        )
+    else:
+        pitches = match.group("pitches").split()
+        leaf = Chord(pitches, written_duration, multiplier=multiplier)
+    if match.group("tie"):
+        attach(Tie(), leaf)
+    return leaf
+
+
+def _parse_leaf_string(string):
+    """
+    Parses LilyPond leaf ``string``.
+
+    Tries fast path for simple leaf strings before full LilyPond parser.
+
+    Returns leaf; callers must copy from leaf rather than change leaf.
+    """
+    from abjad.core.Leaf import Leaf
+
+    leaf = _make_leaf_prototype(string)
+    if leaf is None:
+        parsed = parse(f"{{ {string} }}")
+        assert len(parsed) == 1 and isinstance(parsed[0], Leaf)
+        leaf = parsed[0]
+    return leaf
+
+
 def parse(string, language="english"):
     r"""
     Parses LilyPond ``string``.
@@ -24,16 +110,28 @@ def parse(string, language="english"):
         ...     )
         >>> abjad.show(container) # doctest: +SKIP
 
+    Copies parsed components from cache when parse cache is active.
+
     Returns Abjad component.
     """
     import abjad.parser
     import abjad.rhythmtrees
+    from abjad.system.ParseCache import ParseCache
 
+    cache = ParseCache._current
+    if cache is not None:
+        result = cache._get((string, language))
+        if result is not None:
+            return result
     if string.startswith("abj:"):
-        return abjad.parser.parse_reduced_ly_syntax(string[4:])
+        result = abjad.parser.parse_reduced_ly_syntax(string[4:])
     elif string.startswith("rtm:"):
-        return abjad.rhythmtrees.parse_rtm_syntax(string[4:])
-    if language not in _lilypond_parsers_by_language:
-        parser = abjad.parser.LilyPondParser(default_language=language)
-        _lilypond_parsers_by_language[language] = parser
-    return _lilypond_parsers_by_language[language](string)
+        result = abjad.rhythmtrees.parse_rtm_syntax(string[4:])
+    else:
+        if language not in _lilypond_parsers_by_language:
+            parser = abjad.parser.LilyPondParser(default_language=language)
+            _lilypond_parsers_by_language[language] = parser
+        result = _lilypond_parsers_by_language[language](string)
+    if cache is not None:
+        cache._set((string, language), result)
+    return result
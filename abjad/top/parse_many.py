@@ -0,0 +1,100 @@
+import itertools
+import multiprocessing
+import pickle
+from .parse import _lilypond_parsers_by_language
+from .parse import parse
+
+_worker_language = None
+
+
+def _initialize_worker(language):
+    import abjad.parser
+
+    global _worker_language
+    _worker_language = language
+    if language not in _lilypond_parsers_by_language:
+        parser = abjad.parser.LilyPondParser(default_language=language)
+        _lilypond_parsers_by_language[language] = parser
+
+
+def _parse_in_worker(string):
+    result = _parse_or_return_exception(string, _worker_language)
+    if isinstance(result, Exception):
+        try:
+            pickle.dumps(result)
+        except Exception:
+            result = type(result)(str(result))
+    return result
+
+
+def _parse_or_return_exception(string, language):
+    try:
+        return parse(string, language=language)
+    except Exception as exception:
+        return exception
+
+
+def parse_many(strings, language="english", workers=None):
+    r"""
+    Parses each LilyPond string in ``strings``.
+
+    ..  container:: example
+
+        Parses LilyPond strings:
+
+        >>> strings = ["{c'4 d'4}", "{e'4 f'4}"]
+        >>> for container in abjad.parse_many(strings):
+        ...     abjad.f(container)
+        ...
+        {
+            c'4
+            d'4
+        }
+        {
+            e'4
+            f'4
+        }
+
+    ..  container:: example
+
+        Yields exception in place of component when string does not parse:
+
+        >>> strings = ["{c'4 d'4}", "{c'4 x'4}", "{e'4 f'4}"]
+        >>> for result in abjad.parse_many(strings):
+        ...     result
+        ...
+        Container("c'4 d'4")
+        LilyPondParserError(LexToken(STRING,'x',1,5))
+        Container("e'4 f'4")
+
+    ..  container:: example
+
+        Set ``workers`` to a positive integer to parse in that many worker
+        processes; each worker process keeps its own LilyPond parser.
+        Worker processes send exceptions that do not pickle as exceptions of
+        the same type with message only:
+
+        >>> results = abjad.parse_many(strings, workers=2)
+        >>> list(results)
+        [Container("c'4 d'4"), LilyPondParserError(...), Container("e'4 f'4")]
+
+    Yields results in input order. Consumes ``strings`` lazily; parses
+    strings in batches when ``workers`` is set.
+
+    Returns generator.
+    """
+    if workers is None:
+        for string in strings:
+            yield _parse_or_return_exception(string, language)
+        return
+    assert isinstance(workers, int) and 0 < workers, repr(workers)
+    iterator = iter(strings)
+    batch_size = 32 * workers
+    with multiprocessing.Pool(
+        processes=workers, initializer=_initialize_worker, initargs=(language,)
+    ) as pool:
+        while True:
+            batch = list(itertools.islice(iterator, batch_size))
+            if not batch:
+                break
+            yield from pool.map(_parse_in_worker, batch)
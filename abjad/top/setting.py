@@ -39,4 +39,6 @@ def setting(argument):
     if getattr(argument, "_lilypond_setting_name_manager", None) is None:
         manager = abjad.lilypondnames.LilyPondSettingNameManager()
         argument._lilypond_setting_name_manager = manager
+    if hasattr(argument, "_clear_cached_format"):
+        argument._clear_cached_format()
     return argument._lilypond_setting_name_manager
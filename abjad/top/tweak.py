@@ -249,6 +249,10 @@ def tweak(argument, deactivate=None, expression=None, tag=None):
     if not hasattr(argument, "_tweaks"):
         name = type(argument).__name__
         raise NotImplementedError(f"{name} does not allow tweaks (yet).")
+    if hasattr(argument, "_clear_client_caches"):
+        argument._clear_client_caches()
+    elif hasattr(argument, "_clear_cached_format"):
+        argument._clear_cached_format()
     if argument._tweaks is None:
         manager = abjad.LilyPondTweakManager(deactivate=deactivate, tag=tag)
         argument._tweaks = manager
@@ -1,4 +1,5 @@
 import abjad
+import pytest
 
 
 def test_Container_index_01():
@@ -12,3 +13,45 @@ def test_Container_index_01():
     assert container.index(container[1]) == 1
     assert container.index(container[2]) == 2
     assert container.index(container[3]) == 3
+
+
+def test_Container_index_02():
+    """
+    Indices stay current after insertion, deletion, pop and removal.
+    """
+
+    container = abjad.Container("c'4 d'4 e'4 f'4 g'4 a'4")
+    container.insert(1, abjad.Note("b'4"))
+    del container[3:5]
+    container.pop(0)
+    container.remove(container[-1])
+    container.append("c''4")
+
+    for i, component in enumerate(container):
+        assert container.index(component) == i
+
+
+def test_Container_index_03():
+    """
+    Indices stay current after wrapping components in container.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4")
+    abjad.mutate(staff[1:3]).wrap(abjad.Tuplet((2, 3), []))
+
+    for i, component in enumerate(staff):
+        assert staff.index(component) == i
+    for i, component in enumerate(staff[1]):
+        assert staff[1].index(component) == i
+
+
+def test_Container_index_04():
+    """
+    Raises value error on component not in container.
+    """
+
+    container = abjad.Container("c'4 d'4 e'4 f'4")
+    note = abjad.Note("c'4")
+
+    with pytest.raises(ValueError):
+        container.index(note)
@@ -0,0 +1,130 @@
+import abjad
+
+
+def _make_score():
+    voice = abjad.Voice(r"c'4 \times 2/3 { d'8 e'8 f'8 } <g' b'>4 r4")
+    abjad.attach(abjad.GraceContainer("cs'16"), voice[0])
+    staff = abjad.Staff([voice])
+    return abjad.Score([staff, abjad.Staff("c4 d4 e4 f4")])
+
+
+def _format_uncached(component):
+    current = abjad.FormatCache._current
+    abjad.FormatCache._current = None
+    try:
+        return format(component)
+    finally:
+        abjad.FormatCache._current = current
+
+
+def test_FormatCache_cache_info_01():
+    """
+    Reformats only changed components and components that contain them.
+    """
+
+    score = _make_score()
+    with abjad.FormatCache() as cache:
+        format(score)
+        hits, misses = cache.cache_info()
+
+        assert hits == 0
+        assert misses == len(abjad.select(score).components())
+
+        format(score)
+
+        assert cache.cache_info() == (hits + 1, misses)
+
+        score[0][0][2].written_pitches = "a' c''"
+        string = format(score)
+
+        assert string == _format_uncached(score)
+        assert cache.cache_info()[1] == misses + 4
+
+
+def test_FormatCache_cache_info_02():
+    """
+    Clears cached format on change.
+    """
+
+    score = _make_score()
+    voice = score[0][0]
+    with abjad.FormatCache():
+        format(score)
+        abjad.attach(abjad.Articulation("."), voice[1][0])
+
+        assert format(score) == _format_uncached(score)
+
+        abjad.override(voice[0]).note_head.color = "red"
+
+        assert format(score) == _format_uncached(score)
+
+        abjad.setting(score[1]).instrument_name = abjad.Markup("Vc.")
+
+        assert format(score) == _format_uncached(score)
+
+        voice[1].multiplier = abjad.Multiplier(4, 5)
+
+        assert format(score) == _format_uncached(score)
+
+        voice[0].note_head.is_cautionary = True
+
+        assert format(score) == _format_uncached(score)
+
+        abjad.mutate(voice[1][:2]).wrap(abjad.Tuplet((4, 5), []))
+
+        assert format(score) == _format_uncached(score)
+
+        abjad.detach(abjad.GraceContainer, voice[0])
+
+        assert format(score) == _format_uncached(score)
+
+
+def test_FormatCache_cache_info_03():
+    """
+    Attaching instrument reformats sounding-pitch notes.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    abjad.attach("sounding pitch", staff[-1])
+    with abjad.FormatCache():
+        format(staff)
+        abjad.attach(abjad.ClarinetInBFlat(), staff[0])
+
+        assert format(staff) == _format_uncached(staff)
+
+
+def test_FormatCache_cache_info_04():
+    """
+    Attaching and detaching context indicator reformats later leaves in
+    effective context.
+    """
+
+    staff = abjad.Staff("d1 d1 d1")
+    abjad.attach(abjad.RepeatTie(), staff[1])
+    with abjad.FormatCache():
+        format(staff)
+        abjad.attach(abjad.Clef("bass"), staff[0])
+
+        assert format(staff) == _format_uncached(staff)
+        assert r"- \tweak direction #up" in format(staff)
+
+        abjad.detach(abjad.Clef, staff[0])
+
+        assert format(staff) == _format_uncached(staff)
+        assert r"- \tweak direction #up" not in format(staff)
+
+
+def test_FormatCache_cache_info_05():
+    """
+    Clears cached format on exit.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    with abjad.FormatCache() as cache:
+        format(staff)
+
+    assert all(
+        _._format_cache is None for _ in abjad.select(staff).components()
+    )
+    assert cache.cache_info() == (0, 5)
+    assert abjad.FormatCache._current is None
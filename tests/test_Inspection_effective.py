@@ -0,0 +1,59 @@
+import abjad
+
+
+def test_Inspection_effective_01():
+    """
+    Effective indicator lookup follows attach and detach.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8 g'8 a'8")
+    abjad.attach(abjad.Clef("treble"), staff[0])
+    abjad.attach(abjad.Clef("alto"), staff[3])
+
+    clefs = [abjad.inspect(_).effective(abjad.Clef) for _ in staff]
+    assert [_.name for _ in clefs] == 3 * ["treble"] + 3 * ["alto"]
+
+    abjad.detach(abjad.Clef, staff[3])
+    abjad.attach(abjad.Clef("bass"), staff[4])
+
+    clefs = [abjad.inspect(_).effective(abjad.Clef) for _ in staff]
+    assert [_.name for _ in clefs] == 4 * ["treble"] + 2 * ["bass"]
+
+
+def test_Inspection_effective_02():
+    """
+    Effective indicator lookup follows changes to offsets.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef("treble"), staff[0])
+    abjad.attach(abjad.Clef("bass"), staff[2])
+    assert abjad.inspect(staff[1]).effective(abjad.Clef).name == "treble"
+
+    staff[1].written_duration = abjad.Duration(1, 4)
+    staff.insert(2, abjad.Note("g'8"))
+
+    clefs = [abjad.inspect(_).effective(abjad.Clef) for _ in staff]
+    assert [_.name for _ in clefs] == 3 * ["treble"] + 2 * ["bass"]
+
+
+def test_Inspection_effective_03():
+    """
+    Effective indicator lookup distinguishes indicators by command.
+    """
+
+    voice = abjad.Voice("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.StartTextSpan(), voice[0])
+    abjad.attach(abjad.StopTextSpan(), voice[1])
+    abjad.attach(abjad.StartTextSpan(command=r"\startTextSpanOne"), voice[2])
+
+    wrapper = abjad.inspect(voice[3]).effective_wrapper(
+        abjad.StartTextSpan, attributes={"command": r"\startTextSpan"}
+    )
+    assert wrapper.component is voice[0]
+    wrapper = abjad.inspect(voice[3]).effective_wrapper(
+        abjad.StartTextSpan, attributes={"command": r"\startTextSpanOne"}
+    )
+    assert wrapper.component is voice[2]
+    wrapper = abjad.inspect(voice[3]).effective_wrapper(abjad.StartTextSpan)
+    assert wrapper.component is voice[2]
@@ -0,0 +1,104 @@
+import abjad
+import math
+
+
+def _make_score():
+    voice = abjad.Voice(r"c'4 ~ c'8 <e' g' b'>8 \times 2/3 { d'4 r4 f'4 }")
+    staff_1 = abjad.Staff([voice])
+    staff_2 = abjad.Staff("g2 a4 ~ a4")
+    return abjad.Score([staff_1, staff_2])
+
+
+def test_Inspection_leaf_table_01():
+    """
+    Leaf table columns agree with leaf inspection.
+    """
+
+    score = _make_score()
+    table = abjad.inspect(score).leaf_table()
+    leaves = list(abjad.iterate(score).leaves())
+
+    assert list(table.leaves) == leaves
+    for i, leaf in enumerate(leaves):
+        timespan = abjad.inspect(leaf).timespan()
+        duration = abjad.inspect(leaf).duration()
+        start_offset = abjad.Offset(
+            table.start_offset_numerators[i],
+            table.start_offset_denominators[i],
+        )
+        stop_offset = abjad.Offset(
+            table.stop_offset_numerators[i], table.stop_offset_denominators[i]
+        )
+        assert start_offset == timespan.start_offset
+        assert stop_offset == timespan.stop_offset
+        assert duration == abjad.Duration(
+            table.duration_numerators[i], table.duration_denominators[i]
+        )
+        assert leaf.written_duration == abjad.Duration(
+            table.written_duration_numerators[i],
+            table.written_duration_denominators[i],
+        )
+        code = table.leaf_class_codes[i]
+        assert table.leaf_classes[code] is type(leaf)
+        staff = abjad.inspect(leaf).parentage().get(abjad.Staff)
+        assert table.staves[table.staff_ids[i]] is staff
+
+
+def test_Inspection_leaf_table_02():
+    """
+    Pads MIDI pitches to widest chord and numbers logical ties.
+    """
+
+    score = _make_score()
+    table = abjad.inspect(score).leaf_table()
+
+    assert table.pitch_width == 3
+    rows = [
+        table.midi_pitches[i : i + 3]
+        for i in range(0, len(table.midi_pitches), 3)
+    ]
+    assert list(rows[2]) == [64.0, 67.0, 71.0]
+    assert rows[0][0] == 60.0 and math.isnan(rows[0][1])
+    assert all(math.isnan(_) for _ in rows[4])
+    assert list(table.logical_tie_ids) == [0, 0, 1, 2, 3, 4, 5, 6, 6]
+    assert list(table.voice_ids) == [0, 0, 0, 0, 0, 0, -1, -1, -1]
+    assert table.voices == (score[0][0],)
+
+
+def test_Inspection_leaf_table_03():
+    """
+    Caches leaf table until score changes.
+    """
+
+    score = _make_score()
+    table = abjad.inspect(score).leaf_table()
+
+    assert abjad.inspect(score).leaf_table() is table
+
+    score[1][0].written_pitch = "b"
+    table = abjad.inspect(score).leaf_table()
+
+    assert table.midi_pitches[6 * 3] == 59.0
+    assert abjad.inspect(score).leaf_table() is table
+
+    score[0][0][2].note_heads.append("d''")
+    table = abjad.inspect(score).leaf_table()
+
+    assert table.pitch_width == 4
+
+    score[1].append("c'4")
+    table = abjad.inspect(score).leaf_table()
+
+    assert len(table) == 10
+
+    abjad.detach(abjad.Tie, score[0][0][0])
+    table = abjad.inspect(score).leaf_table()
+
+    assert list(table.logical_tie_ids)[:3] == [0, 1, 2]
+
+    staff = abjad.Staff()
+    staff.append(score[0][0])
+    table = abjad.inspect(staff).leaf_table()
+
+    assert len(table) == 6
+    assert len(abjad.inspect(score).leaf_table()) == 4
@@ -0,0 +1,58 @@
+import abjad
+
+
+def test_Inspection_measure_map_01():
+    """
+    Measure map is cached until offsets change.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4 a'4 b'4 c''4")
+    measure_map = abjad.inspect(staff).measure_map()
+
+    assert abjad.inspect(staff[-1]).measure_map() is measure_map
+    assert len(measure_map) == 2
+
+    staff.append("d''1")
+
+    assert abjad.inspect(staff).measure_map() is not measure_map
+    assert len(abjad.inspect(staff).measure_map()) == 3
+    assert abjad.inspect(staff[-1]).measure_number() == 3
+
+
+def test_Inspection_measure_map_02():
+    """
+    Measure map is rebuilt after time signatures attach and detach.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4 a'4")
+    assert abjad.inspect(staff[-1]).measure_number() == 2
+
+    time_signature = abjad.TimeSignature((3, 4))
+    abjad.attach(time_signature, staff[0])
+    assert abjad.inspect(staff[3]).measure_number() == 2
+    assert abjad.inspect(staff).measure_map().time_signatures == (
+        time_signature,
+        time_signature,
+    )
+
+    abjad.detach(abjad.TimeSignature, staff[0])
+    assert abjad.inspect(staff[3]).measure_number() == 1
+
+
+def test_Inspection_measure_map_03():
+    """
+    Measure timespans stop at time signature changes.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4")
+    abjad.attach(abjad.TimeSignature((2, 4)), staff[0])
+    abjad.attach(abjad.TimeSignature((3, 8)), staff[3])
+    measure_map = abjad.inspect(staff).measure_map()
+
+    assert measure_map.measure_number(abjad.Offset(3, 4)) == 3
+    assert measure_map.measure_timespan(abjad.Offset(1, 2)) == abjad.Timespan(
+        abjad.Offset(1, 2), abjad.Offset(3, 4)
+    )
+    assert measure_map.measure_timespan(abjad.Offset(1)) == abjad.Timespan(
+        abjad.Offset(3, 4), abjad.Offset(9, 8)
+    )
@@ -0,0 +1,66 @@
+import abjad
+
+
+def test_Inspection_tempo_map_01():
+    """
+    Tempo map is cached until offsets change.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    score = abjad.Score([staff])
+    abjad.attach(abjad.MetronomeMark((1, 4), 60), staff[0])
+    tempo_map = abjad.inspect(score).tempo_map()
+
+    assert abjad.inspect(staff[-1]).tempo_map() is tempo_map
+    assert tempo_map.stop_offset == abjad.Offset(1)
+
+    staff.append("g'4")
+
+    assert abjad.inspect(score).tempo_map() is not tempo_map
+    assert abjad.inspect(score).tempo_map().stop_offset == abjad.Offset(5, 4)
+
+
+def test_Inspection_tempo_map_02():
+    """
+    Tempo map is rebuilt after metronome marks attach and detach.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    score = abjad.Score([staff])
+    abjad.attach(abjad.MetronomeMark((1, 4), 60), staff[0])
+    abjad.attach(abjad.MetronomeMark((1, 4), 120), staff[2])
+
+    assert len(abjad.inspect(score).tempo_map()) == 2
+    assert abjad.inspect(staff[-1]).timespan(in_seconds=True) == (
+        abjad.Timespan(abjad.Offset(5, 2), abjad.Offset(3))
+    )
+
+    abjad.detach(abjad.MetronomeMark, staff[2])
+
+    assert len(abjad.inspect(score).tempo_map()) == 1
+    assert abjad.inspect(staff[-1]).timespan(in_seconds=True) == (
+        abjad.Timespan(abjad.Offset(3), abjad.Offset(4))
+    )
+
+
+def test_Inspection_tempo_map_03():
+    """
+    Converts offsets to seconds and back.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4 a'4")
+    score = abjad.Score([staff])
+    abjad.attach(abjad.MetronomeMark((1, 4), 60), staff[0])
+    abjad.attach(abjad.MetronomeMark((1, 8), 90), staff[3])
+    tempo_map = abjad.inspect(score).tempo_map()
+    offsets = [abjad.Offset(_, 8) for _ in range(13)]
+    seconds = tempo_map.offsets_to_seconds(offsets)
+
+    for leaf in staff:
+        timespan = abjad.inspect(leaf).timespan()
+        timespan_in_seconds = abjad.inspect(leaf).timespan(in_seconds=True)
+        start_offset = tempo_map.offset_to_seconds(timespan.start_offset)
+        assert start_offset == timespan_in_seconds.start_offset
+    for offset, seconds_ in zip(offsets, seconds):
+        assert tempo_map.seconds_to_offset(seconds_) == offset
+    assert seconds == sorted(seconds)
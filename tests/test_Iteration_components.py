@@ -0,0 +1,54 @@
+import abjad
+
+
+def _make_voice():
+    voice = abjad.Voice(r"c'4 \times 2/3 { d'8 e'8 f'8 } g'4 a'4")
+    abjad.attach(abjad.GraceContainer("cs'16 ds'16"), voice[0])
+    abjad.attach(abjad.AfterGraceContainer("fs'16"), voice[1][2])
+    container = abjad.OnBeatGraceContainer("b'16 c''16 d''16 e''16")
+    abjad.attach(container, voice[3])
+    return voice
+
+
+def test_Iteration_components_01():
+    """
+    Reverse iteration yields leaves in reverse order of forward iteration.
+    """
+
+    voice = _make_voice()
+    for grace in (None, True, False):
+        forward = list(abjad.iterate(voice).leaves(grace=grace))
+        backward = list(abjad.iterate(voice).leaves(grace=grace, reverse=True))
+        assert forward == list(reversed(backward))
+
+
+def test_Iteration_components_02():
+    """
+    Filters grace music without changing order.
+    """
+
+    voice = _make_voice()
+    components = list(abjad.iterate(voice).components())
+    grace_components = list(abjad.iterate(voice).components(grace=True))
+    nongrace_components = list(abjad.iterate(voice).components(grace=False))
+
+    assert grace_components == [
+        _ for _ in components if abjad.inspect(_).grace()
+    ]
+    assert nongrace_components == [
+        _ for _ in components if not abjad.inspect(_).grace()
+    ]
+    assert len(grace_components) + len(nongrace_components) == len(components)
+
+
+def test_Iteration_components_03():
+    """
+    Yields grace music before and after main leaf.
+    """
+
+    voice = _make_voice()
+    leaves = abjad.iterate(voice).leaves(grace=None)
+    strings = [str(_.written_pitch) for _ in leaves]
+
+    assert strings[:6] == ["cs'", "ds'", "c'", "d'", "e'", "f'"]
+    assert strings[6:8] == ["fs'", "g'"]
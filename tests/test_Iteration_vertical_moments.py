@@ -0,0 +1,64 @@
+import abjad
+
+
+def _make_score():
+    voice = abjad.Voice(r"c'4 \times 2/3 { d'8 e'8 f'8 } g'4")
+    abjad.attach(abjad.GraceContainer("cs'16"), voice[1][0])
+    staff_1 = abjad.Staff([voice])
+    staff_2 = abjad.Staff("g'2 a'8 b'8 c''4")
+    return abjad.Score([staff_1, staff_2])
+
+
+def test_Iteration_vertical_moments_01():
+    """
+    Each vertical moment holds every component sounding at its offset.
+    """
+
+    score = _make_score()
+    moments = abjad.iterate(score).vertical_moments()
+    components = list(abjad.iterate(score).components())
+    offsets = sorted(
+        set(abjad.inspect(_).timespan().start_offset for _ in components)
+    )
+
+    assert [_.offset for _ in moments] == offsets
+    assert len(moments) == 8
+    assert moments[1].offset == abjad.Offset((1, 4), displacement=(-1, 16))
+    assert moments[2].offset == abjad.Offset((1, 4))
+    assert moments[2].offset._get_displacement() == 0
+    for moment in moments:
+        for component in components:
+            timespan = abjad.inspect(component).timespan()
+            sounding = timespan.start_offset <= moment.offset
+            sounding = sounding and moment.offset < timespan.stop_offset
+            assert (component in moment.components) is sounding
+
+
+def test_Iteration_vertical_moments_02():
+    """
+    Orders components in vertical moment by score index.
+    """
+
+    score = _make_score()
+    for moment in abjad.iterate(score).vertical_moments():
+        score_indices = [
+            abjad.inspect(_).parentage().score_index()
+            for _ in moment.components
+        ]
+        assert score_indices == sorted(score_indices)
+
+
+def test_Iteration_vertical_moments_03():
+    """
+    Streams the same vertical moments, forward and in reverse.
+    """
+
+    score = _make_score()
+    iteration = abjad.iterate(score)
+    moments = iteration.vertical_moments()
+
+    assert tuple(iteration.stream_vertical_moments()) == moments
+    assert tuple(iteration.stream_vertical_moments(reverse=True)) == tuple(
+        reversed(moments)
+    )
+    assert iteration.vertical_moments(reverse=True) == tuple(reversed(moments))
@@ -0,0 +1,49 @@
+import abjad
+
+
+def test_LilyPondFormatBundle_update_01():
+    """
+    Extends contributions in place; leaves slots without contributions
+    unallocated.
+    """
+
+    bundle_1 = abjad.LilyPondFormatBundle()
+    bundle_1.after.articulations.append(r"- \staccato")
+    articulations = bundle_1.after.articulations
+    bundle_2 = abjad.LilyPondFormatBundle()
+    bundle_2.after.articulations.append(r"- \accent")
+    bundle_2.grob_overrides.append(r"\override NoteHead.color = #red")
+    bundle_1.update(bundle_2)
+
+    assert bundle_1.after.articulations is articulations
+    assert articulations == [r"- \staccato", r"- \accent"]
+    assert bundle_1.grob_overrides == [r"\override NoteHead.color = #red"]
+    assert bundle_1._before is None
+    assert bundle_1._after._commands is None
+
+
+def test_LilyPondFormatBundle_update_02():
+    """
+    Allocates fresh mutable slot contributions on first access after sorting
+    overrides.
+    """
+
+    bundle_1 = abjad.LilyPondFormatBundle()
+    bundle_1.after.articulations.append(r"- \staccato")
+    bundle_1.sort_overrides()
+    bundle_2 = abjad.LilyPondFormatBundle()
+    bundle_2.before.commands.append(r"\break")
+    bundle_2.sort_overrides()
+
+    assert bundle_1._before is None
+    assert bundle_1.before is not bundle_1.after
+    assert bundle_1.before is not bundle_2.after
+    assert bundle_1.before.commands == []
+    assert bundle_1.grob_overrides == ()
+
+    bundle_1.after.commands.append(r"\pageBreak")
+    bundle_1.after.update(bundle_2.before)
+
+    assert bundle_1.after.articulations == [r"- \staccato"]
+    assert bundle_1.after.commands == [r"\pageBreak", r"\break"]
+    assert bundle_2.after.commands == []
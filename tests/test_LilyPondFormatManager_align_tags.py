@@ -0,0 +1,32 @@
+import abjad
+
+
+def test_LilyPondFormatManager_align_tags_01():
+    """
+    Aligns tags at column; pads lines past column with one space.
+    """
+
+    strings = [r"c'4", r"\once \override NoteHead.color = #red", r"- \accent"]
+    strings = abjad.LilyPondFormatManager.tag(strings, abjad.Tag("RED"))
+    strings.append("d'4")
+    string = "\n".join(strings)
+    string = abjad.LilyPondFormatManager.align_tags(string, 20)
+
+    assert string == abjad.String.normalize(
+        r"""
+        c'4                 %! RED
+        \once \override NoteHead.color = #red %! RED
+        - \accent           %! RED
+        d'4
+        """
+    ), print(string)
+
+
+def test_LilyPondFormatManager_align_tags_02():
+    """
+    Leaves untagged strings unchanged.
+    """
+
+    string = "c'4\n  \nd'4  "
+
+    assert abjad.LilyPondFormatManager.align_tags(string, 20) is string
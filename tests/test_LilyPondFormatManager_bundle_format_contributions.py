@@ -0,0 +1,70 @@
+import abjad
+
+
+def test_LilyPondFormatManager_bundle_format_contributions_01():
+    """
+    Leaves format indicators inherited from containers.
+    """
+
+    staff = abjad.Staff(r"c'4 d'4 \times 2/3 { e'4 f'4 g'4 }")
+    markup = abjad.Markup("Allegro", direction=abjad.Up)
+    abjad.attach(abjad.Wrapper(indicator=markup), staff)
+    abjad.attach(abjad.LilyPondLiteral(r"\break"), staff[2])
+    abjad.attach(
+        abjad.Wrapper(indicator=abjad.Articulation("accent")), staff[2]
+    )
+
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            c'4
+            ^ \markup { Allegro }
+            d'4
+            ^ \markup { Allegro }
+            \times 2/3 {
+                \break
+                e'4
+                - \accent
+                ^ \markup { Allegro }
+                f'4
+                - \accent
+                ^ \markup { Allegro }
+                g'4
+                - \accent
+                ^ \markup { Allegro }
+            }
+        }
+        """
+    ), print(format(staff))
+
+    assert format(staff[2][1]) == abjad.String.normalize(
+        r"""
+        f'4
+        - \accent
+        ^ \markup { Allegro }
+        """
+    ), print(format(staff[2][1]))
+
+
+def test_LilyPondFormatManager_bundle_format_contributions_02():
+    """
+    Inherited indicators equal indicators collected from parentage.
+    """
+
+    staff = abjad.Staff(r"c'4 d'4 \times 2/3 { e'4 f'4 g'4 }")
+    markup = abjad.Markup("Allegro", direction=abjad.Up)
+    abjad.attach(abjad.Wrapper(indicator=markup), staff)
+    abjad.attach(
+        abjad.Wrapper(indicator=abjad.Articulation("accent")), staff[2]
+    )
+    abjad.attach(abjad.Articulation("."), staff[2][0])
+    manager = abjad.LilyPondFormatManager
+    inherited = manager._collect_inherited_indicators(staff)
+    inherited = manager._collect_inherited_indicators(staff[2], inherited)
+    for leaf in staff[2]:
+        bundle = manager.bundle_format_contributions(leaf, inherited=inherited)
+        bundle_ = manager.bundle_format_contributions(leaf)
+        assert format(bundle) == format(bundle_)
+        assert bundle.after.articulations
+        assert bundle.after.markup
@@ -0,0 +1,82 @@
+import abjad
+
+
+def test_LilyPondParser__lexer_01():
+    """
+    Regex lexer and PLY lexer produce same tokens.
+    """
+
+    string = r"""
+    \version "2.19.24"
+    % line comment
+    %{ block
+       comment %}
+    \new Staff <<
+        \context Voice = "one" { c'4 \< ( des'8 [ r8 ] s4 R1 q2 \! ) }
+        \new Voice { \times 2/3 { e''8. -. ^\markup { "a b" } } }
+    >>
+    """
+
+    def get_tokens(ply_lexer):
+        parser = abjad.parser.LilyPondParser(ply_lexer=ply_lexer)
+        # music functions push extra tokens onto parser
+        parser.parser.lookaheadstack = []
+        lexer = parser.lexer
+        lexer.input(string)
+        tokens = []
+        for token in lexer:
+            value = token.value
+            if isinstance(value, abjad.parser.LilyPondFraction):
+                value = (value.numerator, value.denominator)
+            tokens.append((token.type, value, token.lexpos, token.lineno))
+        return tokens
+
+    parser = abjad.parser.LilyPondParser()
+    assert isinstance(parser.lexer, abjad.parser.LilyPondLexer)
+    parser = abjad.parser.LilyPondParser(ply_lexer=True)
+    assert not isinstance(parser.lexer, abjad.parser.LilyPondLexer)
+
+    tokens = get_tokens(ply_lexer=False)
+    assert tokens == get_tokens(ply_lexer=True)
+    types = [_[0] for _ in tokens]
+    assert "NOTENAME_PITCH" in types
+    assert "MARKUP" in types
+    assert "CHORD_REPETITION" in types
+    assert "FRACTION" in types
+    assert ("STRING", "a b") in [_[:2] for _ in tokens]
+
+
+def test_LilyPondParser__lexer_02():
+    """
+    Regex lexer reads note names in current language.
+    """
+
+    parser = abjad.parser.LilyPondParser(default_language="nederlands")
+    ply_parser = abjad.parser.LilyPondParser(
+        default_language="nederlands", ply_lexer=True
+    )
+
+    string = r"""\language "deutsch" { h'4 b'4 cis'4 }"""
+    container = parser(string)
+    assert format(container) == format(ply_parser(string))
+    assert format(container) == abjad.String.normalize(
+        r"""
+        {
+            b'4
+            bf'4
+            cs'4
+        }
+        """
+    )
+
+    string = "{ b'4 bes'4 }"
+    container = parser(string)
+    assert format(container) == format(ply_parser(string))
+    assert format(container) == abjad.String.normalize(
+        r"""
+        {
+            b'4
+            bf'4
+        }
+        """
+    )
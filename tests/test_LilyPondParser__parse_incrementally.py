@@ -0,0 +1,74 @@
+import abjad
+import io
+import pytest
+
+
+def test_LilyPondParser__parse_incrementally_01():
+    """
+    Yields same top-level expressions as calling parser.
+    """
+
+    string = r"""
+    \header {
+        composername = #"Foo von Bar"
+        something = #4
+    }
+    music = { c'4 d'4 }
+    \score { \new Staff \music }
+    \new Staff { \music e'4 }
+    \markup { \bold Fine }
+    { f'4 }
+    """
+
+    parser = abjad.parser.LilyPondParser()
+    items = parser(string).items
+    expressions = list(parser.parse_incrementally(io.StringIO(string)))
+
+    assert len(expressions) == len(items) == 5
+    for expression, item in zip(expressions, items):
+        assert format(expression) == format(item)
+    staff = abjad.Staff([abjad.Container("c'4 d'4"), abjad.Note("e'4")])
+    assert format(expressions[2]) == format(staff)
+
+
+def test_LilyPondParser__parse_incrementally_02():
+    """
+    Stops parsing when caller stops iterating; parser parses again
+    afterwards.
+    """
+
+    string = r"{ c'4 } \score { { d'4 } } { e'4 }"
+    parser = abjad.parser.LilyPondParser()
+    expressions = parser.parse_incrementally(string)
+    assert format(next(expressions)) == format(abjad.Container("c'4"))
+    expressions.close()
+
+    assert parser._is_parsing_incrementally is False
+    result = parser(r"{ f'4 } { g'4 }")
+    assert len(result.items) == 2
+    assert format(result.items[1]) == format(abjad.Container("g'4"))
+
+
+def test_LilyPondParser__parse_incrementally_03():
+    """
+    Raises exception when parser is called during incremental parse; stream
+    is unaffected.
+    """
+
+    string = r"{ c'4 } { d'4 } { e'4 }"
+    parser = abjad.parser.LilyPondParser()
+    expressions = parser.parse_incrementally(string)
+    assert format(next(expressions)) == format(abjad.Container("c'4"))
+
+    with pytest.raises(Exception) as exception_info:
+        parser("{ f'4 g'4 }")
+    assert "incremental parse is active" in str(exception_info.value)
+    with pytest.raises(Exception):
+        next(parser.parse_incrementally("{ f'4 }"))
+
+    assert [format(_) for _ in expressions] == [
+        format(abjad.Container("d'4")),
+        format(abjad.Container("e'4")),
+    ]
+    result = parser("{ f'4 g'4 }")
+    assert format(result) == format(abjad.Container("f'4 g'4"))
@@ -0,0 +1,40 @@
+import abjad
+import os
+
+
+def test_LilyPondParser__parser_tables_01():
+    """
+    Parsers read shipped parsing tables once per parser class; each parser
+    gets its own lexer and LR parser.
+    """
+
+    parser_1 = abjad.parser.LilyPondParser()
+    parser_2 = abjad.parser.LilyPondParser()
+    assert os.path.exists(parser_1.table_path)
+
+    result_1 = parser_1("{ c'4 d'4 }")
+    result_2 = parser_2(r"\new Staff { e'8 }")
+    assert format(result_1) == format(abjad.Container("c'4 d'4"))
+    assert format(result_2) == format(abjad.Staff("e'8"))
+
+    assert parser_1.parser is not parser_2.parser
+    assert parser_1.parser.action is parser_2.parser.action
+    assert parser_1.lexer is not parser_2.lexer
+    assert parser_1.lexer.lexmodule is parser_1._lexdef
+    assert parser_2.lexer.lexmodule is parser_2._lexdef
+
+
+def test_LilyPondParser__parser_tables_02():
+    """
+    Every Abjad parser ships parsing tables.
+    """
+
+    for class_ in (
+        abjad.parser.LilyPondParser,
+        abjad.parser.ReducedLyParser,
+        abjad.parser.SchemeParser,
+        abjad.rhythmtrees.RhythmTreeParser,
+    ):
+        parser = class_()
+        assert os.path.exists(parser.table_path)
+        assert parser.parser is not None
@@ -254,3 +254,41 @@ def test_Note___init___19():
     note = abjad.Note("sn4")
 
     assert format(note) == "snare4"
+
+
+def test_Note___init___20():
+    """
+    Initializes simple leaf strings without full LilyPond parser; notes
+    initialized from equal strings share no indicators.
+    """
+
+    note_1 = abjad.Note("cs''8. * 1/2 ~")
+    note_2 = abjad.Note("cs''8. * 1/2 ~")
+    tie_1 = abjad.inspect(note_1).indicator(abjad.Tie)
+    tie_2 = abjad.inspect(note_2).indicator(abjad.Tie)
+
+    assert format(note_1) == "cs''8. * 1/2\n~"
+    assert note_1.multiplier == abjad.Multiplier(1, 2)
+    assert tie_1 == tie_2
+    assert tie_1 is not tie_2
+    assert note_1.note_head is not note_2.note_head
+
+
+def test_Note___init___21():
+    """
+    Initializes simple leaf strings exactly as full LilyPond parser does.
+    """
+
+    strings = [
+        "c4",
+        "ctqf,,16..",
+        "bff''''1 * 3/6",
+        "ef'128 *5 ~",
+        "<c' e' g'>4 ~",
+        "r8.",
+        "r2 * 1/3",
+    ]
+    for string in strings:
+        leaf = abjad.parse(f"{{ {string} }}")[0]
+        for class_ in (abjad.Note, abjad.Chord):
+            assert format(class_(string)) == format(class_(leaf))
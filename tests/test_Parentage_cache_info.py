@@ -0,0 +1,95 @@
+import abjad
+
+
+def _assert_cached_parentage_is_current(root):
+    for component in abjad.UpdateManager._iterate_entire_score(root):
+        if component._parentage is None:
+            continue
+        fresh = abjad.Parentage(component)
+        assert component._parentage.components == fresh.components
+        assert component._parentage.prolation == fresh.prolation
+
+
+def test_Parentage_cache_info_01():
+    """
+    Parentage inspection hits cache after staff initialization.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    abjad.Parentage.reset_cache_info()
+    for _ in range(3):
+        for note in staff:
+            abjad.inspect(note).parentage()
+
+    assert abjad.Parentage.cache_info() == (12, 0)
+
+
+def test_Parentage_cache_info_02():
+    """
+    Moving components clears cached parentage.
+    """
+
+    staff = abjad.Staff(r"c'4 \times 2/3 { d'8 e'8 f'8 } g'4")
+    score = abjad.Score([abjad.Staff()])
+    for component in abjad.select(staff).components():
+        abjad.inspect(component).parentage()
+    tuplet = staff[1]
+    score[0].append(tuplet)
+    _assert_cached_parentage_is_current(staff)
+    _assert_cached_parentage_is_current(score)
+
+    assert abjad.inspect(tuplet[0]).parentage().root is score
+    assert abjad.inspect(tuplet[0]).parentage().score_index() == (0, 0, 0)
+
+    abjad.mutate(score[0][:]).wrap(abjad.Tuplet((4, 5), []))
+    _assert_cached_parentage_is_current(score)
+
+    assert abjad.inspect(tuplet[0]).parentage().prolation == abjad.Multiplier(
+        8, 15
+    )
+
+
+def test_Parentage_cache_info_03():
+    """
+    Attaching and detaching grace music clears cached parentage.
+    """
+
+    voice = abjad.Voice("c'4 d'4 e'4 f'4")
+    staff = abjad.Staff([voice])
+    container = abjad.GraceContainer("cs'16 ds'16")
+    abjad.inspect(container[0]).parentage()
+    abjad.attach(container, voice[1])
+    _assert_cached_parentage_is_current(staff)
+
+    assert abjad.inspect(container[0]).parentage().root is staff
+
+    abjad.detach(container, voice[1])
+
+    assert abjad.inspect(container[0]).parentage().root is container
+
+    after_grace_container = abjad.AfterGraceContainer("fs'16")
+    abjad.attach(after_grace_container, voice[3])
+    abjad.inspect(after_grace_container[0]).parentage()
+    staff_2 = abjad.Staff()
+    staff_2.append(voice)
+    _assert_cached_parentage_is_current(staff_2)
+
+    assert abjad.inspect(after_grace_container[0]).parentage().root is staff_2
+
+
+def test_Parentage_cache_info_04():
+    """
+    Changing tuplet multiplier clears cached prolation.
+    """
+
+    staff = abjad.Staff(r"c'4 \times 2/3 { d'8 e'8 f'8 } g'4")
+
+    assert abjad.inspect(staff[1][0]).parentage().prolation == (
+        abjad.Multiplier(2, 3)
+    )
+
+    staff[1].multiplier = abjad.Multiplier(4, 5)
+
+    assert abjad.inspect(staff[1][0]).parentage().prolation == (
+        abjad.Multiplier(4, 5)
+    )
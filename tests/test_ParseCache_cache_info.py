@@ -0,0 +1,51 @@
+import abjad
+
+
+def test_ParseCache_cache_info_01():
+    """
+    Copies cached components; changing one copy leaves later copies
+    unchanged.
+    """
+
+    string = r"c'8 \p ( d'8 ) \times 2/3 { e'8 f'8 g'8 }"
+    with abjad.ParseCache() as cache:
+        staff_1 = abjad.Staff(string)
+        abjad.attach(abjad.Articulation("."), staff_1[0])
+        staff_1[1].written_pitch = "ds'"
+        staff_1[2].append(abjad.Note("a'8"))
+        staff_2 = abjad.Staff(string)
+        staff_3 = abjad.Staff(string)
+
+    assert cache.cache_info() == (2, 1)
+    assert format(staff_2) == format(abjad.Staff(string))
+    assert format(staff_3) == format(staff_2)
+    assert format(staff_1) != format(staff_2)
+    dynamic_1 = abjad.inspect(staff_2[0]).indicator(abjad.Dynamic)
+    dynamic_2 = abjad.inspect(staff_3[0]).indicator(abjad.Dynamic)
+    assert dynamic_1 == dynamic_2
+    assert dynamic_1 is not dynamic_2
+
+
+def test_ParseCache_cache_info_02():
+    """
+    Keys cached components by string and language; caches only while parse
+    cache is active.
+    """
+
+    cache = abjad.ParseCache()
+    with cache:
+        abjad.parse("{ c'8 d'8 }", language="nederlands")
+        abjad.parse("{ c'8 d'8 }", language="english")
+        abjad.parse("{ c'8 d'8 }", language="nederlands")
+
+    assert cache.cache_info() == (1, 2)
+    assert len(cache) == 2
+
+    abjad.parse("{ c'8 d'8 }", language="nederlands")
+    assert cache.cache_info() == (1, 2)
+
+    with cache:
+        container = abjad.parse("{ c'8 d'8 }", language="nederlands")
+
+    assert cache.cache_info() == (2, 2)
+    assert format(container) == format(abjad.Container("c'8 d'8"))
@@ -29,3 +29,61 @@ def test_PersistenceManager_as_ly_02():
         assert os.path.isfile(ly_path)
         abjad.persist(note).as_ly(ly_path)
         assert os.path.isfile(ly_path)
+
+
+def test_PersistenceManager_as_ly_03():
+    """
+    Agent abjad.persists same LilyPond file when streaming.
+    """
+
+    voice = abjad.Voice(r"c'4 \times 2/3 { d'8 e'8 f'8 } <g' b'>4 r4")
+    abjad.attach(abjad.GraceContainer("cs'16"), voice[0])
+    abjad.attach(abjad.Articulation("."), voice[0])
+    abjad.attach(abjad.Markup("Allegro"), voice[0])
+    abjad.tweak(voice[2].note_heads[0]).color = "red"
+    staff = abjad.Staff([voice])
+    abjad.override(staff).note_head.color = "blue"
+    score = abjad.Score([staff, abjad.Staff("c4 d4 e4 f4", tag="TAG")])
+    lilypond_file = abjad.LilyPondFile.new(score, includes=["stylesheet.ily"])
+    lilypond_file.score_block.items.append(abjad.Block(name="layout"))
+    lilypond_file.layout_block.items.append(abjad.ContextBlock("Score"))
+    for strict in (None, 79):
+        with abjad.FilesystemState(remove=[ly_path]):
+            abjad.persist(lilypond_file).as_ly(ly_path, strict=strict)
+            with open(ly_path) as file_pointer:
+                string = file_pointer.read()
+            abjad.persist(lilypond_file).as_ly(
+                ly_path, strict=strict, stream=True
+            )
+            with open(ly_path) as file_pointer:
+                assert file_pointer.read() == string
+
+
+def test_PersistenceManager_as_ly_04():
+    """
+    Agent abjad.persists same LilyPond file when formatting in parallel.
+    """
+
+    staves = []
+    for i in range(4):
+        staff = abjad.Staff(r"c'4 \times 2/3 { d'8 e'8 f'8 } <g' b'>4 r4")
+        abjad.attach(abjad.GraceContainer("cs'16"), staff[0])
+        abjad.attach(abjad.Clef("bass"), staff[0])
+        abjad.attach(abjad.Markup("Allegro"), staff[0])
+        abjad.override(staff).note_head.color = "blue"
+        staves.append(staff)
+    staff_group = abjad.StaffGroup(staves[:2])
+    score = abjad.Score([staff_group] + staves[2:])
+    lilypond_file = abjad.LilyPondFile.new(score)
+    for stream in (None, True):
+        with abjad.FilesystemState(remove=[ly_path]):
+            abjad.persist(lilypond_file).as_ly(ly_path)
+            with open(ly_path) as file_pointer:
+                string = file_pointer.read()
+            abjad.persist(lilypond_file).as_ly(
+                ly_path, stream=stream, workers=2
+            )
+            with open(ly_path) as file_pointer:
+                assert file_pointer.read() == string
+    components = abjad.select(score).components()
+    assert all(_._format_cache is None for _ in components)
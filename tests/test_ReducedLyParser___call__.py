@@ -0,0 +1,37 @@
+import abjad
+
+
+def test_ReducedLyParser___call___01():
+    """
+    Recursive-descent parser and PLY parser produce same components.
+    """
+
+    strings = [
+        "c'8 [ d'8 ] r8 <c' e' g'>4 ~ <c' e' g'>8",
+        "| 3/4 c'4 ( d'8. ) e'16 f'4 | | 2/4 r2 |",
+        "2/3 { c'8 d'8 e'8 } {} { fs''4 bqf,8 }",
+        "4 4 8. 16 . 2/3 { 2/3 { 8 8 8 } 4 } -4",
+        "c'4",
+    ]
+
+    parser = abjad.parser.ReducedLyParser()
+    for string in strings:
+        result = parser(string)
+        assert format(result) == format(abjad.Parser.__call__(parser, string))
+
+
+def test_ReducedLyParser___call___02(capsys):
+    """
+    Falls back to PLY parser on syntax errors.
+    """
+
+    parser = abjad.parser.ReducedLyParser()
+    assert parser._parse_recursively("{ 2/3 { 8 8 8 } }") is None
+
+    try:
+        parser("{ 2/3 { 8 8 8 } }")
+    except IndexError:
+        pass
+    else:
+        assert False
+    assert "Syntax error at '{'" in capsys.readouterr().out
@@ -0,0 +1,33 @@
+import abjad
+import abjad.rhythmtrees
+
+
+def test_RhythmTreeParser___call___01():
+    """
+    Recursive-descent parser and PLY parser produce same rhythm trees.
+    """
+
+    strings = [
+        "(1 (1 1 1))",
+        "(3 (1 (3 (1 -1 1)) 2/3 -1))",
+        "(1 (1 (1 (1 1)) 1)) (2 (-1 1))",
+        "1 -2 3/4",
+    ]
+
+    parser = abjad.rhythmtrees.RhythmTreeParser()
+    for string in strings:
+        result = parser(string)
+        assert repr(result) == repr(abjad.Parser.__call__(parser, string))
+
+
+def test_RhythmTreeParser___call___02(capsys):
+    """
+    Falls back to PLY parser on syntax errors.
+    """
+
+    parser = abjad.rhythmtrees.RhythmTreeParser()
+    assert parser._parse_recursively("(1 ())") is None
+
+    assert parser("(1 ())") == []
+    assert "Syntax error at ')'" in capsys.readouterr().out
+    assert abjad.rhythmtrees._rhythm_tree_parser is not None
@@ -0,0 +1,42 @@
+import abjad
+
+
+def test_StorageFormatManager_inspect_signature_01():
+    """
+    Returns new lists on each call; changing one result leaves later results
+    unchanged.
+    """
+
+    result = abjad.StorageFormatManager.inspect_signature(abjad.Clef)
+    positional_names, keyword_names, accepts_args, accepts_kwargs = result
+    assert positional_names == []
+    assert keyword_names == ["name", "hide"]
+    assert accepts_args is False
+    assert accepts_kwargs is False
+
+    keyword_names.append("foo")
+    manager = abjad.StorageFormatManager(abjad.Clef("bass"))
+    names = manager._map_positional_values_to_names(["bass", True])
+    assert names == ["name", "hide"]
+
+    result = abjad.StorageFormatManager.inspect_signature(abjad.Clef("bass"))
+    assert result[1] == ["name", "hide"]
+    assert manager.signature_keyword_names == ["name", "hide"]
+
+
+def test_StorageFormatManager_inspect_signature_02():
+    """
+    Objects of one class compare and hash by template values.
+    """
+
+    clef_1 = abjad.Clef("bass")
+    clef_2 = abjad.Clef("bass")
+    clef_3 = abjad.Clef("bass", hide=True)
+
+    assert abjad.StorageFormatManager.compare_objects(clef_1, clef_2)
+    assert not abjad.StorageFormatManager.compare_objects(clef_1, clef_3)
+    assert not abjad.StorageFormatManager.compare_objects(clef_1, "bass")
+
+    manager = abjad.StorageFormatManager(clef_1)
+    assert manager.get_hash_values() == (abjad.Clef, None, "bass")
+    assert len(set([clef_1, clef_2, clef_3])) == 2
@@ -0,0 +1,161 @@
+import abjad
+
+
+def _get_offsets(root):
+    components = abjad.UpdateManager._iterate_entire_score(root)
+    return [(_._start_offset, _._stop_offset) for _ in components]
+
+
+def _check(root):
+    abjad.inspect(root).timespan()
+    incremental_offsets = _get_offsets(root)
+    abjad.UpdateManager()._update_all_offsets(root)
+    full_offsets = _get_offsets(root)
+    assert incremental_offsets == full_offsets
+
+
+def test_UpdateManager__update_offsets_incrementally_01():
+    """
+    Updates offsets after insertion near end of voice.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    _check(staff)
+    staff.insert(3, abjad.Note("g'4"))
+    _check(staff)
+    assert abjad.inspect(staff[-1]).timespan() == abjad.Timespan(
+        abjad.Offset(5, 8), abjad.Offset(3, 4)
+    )
+
+
+def test_UpdateManager__update_offsets_incrementally_02():
+    """
+    Updates offsets after deletion in one staff of score.
+    """
+
+    score = abjad.Score(
+        [abjad.Staff("c'8 d'8 e'8 f'8"), abjad.Staff("c'4 d'4 e'4 f'4")]
+    )
+    _check(score)
+    del score[1][1]
+    _check(score)
+    assert abjad.inspect(score).timespan().stop_offset == abjad.Offset(3, 4)
+    assert abjad.inspect(score[1]).timespan().stop_offset == abjad.Offset(3, 4)
+
+
+def test_UpdateManager__update_offsets_incrementally_03():
+    """
+    Updates offsets after changes to leaf written duration and multiplier.
+    """
+
+    voice = abjad.Voice("c'8 d'8 e'8 f'8")
+    _check(voice)
+    voice[1].written_duration = abjad.Duration(1, 4)
+    _check(voice)
+    assert abjad.inspect(voice[-1]).timespan().start_offset == abjad.Offset(
+        1, 2
+    )
+    voice[0].multiplier = abjad.Multiplier(2)
+    _check(voice)
+    assert abjad.inspect(voice[-1]).timespan().start_offset == abjad.Offset(
+        5, 8
+    )
+
+
+def test_UpdateManager__update_offsets_incrementally_04():
+    """
+    Updates offsets after change to tuplet multiplier.
+    """
+
+    staff = abjad.Staff(r"c'4 \times 2/3 { d'8 e'8 f'8 } g'4")
+    _check(staff)
+    staff[1].multiplier = abjad.Multiplier(4, 5)
+    _check(staff)
+    assert abjad.inspect(staff[1][-1]).timespan() == abjad.Timespan(
+        abjad.Offset(9, 20), abjad.Offset(11, 20)
+    )
+
+
+def test_UpdateManager__update_offsets_incrementally_05():
+    """
+    Updates offsets after attaching and detaching grace music.
+    """
+
+    voice = abjad.Voice("c'4 d'4 e'4 f'4")
+    _check(voice)
+    container = abjad.GraceContainer("cs'16 ds'16")
+    abjad.attach(container, voice[1])
+    _check(voice)
+    container = abjad.AfterGraceContainer("fs'16")
+    abjad.attach(container, voice[2])
+    _check(voice)
+    container.append("gs'16")
+    _check(voice)
+    abjad.detach(abjad.GraceContainer, voice[1])
+    _check(voice)
+
+
+def test_UpdateManager__update_offsets_incrementally_06():
+    """
+    Updates offsets after attaching and detaching on-beat grace music.
+    """
+
+    voice = abjad.Voice("c'4 d'4 e'4 f'4")
+    _check(voice)
+    container = abjad.OnBeatGraceContainer("a'8 as'8 b'8")
+    abjad.attach(container, voice[1])
+    _check(voice)
+    assert abjad.inspect(voice[1]).timespan().start_offset.displacement == (
+        abjad.Duration(3, 8)
+    )
+    container.append("c''8")
+    _check(voice)
+    assert abjad.inspect(voice[1]).timespan().start_offset.displacement == (
+        abjad.Duration(1, 2)
+    )
+    abjad.detach(abjad.OnBeatGraceContainer, voice[1])
+    _check(voice)
+    assert abjad.inspect(voice[1]).timespan().start_offset.displacement is None
+
+
+def test_UpdateManager__update_offsets_incrementally_07():
+    """
+    Updates offsets after wrapping container in tuplet.
+    """
+
+    staff = abjad.Staff("c'4 { d'8 e'8 f'8 } g'4")
+    _check(staff)
+    abjad.mutate(staff[1]).wrap(abjad.Tuplet((4, 5), []))
+    _check(staff)
+    assert abjad.inspect(staff[1][0][1]).timespan() == abjad.Timespan(
+        abjad.Offset(7, 20), abjad.Offset(9, 20)
+    )
+
+
+def test_UpdateManager__update_offsets_incrementally_08():
+    """
+    Updates offsets of nested container after change to tuplet multiplier.
+    """
+
+    staff = abjad.Staff(r"c'4 \times 2/3 { { d'8 e'8 } f'8 } g'4")
+    _check(staff)
+    staff[1].multiplier = abjad.Multiplier(4, 5)
+    _check(staff)
+    assert abjad.inspect(staff[1][0][1]).timespan() == abjad.Timespan(
+        abjad.Offset(7, 20), abjad.Offset(9, 20)
+    )
+
+
+def test_UpdateManager__update_offsets_incrementally_09():
+    """
+    Updates offsets after moving container into tuplet.
+    """
+
+    staff = abjad.Staff(r"c'4 { d'8 e'8 } \times 2/3 { f'8 }")
+    _check(staff)
+    container = staff[1]
+    staff[2].insert(0, container)
+    _check(staff)
+    assert abjad.inspect(staff[1][0][1]).timespan() == abjad.Timespan(
+        abjad.Offset(1, 3), abjad.Offset(5, 12)
+    )
@@ -0,0 +1,96 @@
+import abjad
+import pytest
+
+
+def _attach_one_at_a_time(pairs):
+    for attachable, target in pairs:
+        abjad.attach(attachable, target)
+
+
+def _get_error_message(function, pairs):
+    with pytest.raises(abjad.PersistentIndicatorError) as info:
+        function(pairs)
+    return str(info.value)
+
+
+def test_attach_many_01():
+    """
+    Attaches dynamics and clefs to the same leaves as abjad.attach().
+    """
+
+    staff_1 = abjad.Staff("c'8 d'8 e'8 f'8 g'8 a'8 b'8 c''8")
+    staff_2 = abjad.Staff("c'8 d'8 e'8 f'8 g'8 a'8 b'8 c''8")
+    strings = ["p", "mp", "mf", "f"]
+    for staff, function in (
+        (staff_1, _attach_one_at_a_time),
+        (staff_2, abjad.attach_many),
+    ):
+        pairs = [(abjad.Dynamic(_), __) for _, __ in zip(strings, staff[::2])]
+        pairs.append((abjad.Clef("bass"), staff[4]))
+        function(pairs)
+
+    assert format(staff_1) == format(staff_2)
+    for leaf_1, leaf_2 in zip(staff_1, staff_2):
+        dynamic_1 = abjad.inspect(leaf_1).effective(abjad.Dynamic)
+        dynamic_2 = abjad.inspect(leaf_2).effective(abjad.Dynamic)
+        assert dynamic_1 == dynamic_2
+
+
+def test_attach_many_02():
+    """
+    Raises the same persistent indicator error as abjad.attach().
+    """
+
+    messages = []
+    for function in (_attach_one_at_a_time, abjad.attach_many):
+        staff = abjad.Staff("c'4 d'4 e'4 f'4")
+        abjad.attach(abjad.Clef("treble"), staff[0])
+        pairs = [
+            (abjad.Clef("alto"), staff[2]),
+            (abjad.Clef("bass"), staff[2]),
+            (abjad.Clef("tenor"), staff[2]),
+        ]
+        messages.append(_get_error_message(function, pairs))
+        assert abjad.inspect(staff[2]).indicators(abjad.Clef) == [
+            abjad.Clef("alto")
+        ]
+
+    assert messages[0] == messages[1]
+    assert "Clef('alto')" in messages[1]
+    assert "Clef('bass')" in messages[1]
+
+
+def test_attach_many_03():
+    """
+    Raises the same persistent indicator error as abjad.attach() when
+    duplicate indicators attach to simultaneous leaves in different voices.
+    """
+
+    messages = []
+    for function in (_attach_one_at_a_time, abjad.attach_many):
+        voice_1 = abjad.Voice("c'4 d'4", name="Voice_1")
+        voice_2 = abjad.Voice("e'4 f'4", name="Voice_2")
+        abjad.Staff([voice_1, voice_2], simultaneous=True)
+        pairs = [
+            (abjad.Clef("alto"), voice_1[1]),
+            (abjad.Clef("treble"), voice_2[1]),
+        ]
+        messages.append(_get_error_message(function, pairs))
+        assert abjad.inspect(voice_2[1]).indicators(abjad.Clef) == []
+
+    assert messages[0] == messages[1]
+
+
+def test_attach_many_04():
+    """
+    Allows competing indicators when only one indicator is active.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    pairs = [(abjad.Clef("treble"), staff[0]), (abjad.Clef("alto"), staff[0])]
+    abjad.attach_many(pairs[:1])
+    abjad.attach_many(pairs[1:], deactivate=True, tag="+PARTS")
+
+    assert abjad.inspect(staff[-1]).effective(abjad.Clef) == abjad.Clef(
+        "treble"
+    )
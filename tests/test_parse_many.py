@@ -0,0 +1,41 @@
+import abjad
+
+
+def test_parse_many_01():
+    """
+    Yields results in input order in worker processes; yields exceptions in
+    place of components for strings that do not parse.
+    """
+
+    pitches = ["c'", "d'", "e'", "f'"]
+    strings = [f"{{ {pitches[i % 4]}{2 ** (i % 5)} }}" for i in range(70)]
+    strings[33] = "{ c'4 x'4 }"
+    results = list(abjad.parse_many(strings, workers=2))
+
+    assert len(results) == 70
+    for i, (string, result) in enumerate(zip(strings, results)):
+        if i == 33:
+            assert isinstance(result, abjad.LilyPondParserError)
+            continue
+        assert isinstance(result, abjad.Container)
+        assert format(result) == format(abjad.parse(string))
+
+
+def test_parse_many_02():
+    """
+    Consumes strings lazily.
+    """
+
+    consumed = []
+
+    def generate_strings():
+        for string in ("{ c'4 }", "{ d'4 }", "{ e'4 }"):
+            consumed.append(string)
+            yield string
+
+    results = abjad.parse_many(generate_strings(), language="nederlands")
+    assert consumed == []
+    container = next(results)
+    assert format(container) == format(abjad.Container("c'4"))
+    assert consumed == ["{ c'4 }"]
+    assert len(list(results)) == 2